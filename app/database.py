@@ -2,12 +2,14 @@
 Configuration et connexion à la base de données SQLite.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.schema import CreateIndex
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Generator, List
 import os
 
 from app.models import Base
@@ -25,21 +27,104 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 DATABASE_URL = f"sqlite:///{DATA_DIR}/vhf-balise.db"
 
-# Créer le moteur SQLite avec connection pooling approprié
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=NullPool,  # Pas de pool pour éviter les conflits multi-threads
-    echo=False,  # True pour debug SQL
-)
+# Pragmas appliqués à chaque nouvelle connexion. WAL : les lectures (web)
+# ne bloquent plus l'écriture du runner et inversement ; un seul écrivain à
+# la fois, les autres attendent jusqu'à busy_timeout au lieu d'échouer.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",  # Sûr en WAL : seul le dernier commit peut être perdu
+    "busy_timeout": 5000,  # ms
+    "mmap_size": 64 * 1024 * 1024,  # octets
+    "cache_size": -8000,  # Négatif = Kio (8 Mo)
+}
+
+# Base neuve uniquement (avant WAL et la première table, sinon sans effet) :
+# les pages libérées par l'archivage de l'historique sont rendues au disque
+NEW_DB_AUTO_VACUUM = "INCREMENTAL"
+
+# Pool de connexions (par processus) : pool_size connexions gardées ouvertes,
+# jusqu'à max_overflow en plus sous charge
+POOL_SIZE = 5
+POOL_MAX_OVERFLOW = 10
+
+# Index remplacés dans le modèle, supprimés des bases existantes au démarrage
+OBSOLETE_INDEXES = ["idx_tx_history_status_planned"]
+
+# Lignes examinées par index lors de l'ANALYZE de démarrage
+ANALYSIS_LIMIT = 1000
+
+
+def _apply_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        if cursor.execute("PRAGMA page_count").fetchone()[0] == 0:
+            cursor.execute(f"PRAGMA auto_vacuum={NEW_DB_AUTO_VACUUM}")
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def create_db_engine(url: str) -> Engine:
+    """Crée un moteur SQLite : pool thread-safe et pragmas à la connexion."""
+    db_engine = create_engine(
+        url,
+        # Connexions partagées entre threads (pool, asyncio.to_thread)
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=POOL_MAX_OVERFLOW,
+        echo=False,  # True pour debug SQL
+    )
+    event.listen(db_engine, "connect", _apply_pragmas)
+    return db_engine
+
+
+engine = create_db_engine(DATABASE_URL)
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def migrate_db(bind: Engine) -> List[str]:
+    """
+    Met à niveau les index d'une base existante et leurs statistiques.
+
+    create_all ne crée les index qu'avec leur table : ceux ajoutés au modèle
+    depuis sont créés ici, ceux remplacés (OBSOLETE_INDEXES) supprimés.
+    Idempotent, sans risque si le web et le runner démarrent ensemble.
+
+    Returns:
+        Noms des index créés
+    """
+    inspector = inspect(bind)
+    created = []
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+                    created.append(index.name)
+        for name in OBSOLETE_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+        # Statistiques du planificateur (sans elles, SQLite ignore l'index
+        # partiel des TX PENDING) : échantillonnées, rapides même sur un
+        # historique de plusieurs millions de lignes
+        conn.execute(text(f"PRAGMA analysis_limit={ANALYSIS_LIMIT}"))
+        conn.execute(text("ANALYZE"))
+    return created
+
+
 def init_db():
-    """Initialise la base de données (crée toutes les tables)."""
+    """Initialise la base de données (crée les tables, met à niveau les index)."""
     Base.metadata.create_all(bind=engine)
+    created = migrate_db(engine)
+    if created:
+        print(f"✓ Index créés : {', '.join(created)}")
     print(f"✓ Base de données initialisée : {DATABASE_URL}")
 
 
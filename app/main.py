@@ -20,6 +20,7 @@ from app.routers import (
     tx_history,
     settings,
     users,
+    radios,
 )
 
 # Créer l'application
@@ -62,6 +63,7 @@ app.include_router(tts.router, prefix="/api/tts", tags=["TTS"])
 app.include_router(tx_history.router, prefix="/api/tx", tags=["Historique TX"])
 app.include_router(settings.router, prefix="/api/settings", tags=["Paramètres"])
 app.include_router(users.router, prefix="/api/users", tags=["Utilisateurs"])
+app.include_router(radios.router, prefix="/api/radios", tags=["Radios"])
 
 # Servir les fichiers statiques du frontend
 frontend_path = Path(__file__).parent.parent / "frontend"
@@ -17,6 +17,7 @@ from sqlalchemy import (
     UniqueConstraint,
     Index,
     JSON,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -137,6 +138,25 @@ class SystemSettings(Base):
     tx_timeout_seconds = Column(Integer, default=30, nullable=False)  # Verrouillé à 30
 
 
+class Radio(Base):
+    """Radio supplémentaire (PTT + sortie audio) desservant une fréquence.
+
+    Les canaux dont frequency_mhz correspond sont émis sur cette radio ; les
+    autres utilisent la radio par défaut (PTT de SystemSettings).
+    """
+
+    __tablename__ = "radios"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), unique=True, nullable=False)
+    frequency_mhz = Column(Float, unique=True, nullable=False)
+    ptt_gpio_pin = Column(Integer, nullable=True)  # None = mode mock
+    ptt_active_level = Column(Integer, default=1, nullable=False)  # 1=HIGH, 0=LOW
+    audio_device = Column(String(100), nullable=True)  # Ex: "plughw:1,0"
+    is_enabled = Column(Boolean, default=True, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 class TxHistory(Base):
     """Historique des transmissions (scheduled + manual tests)."""
 
@@ -163,19 +183,35 @@ class TxHistory(Base):
     measurement_at = Column(DateTime, nullable=False, index=True)
     offset_seconds = Column(Integer, nullable=False)
     planned_at = Column(DateTime, nullable=False)
-    sent_at = Column(DateTime, nullable=True)
+    sent_at = Column(DateTime, nullable=True, index=True)  # Dernières TX
 
     # Contenu
     rendered_text = Column(Text, nullable=False)
     audio_path = Column(String(500), nullable=True)
     error_message = Column(Text, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Indexé : statistiques récentes et rétention (archivage par date)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
     # Relation
     channel = relationship("Channel", back_populates="tx_history")
 
-    __table_args__ = (Index("idx_tx_history_status_planned", "status", "planned_at"),)
+    __table_args__ = (
+        # TX d'un canal par statut, dans l'ordre chronologique (annulations)
+        Index(
+            "idx_tx_history_channel_status_planned",
+            "channel_id",
+            "status",
+            "planned_at",
+        ),
+        # TX PENDING par échéance : index partiel, sa taille ne dépend pas de
+        # l'historique accumulé (remplace idx_tx_history_status_planned)
+        Index(
+            "idx_tx_history_pending",
+            "planned_at",
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+    )
 
 
 class AudioCache(Base):
@@ -192,6 +228,20 @@ class AudioCache(Base):
     meta_json = Column(JSON, nullable=True)  # engine_id, voice_id, text preview, etc.
 
 
+class AudioCacheStats(Base):
+    """Compteurs cumulés du cache audio, tous processus (row unique id=1).
+
+    Indépendants des entrées d'AudioCache : une entrée évincée par le GC
+    puis resynthétisée compte bien un miss de plus.
+    """
+
+    __tablename__ = "audio_cache_stats"
+
+    id = Column(Integer, primary_key=True, default=1)
+    hits = Column(Integer, default=0, nullable=False)
+    misses = Column(Integer, default=0, nullable=False)
+
+
 class AuditLog(Base):
     """Journal d'audit des actions administrateur."""
 
@@ -5,9 +5,11 @@ Tous les providers doivent implémenter cette interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Dict, List
 from datetime import datetime
 from dataclasses import dataclass
+import httpx
 
 
 @dataclass
@@ -123,6 +125,12 @@ class StationInfo:
 class WeatherProvider(ABC):
     """Interface abstraite pour tous les providers météo."""
 
+    # Timeout global d'un fetch bulk lors du polling runner (secondes)
+    poll_timeout_seconds: float = 30.0
+
+    # Client HTTP partagé (pool keep-alive géré par ProviderManager)
+    _http_client: Optional[httpx.AsyncClient] = None
+
     @property
     @abstractmethod
     def provider_id(self) -> str:
@@ -191,3 +199,35 @@ class WeatherProvider(ABC):
             credentials: Dictionnaire d'identifiants (ex: {"api_key": "..."})
         """
         pass
+
+    def get_transfer_stats(self) -> Dict[str, dict]:
+        """
+        Compteurs de trafic HTTP du provider (par endpoint).
+
+        Returns:
+            Dictionnaire {endpoint: compteurs}, vide si non suivi
+        """
+        return {}
+
+    def set_http_client(self, client: Optional[httpx.AsyncClient]):
+        """
+        Attache un client HTTP partagé (ou le détache avec None).
+
+        Args:
+            client: Client httpx longue durée, possédé par ProviderManager
+        """
+        self._http_client = client
+
+    @asynccontextmanager
+    async def _client(self, **kwargs) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Fournit le client HTTP partagé, ou un client éphémère à défaut.
+
+        Args:
+            **kwargs: Options du client éphémère (timeout, follow_redirects...)
+        """
+        if self._http_client is not None and not self._http_client.is_closed:
+            yield self._http_client
+        else:
+            async with httpx.AsyncClient(**kwargs) as client:
+                yield client
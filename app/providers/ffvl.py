@@ -4,7 +4,10 @@ Provider FFVL (Fédération Française de Vol Libre).
 API balisemeteo.com - requiert une clé API.
 """
 
+import asyncio
+import logging
 import re
+import time
 from datetime import datetime
 from typing import Optional, Dict, List
 from urllib.parse import urlparse, parse_qs
@@ -14,13 +17,41 @@ import pytz
 from app.providers import WeatherProvider, Measurement, StationInfo
 from app.exceptions import ValidationError, ProviderError
 
+logger = logging.getLogger(__name__)
+
+
+class _RateLimiter:
+    """Espace les requêtes d'au moins `min_interval` secondes."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next_slot = 0.0
+
+    async def wait(self):
+        """Attend le prochain créneau disponible."""
+        # Réservation sans await : atomique dans la boucle asyncio
+        now = time.monotonic()
+        delay = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + self.min_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 
 class FFVLProvider(WeatherProvider):
     """Provider pour les balises FFVL."""
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 4, min_request_interval: float = 0.05):
+        """
+        Initialise le provider FFVL.
+
+        Args:
+            max_concurrency: Nombre max de requêtes simultanées en bulk
+            min_request_interval: Délai min entre deux requêtes (s), politesse API
+        """
         self._api_key: Optional[str] = None
         self._base_url = "https://data.ffvl.fr/api"
+        self.max_concurrency = max_concurrency
+        self._rate_limiter = _RateLimiter(min_request_interval)
 
     @property
     def provider_id(self) -> str:
@@ -132,24 +163,30 @@ class FFVLProvider(WeatherProvider):
         if not self._api_key:
             raise ProviderError("Clé API FFVL non configurée")
 
+        async with self._client(timeout=10.0, follow_redirects=True) as client:
+            return await self._fetch_with_client(client, station_id)
+
+    async def _fetch_with_client(
+        self, client: httpx.AsyncClient, station_id: str
+    ) -> Optional[Measurement]:
+        """Récupère la dernière mesure d'une station avec un client HTTP donné."""
         # L'API FFVL: https://data.ffvl.fr/api?base=balises&r=histo&idbalise=XXX&mode=json&key=...
         url = f"{self._base_url}?base=balises&r=histo&idbalise={station_id}&mode=json&key={self._api_key}"
 
         try:
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                response = await client.get(url)
+            response = await client.get(url, timeout=10.0)
 
-                if response.status_code == 404:
-                    return None  # Station non trouvée
+            if response.status_code == 404:
+                return None  # Station non trouvée
 
-                response.raise_for_status()
-                data = response.json()
+            response.raise_for_status()
+            data = response.json()
 
-                # Si pas de données, retourner None (station sans mesures récentes)
-                if not isinstance(data, list) or len(data) == 0:
-                    return None
+            # Si pas de données, retourner None (station sans mesures récentes)
+            if not isinstance(data, list) or len(data) == 0:
+                return None
 
-                return self._parse_measurement(data, station_id)
+            return self._parse_measurement(data, station_id)
 
         except httpx.HTTPError as e:
             raise ProviderError(
@@ -164,16 +201,32 @@ class FFVLProvider(WeatherProvider):
         """
         Récupère les mesures pour plusieurs stations.
 
-        FFVL ne semble pas avoir d'endpoint bulk, donc on fait des appels individuels.
+        FFVL n'a pas d'endpoint bulk : les appels individuels sont faits en
+        parallèle (au plus max_concurrency à la fois, espacés par le rate
+        limiter) sur le client HTTP partagé du provider. Une erreur sur une station
+        n'affecte pas les résultats des autres.
         """
-        results = {}
-        for station_id in station_ids:
-            try:
-                results[station_id] = await self.fetch_measurement(station_id)
-            except Exception as e:
-                # En cas d'erreur sur une station, continuer avec les autres
-                results[station_id] = None
-        return results
+        if not self._api_key:
+            raise ProviderError("Clé API FFVL non configurée")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_one(client: httpx.AsyncClient, station_id: str):
+            async with semaphore:
+                await self._rate_limiter.wait()
+                try:
+                    return station_id, await self._fetch_with_client(client, station_id)
+                except Exception as e:
+                    # En cas d'erreur sur une station, continuer avec les autres
+                    logger.warning(f"Erreur FFVL station {station_id}: {e}")
+                    return station_id, None
+
+        async with self._client(timeout=10.0, follow_redirects=True) as client:
+            results = await asyncio.gather(
+                *(fetch_one(client, station_id) for station_id in station_ids)
+            )
+
+        return dict(results)
 
     def _parse_measurement(self, data: list, station_id: str) -> Optional[Measurement]:
         """
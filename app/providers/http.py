@@ -0,0 +1,231 @@
+"""
+Clients HTTP partagés pour les providers.
+
+Un client httpx longue durée par provider : connexions keep-alive réutilisées
+(pas de handshake TCP/TLS à chaque poll), HTTP/2 si le paquet `h2` est
+installé, et cache DNS pour éviter une résolution à chaque reconnexion.
+"""
+
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Durée de validité d'une résolution DNS en cache (secondes)
+DNS_CACHE_TTL_SECONDS = 300
+
+# Durée de conservation d'une connexion inactive dans le pool (secondes)
+KEEPALIVE_EXPIRY_SECONDS = 120
+
+
+def brotli_available() -> bool:
+    """Indique si le décodage brotli (paquet brotli/brotlicffi) est installé."""
+    for module in ("brotli", "brotlicffi"):
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+def accept_encoding() -> str:
+    """En-tête Accept-Encoding limité aux encodages décodables par httpx."""
+    return "br, gzip, deflate" if brotli_available() else "gzip, deflate"
+
+
+@dataclass
+class TransferStats:
+    """Compteurs de trafic HTTP d'un endpoint (volume réseau, cache)."""
+
+    requests: int = 0
+    not_modified: int = 0
+    bytes_on_wire: int = 0
+    bytes_decoded: int = 0
+
+    def record(self, response: httpx.Response, bytes_decoded: Optional[int] = None):
+        """
+        Comptabilise une réponse.
+
+        Args:
+            response: Réponse httpx (corps déjà lu ou consommé en streaming)
+            bytes_decoded: Taille décompressée, si le corps a été streamé
+        """
+        self.requests += 1
+        if response.status_code == 304:
+            self.not_modified += 1
+        self.bytes_on_wire += response.num_bytes_downloaded
+        if bytes_decoded is None:
+            bytes_decoded = len(response.content)
+        self.bytes_decoded += bytes_decoded
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Part des requêtes servies par le cache (réponse 304)."""
+        return self.not_modified / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict:
+        """Convertit en dictionnaire."""
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "cache_hit_ratio": round(self.cache_hit_ratio, 3),
+            "bytes_on_wire": self.bytes_on_wire,
+            "bytes_decoded": self.bytes_decoded,
+        }
+
+
+def http2_available() -> bool:
+    """Indique si le support HTTP/2 (paquet h2) est installé."""
+    try:
+        import h2  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """Backend réseau httpcore qui met en cache les résolutions DNS."""
+
+    def __init__(
+        self,
+        backend: Optional[httpcore.AsyncNetworkBackend] = None,
+        ttl_seconds: float = DNS_CACHE_TTL_SECONDS,
+    ):
+        self._backend = backend or httpcore.AnyIOBackend()
+        self._ttl = ttl_seconds
+        self._cache: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+
+    async def _resolve(self, host: str, port: int) -> List[str]:
+        """Résout un nom d'hôte (depuis le cache si encore valide)."""
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+
+        cached = self._cache.get((host, port))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._cache[(host, port)] = (time.monotonic() + self._ttl, addresses)
+        return addresses
+
+    def invalidate(self, host: Optional[str] = None):
+        """Vide le cache DNS (entièrement ou pour un hôte)."""
+        if host is None:
+            self._cache.clear()
+        else:
+            for key in [key for key in self._cache if key[0] == host]:
+                del self._cache[key]
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options=None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Connexion TCP sur l'adresse résolue (SNI/Host restent sur le nom)."""
+        last_error: Optional[Exception] = None
+        for address in await self._resolve(host, port):
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+
+        # Toutes les adresses ont échoué : l'entrée est peut-être obsolète
+        self.invalidate(host)
+        raise last_error or httpcore.ConnectError(f"Aucune adresse pour {host}")
+
+    async def connect_unix_socket(
+        self, path: str, timeout: Optional[float] = None, socket_options=None
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+def _install_dns_cache(transport: httpx.AsyncHTTPTransport) -> bool:
+    """
+    Branche CachingDNSBackend sur le pool httpcore du transport.
+
+    httpx n'expose pas le backend réseau : on remplace l'attribut privé
+    `_pool._network_backend` (httpcore épinglé dans requirements.txt). S'il
+    n'existe plus, le client fonctionne sans cache DNS.
+
+    Returns:
+        True si le cache DNS est actif
+    """
+    pool = getattr(transport, "_pool", None)
+    if not isinstance(
+        getattr(pool, "_network_backend", None), httpcore.AsyncNetworkBackend
+    ):
+        logger.warning(
+            f"Cache DNS désactivé : backend réseau introuvable dans "
+            f"httpcore {httpcore.__version__}"
+        )
+        return False
+
+    pool._network_backend = CachingDNSBackend()
+    return True
+
+
+def create_http_client(
+    http2: bool = True,
+    max_connections: int = 10,
+    max_keepalive_connections: int = 5,
+    timeout: float = 10.0,
+) -> httpx.AsyncClient:
+    """
+    Crée un client HTTP longue durée pour un provider.
+
+    Args:
+        http2: Activer HTTP/2 (ignoré si `h2` n'est pas installé)
+        max_connections: Nombre max de connexions simultanées
+        max_keepalive_connections: Connexions gardées ouvertes au repos
+        timeout: Timeout par défaut des requêtes (s)
+
+    Returns:
+        Client httpx à fermer avec `await client.aclose()`
+    """
+    use_http2 = http2 and http2_available()
+
+    transport = httpx.AsyncHTTPTransport(
+        http2=use_http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        retries=1,
+    )
+
+    _install_dns_cache(transport)
+
+    return httpx.AsyncClient(
+        transport=transport, timeout=timeout, follow_redirects=True
+    )
@@ -4,26 +4,44 @@ Gestionnaire de providers.
 Centralise l'accès aux différents providers météo.
 """
 
+import asyncio
+import logging
+import os
 from typing import Dict, Optional
+import httpx
 from sqlalchemy.orm import Session
 
 from app.providers import WeatherProvider
 from app.providers.ffvl import FFVLProvider
 from app.providers.openwindmap import OpenWindMapProvider
+from app.providers.http import create_http_client
 from app.models import ProviderCredential
 
+logger = logging.getLogger(__name__)
+
+# FFVL n'a pas d'endpoint bulk : une requête par station, au plus
+# VHF_FFVL_MAX_CONCURRENCY à la fois, démarrages espacés d'au moins
+# VHF_FFVL_MIN_REQUEST_INTERVAL secondes. Par défaut 15 stations démarrent en
+# 0.7 s : le polling dure environ une à deux requêtes
+FFVL_MAX_CONCURRENCY = int(os.getenv("VHF_FFVL_MAX_CONCURRENCY", "4"))
+FFVL_MIN_REQUEST_INTERVAL = float(os.getenv("VHF_FFVL_MIN_REQUEST_INTERVAL", "0.05"))
+
 
 class ProviderManager:
     """Gère les providers météo disponibles."""
 
     def __init__(self):
         self._providers: Dict[str, WeatherProvider] = {}
+        self._http_clients: Dict[str, httpx.AsyncClient] = {}
         self._register_providers()
 
     def _register_providers(self):
         """Enregistre tous les providers disponibles."""
         # Provider FFVL
-        self._providers["ffvl"] = FFVLProvider()
+        self._providers["ffvl"] = FFVLProvider(
+            max_concurrency=FFVL_MAX_CONCURRENCY,
+            min_request_interval=FFVL_MIN_REQUEST_INTERVAL,
+        )
 
         # Provider OpenWindMap
         self._providers["openwindmap"] = OpenWindMapProvider()
@@ -56,6 +74,40 @@ class ProviderManager:
             if provider and provider.requires_credentials():
                 provider.set_credentials(cred.credentials_json)
 
+    def open_http_clients(self, http2: bool = True):
+        """
+        Crée un client HTTP longue durée (pool keep-alive) par provider.
+
+        À appeler depuis la boucle asyncio qui effectuera les requêtes
+        (runner). Sans cet appel, les providers utilisent des clients éphémères.
+
+        Args:
+            http2: Activer HTTP/2 si le paquet `h2` est disponible
+        """
+        for provider_id, provider in self._providers.items():
+            if provider_id in self._http_clients:
+                continue
+            client = create_http_client(http2=http2)
+            self._http_clients[provider_id] = client
+            provider.set_http_client(client)
+
+        logger.info(f"Clients HTTP partagés ouverts : {list(self._http_clients)}")
+
+    async def aclose(self):
+        """Ferme proprement les clients HTTP partagés (arrêt du runner)."""
+        for provider in self._providers.values():
+            provider.set_http_client(None)
+
+        clients = list(self._http_clients.values())
+        self._http_clients.clear()
+
+        results = await asyncio.gather(
+            *(client.aclose() for client in clients), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Erreur à la fermeture d'un client HTTP : {result}")
+
 
 # Instance globale du gestionnaire
 provider_manager = ProviderManager()
@@ -4,23 +4,45 @@ Provider OpenWindMap (API Pioupiou).
 API publique sans authentification.
 """
 
+import codecs
+import logging
 import re
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set
 from urllib.parse import urlparse
 from datetime import datetime
 import httpx
 import pytz
 
 from app.providers import WeatherProvider, Measurement, StationInfo
+from app.providers.http import TransferStats, accept_encoding
+from app.providers.pioupiou_feed import LiveFeedParser, LiveSnapshot
 from app.exceptions import ValidationError, ProviderError
 
+logger = logging.getLogger(__name__)
+
 
 class OpenWindMapProvider(WeatherProvider):
     """Provider pour OpenWindMap via l'API Pioupiou."""
 
-    def __init__(self):
+    def __init__(self, keep_snapshot: bool = False):
+        """
+        Initialise le provider OpenWindMap.
+
+        Args:
+            keep_snapshot: Conserver une copie colonnaire de tout /live/all
+                (live_snapshot), pour l'analyse
+        """
         self._api_base = "http://api.pioupiou.fr/v1"
 
+        # Cache conditionnel de /live/all (ETag / Last-Modified)
+        self._live_all_etag: Optional[str] = None
+        self._live_all_last_modified: Optional[str] = None
+        self._live_all_measurements: Optional[Dict[str, Optional[Measurement]]] = None
+        self.live_all_stats = TransferStats()
+
+        self.keep_snapshot = keep_snapshot
+        self.live_snapshot: Optional[LiveSnapshot] = None
+
     @property
     def provider_id(self) -> str:
         return "openwindmap"
@@ -92,8 +114,8 @@ class OpenWindMapProvider(WeatherProvider):
         url = f"{self._api_base}/live/{station_id}"
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url)
+            async with self._client(timeout=10.0) as client:
+                response = await client.get(url, timeout=10.0)
 
                 if response.status_code == 404:
                     return None  # Station non trouvée
@@ -117,37 +139,21 @@ class OpenWindMapProvider(WeatherProvider):
         Récupère les mesures pour plusieurs stations.
 
         Utilise l'endpoint /live/all pour récupérer toutes les stations d'un coup,
-        puis filtre sur les IDs demandés.
+        en ne parsant que les IDs demandés.
         """
-        url = f"{self._api_base}/live/all"
-
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-
-                # Construire un dict station_id -> measurement
-                all_measurements = {}
-                if isinstance(data, dict) and "data" in data:
-                    for station_data in data["data"]:
-                        station_id = str(station_data.get("id", ""))
-                        try:
-                            all_measurements[station_id] = self._parse_measurement(
-                                station_data
-                            )
-                        except:
-                            all_measurements[station_id] = None
+            all_measurements = await self._fetch_live_all(set(station_ids))
 
-                # Filtrer sur les IDs demandés
-                results = {}
-                for station_id in station_ids:
-                    results[station_id] = all_measurements.get(station_id)
+            # Filtrer sur les IDs demandés
+            results = {}
+            for station_id in station_ids:
+                results[station_id] = all_measurements.get(station_id)
 
-                return results
+            return results
 
         except Exception as e:
             # En cas d'erreur bulk, fallback sur des appels individuels
+            logger.warning(f"Échec /live/all ({e}), fallback sur appels individuels")
             results = {}
             for station_id in station_ids:
                 try:
@@ -156,6 +162,99 @@ class OpenWindMapProvider(WeatherProvider):
                     results[station_id] = None
             return results
 
+    def get_transfer_stats(self) -> Dict[str, dict]:
+        """Compteurs de trafic de /live/all (octets, réponses 304)."""
+        return {"live_all": self.live_all_stats.to_dict()}
+
+    async def _fetch_live_all(
+        self, station_ids: Set[str]
+    ) -> Dict[str, Optional[Measurement]]:
+        """
+        Récupère /live/all en streaming, avec requête conditionnelle et compression.
+
+        Le corps est parsé au fil de l'eau (LiveFeedParser) et seules les
+        stations demandées sont converties en Measurement. Si ces stations
+        sont déjà en cache, If-None-Match / If-Modified-Since sont envoyés :
+        sur une réponse 304, le cache est réutilisé sans rien télécharger.
+
+        Args:
+            station_ids: IDs des stations à extraire
+
+        Returns:
+            Dictionnaire {station_id: Measurement ou None} des stations demandées
+        """
+        url = f"{self._api_base}/live/all"
+
+        cached = self._live_all_measurements
+        conditional = cached is not None and station_ids <= cached.keys()
+
+        headers = {"Accept-Encoding": accept_encoding()}
+        if conditional:
+            if self._live_all_etag:
+                headers["If-None-Match"] = self._live_all_etag
+            if self._live_all_last_modified:
+                headers["If-Modified-Since"] = self._live_all_last_modified
+
+        async with self._client(timeout=15.0) as client:
+            async with client.stream(
+                "GET", url, headers=headers, timeout=15.0
+            ) as response:
+                if response.status_code == 304 and conditional:
+                    self.live_all_stats.record(response, bytes_decoded=0)
+                    logger.info("/live/all non modifié (304), réutilisation du cache")
+                    return {
+                        station_id: cached[station_id] for station_id in station_ids
+                    }
+
+                response.raise_for_status()
+
+                parser = LiveFeedParser()
+                text_decoder = codecs.getincrementaldecoder("utf-8")()
+                snapshot = LiveSnapshot() if self.keep_snapshot else None
+                measurements: Dict[str, Optional[Measurement]] = {
+                    station_id: None for station_id in station_ids
+                }
+                bytes_decoded = 0
+
+                def consume(text: str):
+                    for station_data in parser.feed(text):
+                        if snapshot is not None:
+                            snapshot.append(station_data)
+
+                        station_id = str(station_data.get("id", ""))
+                        if station_id not in station_ids:
+                            continue
+                        try:
+                            measurements[station_id] = self._parse_measurement(
+                                station_data
+                            )
+                        except Exception:
+                            measurements[station_id] = None
+
+                async for chunk in response.aiter_bytes():
+                    bytes_decoded += len(chunk)
+                    consume(text_decoder.decode(chunk))
+
+                # Fin du flux : vide le décodeur (séquence UTF-8 tronquée = erreur)
+                consume(text_decoder.decode(b"", final=True))
+                parser.close()
+                self.live_all_stats.record(response, bytes_decoded=bytes_decoded)
+
+        self._live_all_etag = response.headers.get("ETag")
+        self._live_all_last_modified = response.headers.get("Last-Modified")
+        self._live_all_measurements = measurements
+        if snapshot is not None:
+            self.live_snapshot = snapshot
+
+        logger.info(
+            f"/live/all : {parser.count} stations lues, {len(station_ids)} parsées, "
+            f"{response.num_bytes_downloaded} octets reçus "
+            f"({bytes_decoded} décompressés, "
+            f"encodage {response.headers.get('Content-Encoding', 'aucun')})"
+        )
+
+        return measurements
+
     def _parse_measurement(self, data: dict) -> Optional[Measurement]:
         """
         Parse les données brutes de l'API Pioupiou en Measurement normalisé.
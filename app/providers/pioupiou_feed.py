@@ -0,0 +1,174 @@
+"""
+Parsing incrémental du flux Pioupiou /live/all.
+
+Le flux contient des milliers de stations alors que le runner n'en utilise
+qu'une poignée. Plutôt que de charger tout le corps avec response.json(),
+le parser extrait les objets station un par un au fil des chunks reçus :
+la mémoire reste bornée à un chunk + un objet, et seules les stations
+demandées sont converties en Measurement.
+
+LiveSnapshot conserve optionnellement une copie compacte (colonnes array)
+de tout le flux, pour l'analyse, sans créer d'objet Python par station.
+"""
+
+import json
+import math
+import re
+from array import array
+from datetime import datetime
+from typing import Iterator, Optional
+
+from app.exceptions import ProviderError
+
+_DATA_ARRAY_START = re.compile(r'"data"\s*:\s*\[')
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+class LiveFeedParser:
+    """Parser incrémental qui produit les objets du tableau `data` un à un."""
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._in_array = False
+        self._done = False
+        self.count = 0
+
+    def feed(self, text: str) -> Iterator[dict]:
+        """
+        Ajoute un morceau de texte et produit les objets station complets.
+
+        Args:
+            text: Fragment décodé du corps de la réponse
+        """
+        buffer = self._buffer + text
+        pos = 0
+
+        if not self._in_array:
+            match = _DATA_ARRAY_START.search(buffer)
+            if not match:
+                self._buffer = buffer
+                return
+            self._in_array = True
+            pos = match.end()
+
+        while not self._done:
+            pos = _SEPARATORS.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                self._done = True
+                pos += 1
+                break
+
+            try:
+                station, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Objet incomplet : attendre le chunk suivant
+                break
+
+            pos = end
+            self.count += 1
+            if isinstance(station, dict):
+                yield station
+
+        self._buffer = buffer[pos:] if not self._done else ""
+
+    def close(self):
+        """
+        Vérifie que le tableau `data` a été entièrement lu.
+
+        Raises:
+            ProviderError si le flux est tronqué ou invalide
+        """
+        if not self._done:
+            raise ProviderError(
+                f"Flux /live/all incomplet ou invalide "
+                f"({self.count} stations lues, reste {len(self._buffer)} caractères)"
+            )
+
+
+class LiveSnapshot:
+    """Copie colonne par colonne (arrays compacts) de toutes les stations."""
+
+    __slots__ = (
+        "station_ids",
+        "measured_at",
+        "wind_avg",
+        "wind_max",
+        "wind_min",
+        "wind_heading",
+    )
+
+    def __init__(self):
+        self.station_ids = array("q")
+        self.measured_at = array("d")  # Timestamp UNIX, NaN si absent
+        self.wind_avg = array("d")
+        self.wind_max = array("d")
+        self.wind_min = array("d")
+        self.wind_heading = array("d")
+
+    def __len__(self) -> int:
+        return len(self.station_ids)
+
+    @staticmethod
+    def _float(value) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return math.nan
+
+    def append(self, station: dict):
+        """Ajoute une station brute du flux (ignorée si sans id entier)."""
+        try:
+            station_id = int(station.get("id"))
+        except (TypeError, ValueError):
+            return
+
+        measurements = station.get("measurements") or {}
+        date_str = measurements.get("date") or station.get("date")
+        measured_at = math.nan
+        if date_str:
+            try:
+                measured_at = datetime.fromisoformat(
+                    date_str.replace("Z", "+00:00")
+                ).timestamp()
+            except ValueError:
+                pass
+
+        self.station_ids.append(station_id)
+        self.measured_at.append(measured_at)
+        self.wind_avg.append(self._float(measurements.get("wind_speed_avg")))
+        self.wind_max.append(self._float(measurements.get("wind_speed_max")))
+        self.wind_min.append(self._float(measurements.get("wind_speed_min")))
+        self.wind_heading.append(self._float(measurements.get("wind_heading")))
+
+    def row(self, station_id: int) -> Optional[dict]:
+        """Retourne les valeurs d'une station (recherche linéaire), ou None."""
+        try:
+            index = self.station_ids.index(int(station_id))
+        except ValueError:
+            return None
+
+        return {
+            "id": self.station_ids[index],
+            "measured_at": self.measured_at[index],
+            "wind_avg": self.wind_avg[index],
+            "wind_max": self.wind_max[index],
+            "wind_min": self.wind_min[index],
+            "wind_heading": self.wind_heading[index],
+        }
+
+    def nbytes(self) -> int:
+        """Taille mémoire des colonnes (octets)."""
+        return sum(
+            len(column) * column.itemsize
+            for column in (
+                self.station_ids,
+                self.measured_at,
+                self.wind_avg,
+                self.wind_max,
+                self.wind_min,
+                self.wind_heading,
+            )
+        )
@@ -1,11 +1,14 @@
 """
 Contrôleur PTT (Push-To-Talk).
 
-Gère le contrôle du PTT via GPIO (Raspberry Pi) ou mode mock (développement).
+Gère le contrôle du PTT via GPIO (Raspberry Pi : libgpiod ou RPi.GPIO) ou mode
+mock (développement).
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -97,3 +100,195 @@ class GPIOPTTController(PTTController):
             logger.info("GPIO nettoyé")
         except Exception as e:
             logger.error(f"Erreur lors du nettoyage GPIO: {e}")
+
+
+class GpiodLine:
+    """Ligne GPIO en sortie via libgpiod (/dev/gpiochipN), API v1 ou v2."""
+
+    def __init__(self, chip_path: str, offset: int, consumer: str, level: int):
+        """
+        Réserve la ligne en sortie au niveau initial `level`.
+
+        Raises:
+            ImportError si le paquet gpiod (libgpiod) n'est pas installé
+        """
+        try:
+            import gpiod
+        except ImportError:
+            raise ImportError(
+                "gpiod (libgpiod) non disponible. "
+                "Installez-le avec: pip install gpiod "
+                "(ou apt install python3-libgpiod)."
+            )
+
+        self.offset = offset
+        if hasattr(gpiod, "request_lines"):
+            # libgpiod v2
+            from gpiod.line import Direction, Value
+
+            self._value = {0: Value.INACTIVE, 1: Value.ACTIVE}
+            self._request = gpiod.request_lines(
+                chip_path,
+                consumer=consumer,
+                config={
+                    offset: gpiod.LineSettings(
+                        direction=Direction.OUTPUT, output_value=self._value[level]
+                    )
+                },
+            )
+            self._v2 = True
+        else:
+            # libgpiod v1 (python3-libgpiod de Debian/Raspberry Pi OS)
+            self._chip = gpiod.Chip(chip_path)
+            self._line = self._chip.get_line(offset)
+            self._line.request(
+                consumer=consumer, type=gpiod.LINE_REQ_DIR_OUT, default_vals=[level]
+            )
+            self._v2 = False
+
+    def set_level(self, level: int):
+        if self._v2:
+            self._request.set_value(self.offset, self._value[level])
+        else:
+            self._line.set_value(level)
+
+    def release(self):
+        if self._v2:
+            self._request.release()
+        else:
+            self._line.release()
+            self._chip.close()
+
+
+class MockGpioChip:
+    """Chip GPIO simulée (tests) : enregistre les niveaux écrits par ligne."""
+
+    def __init__(self):
+        self.levels = {}
+        self.released = set()
+
+    def request_output(self, offset: int, consumer: str, level: int):
+        chip = self
+
+        class _Line:
+            def set_level(self, value: int):
+                chip.levels[offset] = value
+
+            def release(self):
+                chip.released.add(offset)
+
+        self.levels[offset] = level
+        return _Line()
+
+
+class GpiodPTTController(PTTController):
+    """Contrôleur PTT via le character device GPIO (libgpiod).
+
+    Fonctionne sur les cartes où RPi.GPIO n'est plus disponible (Pi 5,
+    Raspberry Pi OS récents). Chaque front est horodaté (time.monotonic) :
+    durée de l'écriture GPIO, durée des émissions et taux d'émission.
+    """
+
+    # Nombre de fronts conservés en mémoire
+    MAX_EDGES = 1000
+
+    def __init__(
+        self,
+        pin: int,
+        active_level: int = 1,
+        chip_path: str = "/dev/gpiochip0",
+        chip=None,
+    ):
+        """
+        Initialise la ligne GPIO.
+
+        Args:
+            pin: Numéro de ligne sur la chip (= numéro BCM sur Raspberry Pi)
+            active_level: Niveau actif (1=HIGH, 0=LOW)
+            chip_path: Character device de la chip GPIO
+            chip: Chip à utiliser à la place de chip_path (ex: MockGpioChip)
+        """
+        self.pin = pin
+        self.active_level = active_level
+        self.inactive_level = 1 - active_level
+        self.chip_path = chip_path
+
+        if chip is not None:
+            self._line = chip.request_output(pin, "vhf-balise-ptt", self.inactive_level)
+        else:
+            self._line = GpiodLine(
+                chip_path, pin, "vhf-balise-ptt", self.inactive_level
+            )
+
+        self._state = False
+        # Fronts : (horodatage monotonic, PTT actif, durée de l'écriture en s)
+        self.edges = deque(maxlen=self.MAX_EDGES)
+        self._created_at = time.monotonic()
+
+        logger.info(
+            f"Contrôleur PTT gpiod initialisé ({chip_path}, ligne {pin}, "
+            f"active_level={active_level})"
+        )
+
+    def set_ptt(self, active: bool):
+        """Active ou désactive le PTT ; horodate le front s'il y a changement."""
+        level = self.active_level if active else self.inactive_level
+        start = time.monotonic()
+        self._line.set_level(level)
+        end = time.monotonic()
+
+        if active != self._state:
+            self._state = active
+            self.edges.append((end, active, end - start))
+        logger.debug(
+            f"gpiod ligne {self.pin} -> {'HIGH' if level else 'LOW'} (PTT {'ON' if active else 'OFF'})"
+        )
+
+    def get_edge_stats(self, window_seconds: float = 3600) -> dict:
+        """
+        Statistiques des fronts sur la fenêtre glissante.
+
+        Returns:
+            key_ups, durée max d'écriture GPIO (µs), durée moyenne d'émission (s)
+            et taux d'émission (part du temps PTT actif)
+        """
+        now = time.monotonic()
+        window_start = max(now - window_seconds, self._created_at)
+        edges = [e for e in self.edges if e[0] >= window_start]
+
+        on_time = 0.0
+        keyed_since = None
+        # État au début de la fenêtre : celui du dernier front précédent
+        previous = [e for e in self.edges if e[0] < window_start]
+        if previous and previous[-1][1]:
+            keyed_since = window_start
+
+        durations = []
+        for at, active, _ in edges:
+            if active:
+                keyed_since = at
+            elif keyed_since is not None:
+                on_time += at - keyed_since
+                durations.append(at - keyed_since)
+                keyed_since = None
+        if keyed_since is not None:
+            on_time += now - keyed_since
+
+        span = now - window_start
+        return {
+            "key_ups": sum(1 for _, active, _ in edges if active),
+            "max_write_us": round(max((e[2] for e in edges), default=0.0) * 1e6, 1),
+            "avg_tx_seconds": (
+                round(sum(durations) / len(durations), 3) if durations else 0.0
+            ),
+            "duty_cycle": round(on_time / span, 4) if span > 0 else 0.0,
+        }
+
+    def cleanup(self):
+        """Coupe le PTT et libère la ligne."""
+        try:
+            self.set_ptt(False)
+            self._line.release()
+            logger.info("Ligne gpiod libérée")
+        except Exception as e:
+            logger.error(f"Erreur lors du nettoyage gpiod: {e}")
@@ -0,0 +1,116 @@
+"""
+Watchdog PTT indépendant de la boucle asyncio.
+
+Un thread dédié par contrôleur PTT reçoit l'état d'émission (armé avec une
+échéance au PTT ON, désarmé au PTT OFF) et force le PTT inactif si
+l'échéance est dépassée. Il ne dépend pas de la boucle asyncio du runner :
+une boucle bloquée (commit lent, appel synchrone) ne peut plus laisser la
+radio en émission au-delà de tx_timeout_seconds.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from app.ptt.controller import PTTController
+
+logger = logging.getLogger(__name__)
+
+
+class PTTWatchdog:
+    """Thread de coupure forcée du PTT, avec mesure du temps de réaction."""
+
+    def __init__(self, ptt: PTTController, name: str = "default"):
+        """
+        Args:
+            ptt: Contrôleur à couper en cas de dépassement
+            name: Nom de la radio (logs, nom du thread)
+        """
+        self.ptt = ptt
+        self.name = name
+        self._cond = threading.Condition()
+        self._deadline: Optional[float] = None  # time.monotonic(), None = désarmé
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Métriques
+        self.trips = 0
+        self.last_latency_ms: Optional[float] = None
+        self.max_latency_ms = 0.0
+
+    @property
+    def armed(self) -> bool:
+        return self._deadline is not None
+
+    def _ensure_started(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name=f"ptt-watchdog-{self.name}", daemon=True
+            )
+            self._thread.start()
+
+    def arm(self, timeout_seconds: float):
+        """PTT ON : coupure forcée si disarm() n'arrive pas avant timeout_seconds."""
+        with self._cond:
+            self._ensure_started()
+            self._deadline = time.monotonic() + timeout_seconds
+            self._cond.notify()
+
+    def disarm(self):
+        """PTT OFF normal."""
+        with self._cond:
+            self._deadline = None
+            self._cond.notify()
+
+    def _run(self):
+        with self._cond:
+            while not self._stopped:
+                if self._deadline is None:
+                    self._cond.wait()
+                    continue
+
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+
+                # Échéance dépassée, toujours armé : couper
+                deadline, self._deadline = self._deadline, None
+                self._trip(deadline)
+
+    def _trip(self, deadline: float):
+        """Force le PTT inactif et mesure le retard sur l'échéance."""
+        try:
+            self.ptt.set_ptt(False)
+        except Exception as e:
+            logger.critical(f"WATCHDOG {self.name}: Impossible de forcer PTT OFF: {e}")
+            return
+
+        latency_ms = (time.monotonic() - deadline) * 1000
+        self.trips += 1
+        self.last_latency_ms = round(latency_ms, 2)
+        self.max_latency_ms = max(self.max_latency_ms, self.last_latency_ms)
+        logger.error(
+            f"WATCHDOG {self.name}: timeout atteint, PTT OFF forcé "
+            f"({latency_ms:.1f} ms après l'échéance)"
+        )
+
+    def stop(self):
+        """Arrête le thread (le PTT n'est pas modifié)."""
+        with self._cond:
+            self._stopped = True
+            self._deadline = None
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def get_stats(self) -> dict:
+        """Coupures forcées et temps de réaction (ms après l'échéance)."""
+        return {
+            "trips": self.trips,
+            "last_latency_ms": self.last_latency_ms,
+            "max_latency_ms": self.max_latency_ms,
+        }
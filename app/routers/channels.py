@@ -385,7 +385,7 @@ async def preview_channel(
     Récupère la dernière mesure, rend le template et génère l'audio.
     """
     from app.services.template import TemplateRenderer
-    from app.tts.piper_engine import PiperEngine
+    from app.routers.tts import get_tts_engine
     from app.database import DATA_DIR
     import hashlib
     import shutil
@@ -462,8 +462,8 @@ async def preview_channel(
         was_cached = output_path.exists()
 
         if not was_cached:
-            # Générer l'audio
-            engine = PiperEngine()
+            # Générer l'audio (moteur partagé : voix gardées chargées)
+            engine = get_tts_engine()
             engine.synthesize(rendered_text, channel.voice_id, str(output_path))
 
         return {
@@ -0,0 +1,182 @@
+"""Router de gestion des radios (PTT + sortie audio par fréquence)."""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.dependencies import get_current_user
+from app.models import AuditLog, Radio, SystemSettings
+
+router = APIRouter()
+
+
+class RadioRequest(BaseModel):
+    """Schéma de création d'une radio."""
+
+    name: str = Field(..., min_length=1, max_length=100)
+    frequency_mhz: float = Field(..., gt=0, description="Fréquence desservie (MHz)")
+    ptt_gpio_pin: int | None = Field(
+        None, ge=0, le=40, description="Pin GPIO pour PTT (None = mode mock)"
+    )
+    ptt_active_level: int = Field(
+        1, ge=0, le=1, description="Niveau actif PTT (0=LOW, 1=HIGH)"
+    )
+    audio_device: str | None = Field(
+        None,
+        max_length=100,
+        description="Device ALSA dédié (ex: plughw:1,0), obligatoire",
+    )
+    is_enabled: bool = True
+
+
+class RadioResponse(BaseModel):
+    id: int
+    name: str
+    frequency_mhz: float
+    ptt_gpio_pin: int | None
+    ptt_active_level: int
+    audio_device: str | None
+    is_enabled: bool
+
+
+def _to_response(radio: Radio) -> RadioResponse:
+    return RadioResponse(
+        id=radio.id,
+        name=radio.name,
+        frequency_mhz=radio.frequency_mhz,
+        ptt_gpio_pin=radio.ptt_gpio_pin,
+        ptt_active_level=radio.ptt_active_level,
+        audio_device=radio.audio_device,
+        is_enabled=radio.is_enabled,
+    )
+
+
+def _check_hardware_available(db: Session, request: RadioRequest):
+    """
+    Vérifie que le PTT et la sortie audio ne sont pas déjà utilisés.
+
+    Deux radios sur la même pin GPIO ou le même device ALSA se
+    déclencheraient mutuellement : le runner ne pourrait pas les arbitrer.
+
+    Raises:
+        HTTPException 409 si une autre radio (ou la radio par défaut) les utilise
+    """
+    if request.ptt_gpio_pin is not None:
+        settings = db.query(SystemSettings).filter_by(id=1).first()
+        if settings and settings.ptt_gpio_pin == request.ptt_gpio_pin:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"La pin GPIO {request.ptt_gpio_pin} est déjà utilisée "
+                f"par la radio par défaut",
+            )
+        radio = db.query(Radio).filter_by(ptt_gpio_pin=request.ptt_gpio_pin).first()
+        if radio:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"La pin GPIO {request.ptt_gpio_pin} est déjà utilisée "
+                f"par la radio {radio.name}",
+            )
+
+    if not request.audio_device:
+        # Sans device, la radio jouerait sur la sortie ALSA par défaut, déjà
+        # utilisée par la radio par défaut : deux émissions mélangées
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="La sortie audio par défaut est déjà utilisée par la radio "
+            "par défaut : indiquez un device audio dédié",
+        )
+
+    radio = db.query(Radio).filter_by(audio_device=request.audio_device).first()
+    if radio:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Le device audio {request.audio_device} est déjà utilisé "
+            f"par la radio {radio.name}",
+        )
+
+
+@router.get("/", response_model=list[RadioResponse])
+def list_radios(
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Liste les radios dédiées.
+
+    Les canaux dont la fréquence ne correspond à aucune radio utilisent la
+    radio par défaut (PTT des paramètres système).
+    """
+    return [_to_response(r) for r in db.query(Radio).order_by(Radio.frequency_mhz)]
+
+
+@router.post("/", response_model=RadioResponse, status_code=status.HTTP_201_CREATED)
+def create_radio(
+    request: RadioRequest,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Déclare une radio pour une fréquence.
+
+    Prise en compte au prochain démarrage du runner. Refusée (409) sans device
+    audio dédié, ou si sa pin PTT ou son device audio sont déjà utilisés par
+    une autre radio.
+    """
+    existing = (
+        db.query(Radio)
+        .filter(
+            (Radio.name == request.name)
+            | (Radio.frequency_mhz == request.frequency_mhz)
+        )
+        .first()
+    )
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Une radio utilise déjà ce nom ou cette fréquence ({existing.name})",
+        )
+
+    _check_hardware_available(db, request)
+
+    radio = Radio(**request.model_dump())
+    db.add(radio)
+
+    audit = AuditLog(
+        user_id=current_user.id,
+        action="create_radio",
+        details_json={"name": radio.name, "frequency_mhz": radio.frequency_mhz},
+    )
+    db.add(audit)
+
+    db.commit()
+    db.refresh(radio)
+
+    return _to_response(radio)
+
+
+@router.delete("/{radio_id}")
+def delete_radio(
+    radio_id: int,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Supprime une radio (ses canaux repassent sur la radio par défaut)."""
+    radio = db.query(Radio).filter(Radio.id == radio_id).first()
+    if not radio:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Radio avec l'ID {radio_id} introuvable",
+        )
+
+    audit = AuditLog(
+        user_id=current_user.id,
+        action="delete_radio",
+        details_json={"name": radio.name, "radio_id": radio_id},
+    )
+    db.add(audit)
+
+    db.delete(radio)
+    db.commit()
+
+    return {"message": f"Radio '{radio.name}' supprimée avec succès"}
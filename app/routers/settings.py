@@ -5,7 +5,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import SystemSettings
+from app.models import Radio, SystemSettings
 from app.dependencies import get_current_user
 
 router = APIRouter()
@@ -96,7 +96,19 @@ def update_system_settings(
 
     Returns:
         Paramètres mis à jour
+
+    Raises:
+        HTTPException 409 si la pin PTT est déjà utilisée par une radio dédiée
     """
+    if data.ptt_gpio_pin is not None:
+        radio = db.query(Radio).filter_by(ptt_gpio_pin=data.ptt_gpio_pin).first()
+        if radio:
+            raise HTTPException(
+                status_code=409,
+                detail=f"La pin GPIO {data.ptt_gpio_pin} est déjà utilisée "
+                f"par la radio {radio.name}",
+            )
+
     settings = db.query(SystemSettings).filter_by(id=1).first()
 
     if not settings:
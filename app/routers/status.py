@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func
 from datetime import datetime, timedelta
 import subprocess
 import os
@@ -10,6 +10,7 @@ import pytz
 
 from app.database import get_db
 from app.models import SystemSettings, Channel, ChannelRuntime, TxHistory
+from app.services.runner_stats import read_runner_stats
 
 router = APIRouter()
 
@@ -68,31 +69,36 @@ def get_system_status(db: Session = Depends(get_db)):
     active_channels_count = db.query(Channel).filter_by(is_enabled=True).count()
     total_channels_count = db.query(Channel).count()
 
-    # Stats TX sur 24h
+    # Stats TX sur 24h (agrégées en SQL, par canal et par statut)
     since_24h = datetime.utcnow() - timedelta(hours=24)
-    tx_24h = db.query(TxHistory).filter(TxHistory.created_at >= since_24h).all()
-
-    tx_stats = {
-        "total": len(tx_24h),
-        "sent": sum(1 for tx in tx_24h if tx.status == "SENT"),
-        "failed": sum(1 for tx in tx_24h if tx.status == "FAILED"),
-        "aborted": sum(1 for tx in tx_24h if tx.status == "ABORTED"),
-        "pending": sum(1 for tx in tx_24h if tx.status == "PENDING"),
-    }
+    counts_24h = (
+        db.query(TxHistory.channel_id, TxHistory.status, func.count())
+        .filter(TxHistory.created_at >= since_24h)
+        .group_by(TxHistory.channel_id, TxHistory.status)
+        .all()
+    )
+
+    tx_stats = {"total": 0, "sent": 0, "failed": 0, "aborted": 0, "pending": 0}
+    channel_counts = {}
+    for channel_id, status, count in counts_24h:
+        tx_stats["total"] += count
+        if status.lower() in tx_stats:
+            tx_stats[status.lower()] += count
+        channel_counts[channel_id] = channel_counts.get(channel_id, 0) + count
 
     # TX par canal (dernières 24h)
     channels_stats = []
     channels = db.query(Channel).all()
+    runtimes = {runtime.channel_id: runtime for runtime in db.query(ChannelRuntime)}
     for channel in channels:
-        channel_tx = [tx for tx in tx_24h if tx.channel_id == channel.id]
-        runtime = db.query(ChannelRuntime).filter_by(channel_id=channel.id).first()
+        runtime = runtimes.get(channel.id)
 
         channels_stats.append(
             {
                 "id": channel.id,
                 "name": channel.name,
                 "is_enabled": channel.is_enabled,
-                "tx_count_24h": len(channel_tx),
+                "tx_count_24h": channel_counts.get(channel.id, 0),
                 "last_measurement_at": format_utc_datetime(runtime.last_measurement_at)
                 if runtime and runtime.last_measurement_at
                 else None,
@@ -103,16 +109,21 @@ def get_system_status(db: Session = Depends(get_db)):
             }
         )
 
-    # Dernières TX (10 plus récentes)
-    recent_tx = db.query(TxHistory).order_by(desc(TxHistory.sent_at)).limit(10).all()
+    # Dernières TX (10 plus récentes, index sur sent_at)
+    recent_tx = (
+        db.query(TxHistory, Channel.name)
+        .outerjoin(Channel, TxHistory.channel_id == Channel.id)
+        .order_by(desc(TxHistory.sent_at))
+        .limit(10)
+        .all()
+    )
 
     recent_tx_list = []
-    for tx in recent_tx:
-        channel = db.query(Channel).filter_by(id=tx.channel_id).first()
+    for tx, channel_name in recent_tx:
         recent_tx_list.append(
             {
                 "id": tx.id,
-                "channel_name": channel.name if channel else "Canal supprimé",
+                "channel_name": channel_name or "Canal supprimé",
                 "status": tx.status,
                 "mode": tx.mode,
                 "created_at": format_utc_datetime(tx.created_at),
@@ -131,6 +142,8 @@ def get_system_status(db: Session = Depends(get_db)):
         "tx_stats_24h": tx_stats,
         "channels_stats": channels_stats,
         "recent_tx": recent_tx_list,
+        # Métriques publiées par le runner (verrou TX, watchdog, fronts GPIO par radio), None si absent
+        "runner_stats": read_runner_stats(),
     }
 
 
@@ -5,13 +5,15 @@ Routes pour la synthèse vocale (TTS).
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 from typing import List
 import hashlib
 import wave
 
 from app.dependencies import get_current_user
 from app.tts.piper_engine import PiperEngine
-from app.database import DATA_DIR
+from app.tts.cache import TTSCacheService
+from app.database import DATA_DIR, get_db
 
 router = APIRouter(tags=["tts"])
 
@@ -130,6 +132,25 @@ async def synthesize_text(
         raise HTTPException(status_code=500, detail=f"Erreur de synthèse: {str(e)}")
 
 
+@router.get("/cache/stats")
+def get_cache_stats(
+    db: Session = Depends(get_db), current_user=Depends(get_current_user)
+):
+    """
+    Statistiques du cache audio TTS.
+
+    Hits et misses sont cumulés en base par tous les processus (runner,
+    web) et survivent à l'éviction des entrées par le GC.
+    """
+    stats = TTSCacheService().get_stats(db)
+    return {
+        "entries": stats["entries"],
+        "total_size_bytes": stats["total_size_bytes"],
+        "hits": stats["total_hits"],
+        "misses": stats["total_misses"],
+    }
+
+
 @router.get("/audio/{filename}")
 async def serve_audio(filename: str):
     """
@@ -1,12 +1,13 @@
 """
 Router pour l'historique des transmissions.
 
-Endpoints pour consulter et filtrer l'historique des émissions.
+Endpoints pour consulter et filtrer l'historique des émissions, y compris
+la partie archivée (au-delà de la durée de rétention en base).
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional, List
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, and_
 
@@ -14,6 +15,7 @@ from app.database import get_db
 from app.models import TxHistory, Channel
 from app.dependencies import get_current_user
 from app.routers.status import format_utc_datetime
+from app.services.retention import ARCHIVED_TABLES, HistoryArchiver
 
 router = APIRouter()
 
@@ -205,3 +207,58 @@ def delete_tx_record(
     db.commit()
 
     return {"message": "Enregistrement supprimé"}
+
+
+@router.get("/archive")
+def get_archive_ranges(current_user=Depends(get_current_user)):
+    """
+    Liste les périodes archivées (hors base) par table.
+
+    Returns:
+        Premier et dernier jour archivés, nombre de jours et taille par table
+    """
+    return HistoryArchiver().list_ranges()
+
+
+@router.get("/archive/{table}")
+def get_archived_rows(
+    table: str,
+    start_date: date = Query(..., description="Premier jour (AAAA-MM-JJ)"),
+    end_date: date = Query(..., description="Dernier jour inclus (AAAA-MM-JJ)"),
+    channel_id: Optional[int] = Query(None, description="Filtrer par canal"),
+    status: Optional[str] = Query(None, description="Filtrer par statut"),
+    limit: int = Query(100, ge=1, le=1000, description="Nombre de résultats"),
+    current_user=Depends(get_current_user),
+):
+    """
+    Lit les lignes archivées d'une table sur une période.
+
+    Args:
+        table: tx_history ou audit_log
+        start_date: Premier jour
+        end_date: Dernier jour (inclus)
+        channel_id: Filtrer par canal (tx_history)
+        status: Filtrer par statut (tx_history)
+        limit: Nombre max de lignes
+
+    Returns:
+        Lignes archivées dans l'ordre chronologique
+    """
+    if table not in ARCHIVED_TABLES:
+        raise HTTPException(status_code=404, detail=f"Table non archivée : {table}")
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=400, detail="end_date doit être postérieure à start_date"
+        )
+
+    filters = {"channel_id": channel_id, "status": status.upper() if status else None}
+    results = HistoryArchiver().query(table, start_date, end_date, filters, limit)
+
+    return {
+        "table": table,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "count": len(results),
+        "limit": limit,
+        "results": results,
+    }
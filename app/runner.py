@@ -5,26 +5,46 @@ Polling des providers, détection de nouvelles mesures, planification et exécut
 """
 
 import asyncio
+from contextlib import contextmanager
 import logging
 import sys
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 import random
+import time
+import wave
 
-from sqlalchemy.orm import Session
+from sqlalchemy import event, insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, joinedload
 
-from app.database import get_db_session, init_db
-from app.models import Channel, ChannelRuntime, SystemSettings, TxHistory
+from app.database import engine, get_db_session, init_db
+from app.models import Channel, ChannelRuntime, Radio, SystemSettings, TxHistory
+from app.providers import WeatherProvider, Measurement
 from app.providers.manager import provider_manager
 from app.tts.piper_engine import PiperEngine
 from app.tts.cache import TTSCacheService
+from app.tts.segments import SegmentSynthesizer
+from app.services.announcement import prepare_announcement_text
 from app.services.template import TemplateRenderer
 from app.services.transmission import TransmissionService
-from app.ptt.controller import MockPTTController, GPIOPTTController
+from app.services.tx_lock import TransmitLock
+from app.services.arbiter import DEFAULT_RADIO, RadioArbiter, RadioLine
+from app.services.scheduler import TxScheduler, ScheduledTx
+from app.services.measurement_store import MeasurementStore
+from app.services.db_metrics import UnitOfWorkMetrics
+from app.services.channel_config import ChannelConfig, ChannelConfigCache
+from app.services.retention import HistoryArchiver
+from app.services.runner_stats import write_runner_stats
+from app.ptt.controller import (
+    GpiodPTTController,
+    GPIOPTTController,
+    MockPTTController,
+)
 from app.utils import compute_hash, is_measurement_expired
-from app.exceptions import MeasurementExpiredError, PTTError
+from app.exceptions import MeasurementExpiredError
 from app.database import DATA_DIR
 
 # Créer le dossier de logs
@@ -34,6 +54,33 @@ LOG_DIR.mkdir(parents=True, exist_ok=True)
 # Fichier PID pour prévenir instances multiples
 PID_FILE = DATA_DIR / "runner.pid"
 
+# Intervalle de re-vérification des settings quand le système est désactivé
+DISABLED_RECHECK_SECONDS = 10
+
+# Âge max (depuis sa récupération) d'une mesure pollée réutilisable au moment
+# de la TX ; au-delà, la mesure est re-demandée au provider
+MEASUREMENT_MAX_AGE_SECONDS = float(os.getenv("VHF_MEASUREMENT_MAX_AGE_SECONDS", "180"))
+
+# Character device de la chip GPIO du connecteur (PTT via libgpiod)
+GPIO_CHIP_PATH = os.getenv("VHF_GPIO_CHIP", "/dev/gpiochip0")
+
+# Intervalle entre deux passes d'éviction du cache audio
+AUDIO_CACHE_GC_INTERVAL_SECONDS = 3600
+
+# Jours d'historique (tx_history, audit_log) gardés en base ; au-delà, les
+# lignes sont déplacées vers data/archive/ (0 = pas d'archivage)
+HISTORY_RETENTION_DAYS = int(os.getenv("VHF_HISTORY_RETENTION_DAYS", "90"))
+
+# Intervalle entre deux passes d'archivage de l'historique
+HISTORY_ARCHIVE_INTERVAL_SECONDS = 6 * 3600
+
+# Mode groupé : silence (ms) entre deux annonces dues ensemble sur une même
+# radio, émises sous un seul passage en émission. Non défini = une TX par
+# annonce (lead, tail et pause inter-annonce à chaque fois)
+TX_BATCH_GAP_MS = (
+    int(os.environ["VHF_TX_BATCH_GAP_MS"]) if os.getenv("VHF_TX_BATCH_GAP_MS") else None
+)
+
 # Configuration logging
 logging.basicConfig(
     level=logging.INFO,
@@ -46,6 +93,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _wav_duration(path: str) -> float:
+    """Durée (s) d'un fichier WAV, 0 si illisible."""
+    try:
+        with wave.open(path, "rb") as wav:
+            return wav.getnframes() / float(wav.getframerate())
+    except (OSError, EOFError, wave.Error):
+        return 0.0
+
+
 def acquire_pid_lock() -> bool:
     """Acquérir le verrou PID.
 
@@ -115,37 +171,157 @@ class VHFRunner:
             self.tts_engine = None
 
         self.tts_cache = TTSCacheService()
+        self.archiver = HistoryArchiver()
+        self._archive_task: Optional[asyncio.Task] = None
         self.template_renderer = TemplateRenderer()
+        self.segment_synthesizer = (
+            SegmentSynthesizer(self.tts_engine) if self.tts_engine else None
+        )
+
+        # Tas des TX PENDING (échéances en mémoire)
+        self.scheduler = TxScheduler()
+
+        # Dernières mesures pollées (vérification de péremption avant TX)
+        self.measurements = MeasurementStore(MEASUREMENT_MAX_AGE_SECONDS)
+
+        # Instantanés figés des canaux (reconstruits si Channel.updated_at change)
+        self.channel_configs = ChannelConfigCache()
+
+        # Synthèses anticipées par canal (une seule exécutée à la fois)
+        self._synthesis_jobs: Dict[int, asyncio.Task] = {}
+        self._synthesis_running: Set[asyncio.Task] = set()
+        self._synthesis_slot: Optional[asyncio.Semaphore] = None
 
         # PTT controller (sera initialisé selon config)
         self.ptt_controller = None
         self.transmission_service = None
 
+        # Radios (défaut + table radios), initialisées avec le PTT
+        self.arbiter: Optional[RadioArbiter] = None
+
+        # Durées des sessions DB et des commits (attente du verrou SQLite)
+        self.db_metrics = UnitOfWorkMetrics()
+
         logger.info("Runner VHF initialisé")
 
-    def _init_ptt_controller(self, settings: SystemSettings):
-        """Initialise le contrôleur PTT selon la config."""
-        if self.ptt_controller:
-            return  # Déjà initialisé
+    @contextmanager
+    def _unit_of_work(self, label: str):
+        """
+        Session courte autour d'une transition d'état, validée à la sortie.
+
+        Aucune attente réseau, synthèse ou audio ne doit se trouver dans le
+        bloc : la session (et sous SQLite le verrou d'écriture) n'est tenue
+        que le temps des requêtes. Les objets lus restent utilisables après
+        la sortie (détachés, non expirés). Durée de la session et des commits
+        enregistrées dans db_metrics.
+
+        Args:
+            label: Type d'unité de travail (métriques)
+        """
+        start = time.monotonic()
+        commit = {"start": 0.0, "total": 0.0}
+
+        def before_commit(session):
+            commit["start"] = time.monotonic()
+
+        def after_commit(session):
+            commit["total"] += time.monotonic() - commit["start"]
+
+        with get_db_session() as db:
+            db.expire_on_commit = False
+            event.listen(db, "before_commit", before_commit)
+            event.listen(db, "after_commit", after_commit)
+            try:
+                yield db
+                db.commit()
+            except OperationalError as e:
+                db.rollback()
+                if "locked" in str(e):
+                    self.db_metrics.record_lock_error(label)
+                raise
+            except BaseException:
+                db.rollback()
+                raise
+            finally:
+                self.db_metrics.record(label, time.monotonic() - start, commit["total"])
+
+    @staticmethod
+    def _create_ptt_controller(pin: Optional[int], active_level: int):
+        """
+        Crée un contrôleur PTT : libgpiod si disponible (Pi 5, Raspberry Pi OS
+        récents), RPi.GPIO sinon, mock si pas de pin / pas de GPIO.
+        """
+        if pin is not None:
+            if Path(GPIO_CHIP_PATH).exists():
+                try:
+                    controller = GpiodPTTController(
+                        pin=pin, active_level=active_level, chip_path=GPIO_CHIP_PATH
+                    )
+                    logger.info(f"PTT gpiod initialisé ({GPIO_CHIP_PATH}, ligne {pin})")
+                    return controller
+                except (ImportError, OSError) as e:
+                    logger.warning(f"gpiod non utilisable ({e}), essai RPi.GPIO")
 
-        if settings.ptt_gpio_pin is not None:
             try:
                 # Mode GPIO (Raspberry Pi)
-                self.ptt_controller = GPIOPTTController(
-                    pin=settings.ptt_gpio_pin, active_level=settings.ptt_active_level
-                )
-                logger.info(f"PTT GPIO initialisé (pin {settings.ptt_gpio_pin})")
+                controller = GPIOPTTController(pin=pin, active_level=active_level)
+                logger.info(f"PTT GPIO initialisé (pin {pin})")
+                return controller
             except ImportError:
                 # Fallback sur mock si GPIO non disponible
                 logger.warning("GPIO non disponible, utilisation du mode MOCK")
-                self.ptt_controller = MockPTTController()
-        else:
-            # Mode mock (développement)
-            self.ptt_controller = MockPTTController()
+                return MockPTTController()
+
+        # Mode mock (développement)
+        return MockPTTController()
+
+    def _init_ptt_controller(self, settings: SystemSettings):
+        """Initialise le contrôleur PTT selon la config."""
+        if self.ptt_controller:
+            return  # Déjà initialisé
 
-        # Créer le service de transmission
+        self.ptt_controller = self._create_ptt_controller(
+            settings.ptt_gpio_pin, settings.ptt_active_level
+        )
+
+        # Créer le service de transmission (radio par défaut)
         self.transmission_service = TransmissionService(self.ptt_controller)
 
+    def _init_radios(self, db: Session):
+        """
+        Initialise l'arbitre des radios : radio par défaut + radios déclarées
+        dans la table radios (une par fréquence). Prise en compte au démarrage
+        du runner, comme le PTT.
+        """
+        if self.arbiter:
+            return  # Déjà initialisé
+
+        self.arbiter = RadioArbiter(
+            RadioLine(name=DEFAULT_RADIO, transmission=self.transmission_service)
+        )
+
+        for radio in db.query(Radio).filter_by(is_enabled=True).order_by(Radio.id):
+            try:
+                self.arbiter.add(
+                    RadioLine(
+                        name=radio.name,
+                        frequency_mhz=radio.frequency_mhz,
+                        transmission=TransmissionService(
+                            self._create_ptt_controller(
+                                radio.ptt_gpio_pin, radio.ptt_active_level
+                            ),
+                            audio_device=radio.audio_device,
+                            tx_lock=TransmitLock(f"radio{radio.id}"),
+                        ),
+                    )
+                )
+                logger.info(
+                    f"Radio {radio.name} : {radio.frequency_mhz} MHz, "
+                    f"audio {radio.audio_device or 'par défaut'}"
+                )
+            except ValueError as e:
+                logger.error(f"Radio ignorée : {e}")
+
     async def run(self):
         """Boucle principale du runner."""
         logger.info("Démarrage du runner...")
@@ -153,34 +329,105 @@ class VHFRunner:
         # Initialiser la DB
         init_db()
 
+        # Pools HTTP keep-alive des providers (fermés dans main())
+        provider_manager.open_http_clients()
+
         # Marquer les anciens PENDING en ABORTED
         self._cleanup_old_pending()
 
-        # Timestamp du dernier poll (initialisé dans le passé pour forcer le 1er poll)
-        last_poll_time = datetime.utcnow() - timedelta(seconds=3600)
+        # Charger les TX PENDING restantes dans le tas
+        with get_db_session() as db:
+            count = self.scheduler.load_pending(db)
+        logger.info(f"{count} TX PENDING chargées dans l'ordonnanceur")
+
+        # Premier poll et première éviction du cache immédiats
+        next_poll_at = datetime.utcnow()
+        next_gc_at = datetime.utcnow()
+        next_archive_at = datetime.utcnow()
 
         while True:
             try:
-                with get_db_session() as db:
-                    # Récupérer les settings pour poll_interval
-                    settings = db.query(SystemSettings).filter_by(id=1).first()
+                if datetime.utcnow() >= next_poll_at:
+                    with get_db_session() as db:
+                        # Récupérer les settings pour poll_interval
+                        settings = db.query(SystemSettings).filter_by(id=1).first()
+                        enabled = bool(settings and settings.master_enabled)
+                        poll_interval = (
+                            settings.poll_interval_seconds
+                            if enabled
+                            else DISABLED_RECHECK_SECONDS
+                        )
 
-                    if settings and settings.master_enabled:
-                        # Vérifier s'il est temps de faire un poll
-                        elapsed = (datetime.utcnow() - last_poll_time).total_seconds()
+                    if enabled:
+                        await self._iteration()
+                    next_poll_at = datetime.utcnow() + timedelta(seconds=poll_interval)
 
-                        if elapsed >= settings.poll_interval_seconds:
-                            await self._iteration()
-                            last_poll_time = datetime.utcnow()
-                    else:
-                        # Système désactivé, on attend quand même
-                        pass
+                # Exécuter les TX arrivées à échéance
+                due = self.scheduler.pop_due()
+                if due:
+                    await self._execute_due(due)
+
+                # Éviction du cache audio (quota disque + âge max)
+                if datetime.utcnow() >= next_gc_at:
+                    next_gc_at = datetime.utcnow() + timedelta(
+                        seconds=AUDIO_CACHE_GC_INTERVAL_SECONDS
+                    )
+                    await asyncio.to_thread(self._collect_audio_cache)
+
+                # Archivage de l'historique ancien, en tâche de fond : par lots
+                # courts, il ne retarde pas les TX dues
+                if HISTORY_RETENTION_DAYS > 0 and datetime.utcnow() >= next_archive_at:
+                    next_archive_at = datetime.utcnow() + timedelta(
+                        seconds=HISTORY_ARCHIVE_INTERVAL_SECONDS
+                    )
+                    if self._archive_task is None or self._archive_task.done():
+                        self._archive_task = asyncio.create_task(
+                            asyncio.to_thread(self._archive_history)
+                        )
 
             except Exception as e:
                 logger.error(f"Erreur dans l'itération du runner: {e}", exc_info=True)
+                # Éviter une boucle serrée si l'erreur se répète
+                await asyncio.sleep(1)
+
+            # Dormir jusqu'à la prochaine échéance TX, le prochain poll, ou un réveil
+            await self.scheduler.wait(until=next_poll_at)
+
+    def _collect_audio_cache(self):
+        """Passe d'éviction du cache audio (exécutée dans un thread)."""
+        with get_db_session() as db:
+            result = self.tts_cache.collect_garbage(db)
+
+        if result["files_deleted"]:
+            logger.info(
+                f"Cache audio : {result['files_deleted']} fichiers supprimés, "
+                f"{result['bytes_reclaimed'] / 1e6:.1f} Mo récupérés, "
+                f"{result['bytes_remaining'] / 1e6:.1f} Mo restants"
+            )
+        else:
+            logger.debug(
+                f"Cache audio : rien à supprimer "
+                f"({result['bytes_remaining'] / 1e6:.1f} Mo)"
+            )
+
+    def _archive_history(self):
+        """Passe d'archivage de l'historique (exécutée dans un thread)."""
+        try:
+            start = time.monotonic()
+            with get_db_session() as db:
+                archived = self.archiver.archive(db, HISTORY_RETENTION_DAYS)
 
-            # Attendre 1 seconde avant de revérifier (plus réactif)
-            await asyncio.sleep(1)
+            if not any(archived.values()):
+                logger.debug("Historique : rien à archiver")
+                return
+
+            pages = self.archiver.vacuum(engine)
+            logger.info(
+                f"Historique archivé (> {HISTORY_RETENTION_DAYS} j) : {archived}, "
+                f"{pages} pages rendues, en {time.monotonic() - start:.1f}s"
+            )
+        except Exception as e:
+            logger.error(f"Erreur d'archivage de l'historique : {e}", exc_info=True)
 
     def _cleanup_old_pending(self):
         """Marque les anciennes TX PENDING en ABORTED au démarrage.
@@ -211,7 +458,7 @@ class VHFRunner:
         """Une itération du runner."""
         logger.info("=== Début itération Runner ===")
 
-        with get_db_session() as db:
+        with self._unit_of_work("iteration") as db:
             # Récupérer les settings
             settings = db.query(SystemSettings).filter_by(id=1).first()
 
@@ -227,35 +474,73 @@ class VHFRunner:
             provider_manager.load_credentials(db)
             logger.info("Credentials providers chargés")
 
-            # Récupérer les canaux actifs
-            active_channels = db.query(Channel).filter_by(is_enabled=True).all()
-
-            if not active_channels:
-                logger.info("Aucun canal actif")
-                return
+            # Resynchroniser le tas (TX annulées côté web, système réactivé, etc.)
+            self.scheduler.load_pending(db)
 
-            logger.info(
-                f"{len(active_channels)} canaux actifs : {[ch.name for ch in active_channels]}"
+            # Canaux actifs (instantanés, seuls les canaux modifiés sont relus)
+            active_channels = list(
+                self.channel_configs.load(db, Channel.is_enabled.is_(True)).values()
             )
 
-            # Polling des mesures
-            await self._poll_measurements(db, active_channels)
+        if not active_channels:
+            logger.info("Aucun canal actif")
+            return
 
-            # Planification et exécution des TX
-            await self._execute_transmissions(db, active_channels, settings)
+        logger.info(
+            f"{len(active_channels)} canaux actifs : {[ch.name for ch in active_channels]}"
+        )
 
+        # Garder chargées les voix des canaux actifs (pas de rechargement ONNX par TX)
+        if self.tts_engine:
+            await asyncio.to_thread(
+                self.tts_engine.preload, {ch.voice_id for ch in active_channels}
+            )
+
+        # Polling des mesures (planifie les TX dans le tas)
+        await self._poll_measurements(active_channels)
+
+        logger.info(f"Unités de travail DB : {self.db_metrics.get_stats()}")
+        logger.info(f"Instantanés canaux : {self.channel_configs.get_stats()}")
+        for name, stats in self._publish_radio_stats().items():
+            logger.info(f"Radio {name} : {stats}")
         logger.info("=== Fin itération Runner ===")
 
-    async def _poll_measurements(self, db: Session, channels: List[Channel]):
+    def _radio_stats(self) -> Dict[str, dict]:
+        """Métriques de chaque radio (verrou TX, watchdog, fronts GPIO)."""
+        if not self.arbiter:
+            return {}
+        stats = {}
+        for radio in self.arbiter.radios:
+            stats[radio.name] = {
+                "tx_lock": radio.transmission.get_lock_stats(),
+                "watchdog": radio.transmission.get_watchdog_stats(),
+            }
+            # Fronts horodatés : contrôleur libgpiod uniquement
+            if isinstance(radio.ptt, GpiodPTTController):
+                stats[radio.name]["ptt_edges"] = radio.ptt.get_edge_stats()
+        return stats
+
+    def _publish_radio_stats(self) -> Dict[str, dict]:
+        """Publie les métriques des radios pour /api/status et les retourne."""
+        stats = self._radio_stats()
+        write_runner_stats(stats)
+        return stats
+
+    async def _poll_measurements(self, channels: List[ChannelConfig]):
         """
         Poll les mesures pour tous les canaux actifs.
 
-        Regroupe par provider pour optimiser les appels API.
+        Regroupe par provider pour optimiser les appels API. Aucune session DB
+        n'est ouverte pendant les appels réseau : les mises à jour sont faites
+        ensuite, dans une unité de travail courte validée en un seul commit,
+        chaque canal dans son propre savepoint (un canal en échec n'empêche
+        pas la mise à jour des autres). Le tas et la synthèse anticipée ne
+        sont mis à jour qu'après ce commit.
         """
         logger.info("--- Début polling mesures ---")
 
         # Regrouper par provider
-        channels_by_provider: Dict[str, List[Channel]] = {}
+        channels_by_provider: Dict[str, List[ChannelConfig]] = {}
         for channel in channels:
             if channel.provider_id not in channels_by_provider:
                 channels_by_provider[channel.provider_id] = []
@@ -263,42 +548,143 @@ class VHFRunner:
 
         logger.info(f"Providers à interroger : {list(channels_by_provider.keys())}")
 
-        # Fetch par provider
-        for provider_id, provider_channels in channels_by_provider.items():
+        # Fetch de tous les providers en parallèle (durée = provider le plus lent)
+        providers = []
+        for provider_id in channels_by_provider:
             provider = provider_manager.get_provider(provider_id)
             if not provider:
                 logger.warning(f"Provider inconnu: {provider_id}")
                 continue
+            providers.append(provider)
+
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(
+                self._fetch_provider(
+                    provider,
+                    [
+                        str(ch.station_id)
+                        for ch in channels_by_provider[provider.provider_id]
+                    ],
+                )
+                for provider in providers
+            )
+        )
+        logger.info(
+            f"Polling {len(providers)} providers terminé en {time.monotonic() - start:.2f}s"
+        )
 
-            station_ids = [str(ch.station_id) for ch in provider_channels]
-            logger.info(f"Fetching {provider_id} pour stations : {station_ids}")
+        # Mesures reçues par canal
+        received = []
+        for provider, measurements in zip(providers, results):
+            if measurements is None:
+                continue
 
-            try:
-                # Fetch bulk
-                measurements = await provider.fetch_measurements_bulk(station_ids)
-                logger.info(f"Reçu {len(measurements)} mesures de {provider_id}")
-
-                # Mettre à jour les runtimes
-                for channel in provider_channels:
-                    measurement = measurements.get(str(channel.station_id))
-                    if measurement:
-                        self._update_channel_measurement(db, channel, measurement)
-                    else:
-                        logger.warning(
-                            f"Pas de mesure pour station {channel.station_id}"
+            for channel in channels_by_provider[provider.provider_id]:
+                measurement = measurements.get(str(channel.station_id))
+                if measurement:
+                    self.measurements.put(
+                        provider.provider_id, channel.station_id, measurement
+                    )
+                    received.append((channel.id, measurement))
+                else:
+                    logger.warning(f"Pas de mesure pour station {channel.station_id}")
+
+        if not received:
+            return
+
+        # Mettre à jour les runtimes (canaux relus : ils ont pu changer pendant
+        # le polling ; runtimes chargés dans la même requête)
+        scheduled = []
+        with self._unit_of_work("measurements") as db:
+            # Transaction ouverte explicitement : sinon pysqlite n'en ouvre pas
+            # avant le premier SAVEPOINT, dont le RELEASE validerait aussitôt
+            db.connection().exec_driver_sql("BEGIN IMMEDIATE")
+            attached = {
+                channel.id: channel
+                for channel in db.query(Channel)
+                .options(joinedload(Channel.runtime))
+                .filter(Channel.id.in_({channel_id for channel_id, _ in received}))
+            }
+            for channel_id, measurement in received:
+                channel = attached.get(channel_id)
+                if not channel or not channel.is_enabled:
+                    continue
+                try:
+                    with db.begin_nested():
+                        plan = self._update_channel_measurement(
+                            db, channel, measurement
                         )
+                    if plan:
+                        scheduled.append(plan)
+                except Exception as e:
+                    # Savepoint annulé : TX PENDING du canal intactes, le tas
+                    # est resynchronisé à l'itération suivante
+                    logger.error(
+                        f"Mise à jour de la mesure du canal {channel.name} "
+                        f"impossible : {e}",
+                        exc_info=True,
+                    )
 
-            except Exception as e:
-                logger.error(
-                    f"Erreur lors du polling {provider_id}: {e}", exc_info=True
-                )
+        # TX validées : planification en mémoire
+        for channel_id, rows in scheduled:
+            self._apply_schedule(channel_id, rows)
+
+    async def _fetch_provider(
+        self, provider: WeatherProvider, station_ids: List[str]
+    ) -> Optional[Dict[str, Optional[Measurement]]]:
+        """
+        Fetch bulk d'un provider avec son propre timeout.
+
+        Les erreurs sont isolées : un provider en échec n'affecte pas les autres.
+
+        Returns:
+            Dictionnaire {station_id: Measurement ou None}, ou None si échec
+        """
+        provider_id = provider.provider_id
+        logger.info(f"Fetching {provider_id} pour stations : {station_ids}")
+
+        start = time.monotonic()
+        try:
+            measurements = await asyncio.wait_for(
+                provider.fetch_measurements_bulk(station_ids),
+                timeout=provider.poll_timeout_seconds,
+            )
+            logger.info(
+                f"Reçu {len(measurements)} mesures de {provider_id} "
+                f"en {time.monotonic() - start:.2f}s"
+            )
+            for endpoint, stats in provider.get_transfer_stats().items():
+                logger.info(f"Trafic {provider_id} {endpoint} : {stats}")
+            return measurements
+
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Timeout polling {provider_id} après {provider.poll_timeout_seconds}s"
+            )
+        except Exception as e:
+            logger.error(
+                f"Erreur lors du polling {provider_id} "
+                f"(après {time.monotonic() - start:.2f}s): {e}",
+                exc_info=True,
+            )
+        return None
+
+    def _update_channel_measurement(
+        self, db: Session, channel: Channel, measurement
+    ) -> Optional[Tuple[int, List[dict]]]:
+        """
+        Met à jour la mesure d'un canal (sans commit).
 
-    def _update_channel_measurement(self, db: Session, channel: Channel, measurement):
-        """Met à jour la mesure d'un canal."""
+        Returns:
+            Planification à appliquer après le commit (voir
+            _schedule_transmissions), None si la mesure n'est pas nouvelle
+        """
         # Récupérer ou créer le runtime
         runtime = channel.runtime
         if not runtime:
             runtime = ChannelRuntime(channel_id=channel.id)
+            channel.runtime = runtime
             db.add(runtime)
 
         # Vérifier si c'est une nouvelle mesure
@@ -322,43 +708,52 @@ class VHFRunner:
             runtime.last_measurement_at = measurement_utc_naive
             runtime.last_error = None
 
-            # Planifier les TX
-            self._schedule_transmissions(db, channel, measurement)
-
-        db.commit()
+            # Planifier les TX (en mémoire seulement après le commit)
+            return self._schedule_transmissions(db, channel, measurement)
+        return None
 
-    def _schedule_transmissions(self, db: Session, channel: Channel, measurement):
+    def _schedule_transmissions(
+        self, db: Session, channel: Channel, measurement
+    ) -> Tuple[int, List[dict]]:
         """
         Planifie les transmissions pour une nouvelle mesure.
 
         Politique V1 (cancel_on_new) : annule les futures TX non-exécutées
         et crée TOUTES les nouvelles TX dans tx_history.
+
+        Le texte est rendu une seule fois (identique pour tous les offsets),
+        l'idempotence est vérifiée en une requête IN et les nouvelles TX sont
+        insérées en un seul lot. Offsets et paramètres de voix viennent de
+        l'instantané du canal (JSON décodé une seule fois par modification).
+
+        Ne valide rien (flush seulement) : l'appelant commite, puis applique
+        la planification retournée avec _apply_schedule().
+
+        Returns:
+            (id du canal, TX PENDING créées)
         """
+        config = self.channel_configs.get(channel)
+
         # POLITIQUE V1 : Annuler TOUTES les TX PENDING de ce canal (futures et passées)
-        pending_tx = (
+        aborted = (
             db.query(TxHistory)
             .filter(
                 TxHistory.channel_id == channel.id,
                 TxHistory.status == "PENDING",
             )
-            .all()
+            .update(
+                {
+                    TxHistory.status: "ABORTED",
+                    TxHistory.error_message: "Cancelled by new measurement (cancel_on_new policy)",
+                },
+                synchronize_session=False,
+            )
         )
-
-        if pending_tx:
-            for tx in pending_tx:
-                tx.status = "ABORTED"
-                tx.error_message = "Cancelled by new measurement (cancel_on_new policy)"
+        if aborted:
             logger.info(
-                f"Annulé {len(pending_tx)} TX PENDING pour {channel.name} (nouvelle mesure)"
+                f"Annulé {aborted} TX PENDING pour {channel.name} (nouvelle mesure)"
             )
 
-        # Calculer TOUTES les TX depuis les offsets et les créer dans tx_history
-        import json
-        from app.utils import compute_hash
-
-        offsets = json.loads(channel.offsets_seconds_json or "[0]")
-        created_count = 0
-
         # Utiliser le même UTC naïf que celui stocké dans runtime
         measurement_utc_naive = (
             measurement.measurement_at.replace(tzinfo=None)
@@ -366,120 +761,312 @@ class VHFRunner:
             else measurement.measurement_at
         )
 
-        for offset in offsets:
-            planned_at = measurement_utc_naive + timedelta(seconds=offset)
+        # Rendre le texte une seule fois (fonction centralisée)
+        rendered_text = prepare_announcement_text(config, measurement)
 
-            # Rendre le texte pour calculer tx_id (fonction centralisée)
-            from app.services.announcement import prepare_announcement_text
-
-            rendered_text = prepare_announcement_text(channel, measurement)
-
-            # Calculer tx_id (idempotence)
-            tx_id = compute_hash(
-                channel.id,
-                channel.provider_id,
-                channel.station_id,
+        # Calculer tous les tx_id (idempotence)
+        candidates = {
+            compute_hash(
+                config.id,
+                config.provider_id,
+                config.station_id,
                 measurement_utc_naive.isoformat(),
                 rendered_text,
-                channel.engine_id,
-                channel.voice_id,
-                channel.voice_params_json or "{}",
+                config.engine_id,
+                config.voice_id,
+                config.voice_params_json,
                 offset,
+            ): offset
+            for offset in config.offsets
+        }
+
+        # Vérifier en une requête les TX qui existent déjà
+        existing = {
+            tx_id
+            for (tx_id,) in db.query(TxHistory.tx_id).filter(
+                TxHistory.tx_id.in_(list(candidates))
             )
+        }
+        if existing:
+            logger.debug(f"{len(existing)} TX existent déjà, skip")
 
-            # Vérifier si cette TX existe déjà (idempotence)
-            existing = db.query(TxHistory).filter_by(tx_id=tx_id).first()
-            if existing:
-                logger.debug(f"TX {tx_id[:12]}... existe déjà, skip")
-                continue
+        # Créer les TX avec status="PENDING" (insertion groupée, un seul INSERT)
+        now = datetime.utcnow()
+        rows = [
+            {
+                "tx_id": tx_id,
+                "channel_id": config.id,
+                "mode": "SCHEDULED",
+                "status": "PENDING",
+                "station_id": str(config.station_id),
+                "measurement_at": measurement_utc_naive,
+                "offset_seconds": offset,
+                "planned_at": measurement_utc_naive + timedelta(seconds=offset),
+                "rendered_text": rendered_text,
+                "created_at": now,
+            }
+            for tx_id, offset in candidates.items()
+            if tx_id not in existing
+        ]
+        if rows:
+            db.execute(insert(TxHistory), rows)
+
+        # Toutes les autres TX PENDING du canal viennent d'être annulées :
+        # la prochaine TX est la plus proche des TX créées
+        next_tx_at = min((row["planned_at"] for row in rows), default=None)
+        channel.runtime.next_tx_at = next_tx_at
+        channel_id, channel_name = config.id, config.name
+
+        # TX + runtime envoyés dans la transaction de l'appelant
+        db.flush()
+
+        logger.info(f"Créé {len(rows)} TX PENDING pour {channel_name}")
+        if next_tx_at:
+            logger.info(f"Prochaine TX pour {channel_name} : {next_tx_at}")
+        else:
+            logger.warning(f"Aucune TX PENDING pour {channel_name}")
+        return channel_id, rows
 
-            # Créer la TX avec status="PENDING"
-            tx_record = TxHistory(
-                tx_id=tx_id,
-                channel_id=channel.id,
-                mode="SCHEDULED",
-                status="PENDING",
-                station_id=str(channel.station_id),
-                measurement_at=measurement_utc_naive,
-                offset_seconds=offset,
-                planned_at=planned_at,
-                rendered_text=rendered_text,
-            )
-            db.add(tx_record)
-            created_count += 1
-            logger.debug(f"Créé TX offset {offset}s pour {channel.name} à {planned_at}")
+    def _apply_schedule(self, channel_id: int, rows: List[dict]):
+        """
+        Remplace en mémoire la planification d'un canal, une fois validée.
 
-        # Commit pour persister les TX
-        db.commit()
+        Args:
+            channel_id: ID du canal
+            rows: TX PENDING créées (voir _schedule_transmissions)
+        """
+        self.scheduler.cancel_channel(channel_id)
+        self._cancel_synthesis(channel_id)
 
-        logger.info(f"Créé {created_count} TX PENDING pour {channel.name}")
+        # Planifier en mémoire uniquement les TX effectivement journalisées
+        for row in rows:
+            self.scheduler.schedule(row["tx_id"], channel_id, row["planned_at"])
 
-        # Calculer next_tx_at : la plus proche TX PENDING
-        next_pending = (
-            db.query(TxHistory)
-            .filter(
-                TxHistory.channel_id == channel.id,
-                TxHistory.status == "PENDING",
-            )
-            .order_by(TxHistory.planned_at)
-            .first()
-        )
+        # Synthétiser l'audio dès maintenant : prêt avant planned_at
+        if rows:
+            self._start_synthesis(channel_id, [row["tx_id"] for row in rows])
 
-        if next_pending:
-            channel.runtime.next_tx_at = next_pending.planned_at
-            logger.info(f"Prochaine TX pour {channel.name} : {next_pending.planned_at}")
-        else:
-            channel.runtime.next_tx_at = None
-            logger.warning(f"Aucune TX PENDING pour {channel.name}")
+    def _start_synthesis(self, channel_id: int, tx_ids: List[str]):
+        """Lance en tâche de fond la synthèse anticipée des TX d'un canal."""
+        self._cancel_synthesis(channel_id)
+        if self._synthesis_slot is None:
+            self._synthesis_slot = asyncio.Semaphore(1)
+
+        task = asyncio.create_task(self._presynthesize(channel_id, tx_ids))
+        self._synthesis_jobs[channel_id] = task
+
+        def _forget(done: asyncio.Task):
+            if self._synthesis_jobs.get(channel_id) is done:
+                del self._synthesis_jobs[channel_id]
+
+        task.add_done_callback(_forget)
+
+    def _cancel_synthesis(self, channel_id: int):
+        """
+        Annule la synthèse anticipée d'un canal (TX annulées).
+
+        Seule une synthèse encore en file d'attente est annulée : une synthèse
+        démarrée se termine (le thread Piper ne peut pas être interrompu) et
+        n'enregistre audio_path que sur les TX restées PENDING.
+        """
+        task = self._synthesis_jobs.pop(channel_id, None)
+        if task and not task.done() and task not in self._synthesis_running:
+            task.cancel()
+            logger.debug(f"Synthèse anticipée annulée pour le canal {channel_id}")
+
+    async def _wait_synthesis(self, channel_ids):
+        """Attend la fin des synthèses anticipées en cours pour ces canaux."""
+        tasks = [
+            self._synthesis_jobs[channel_id]
+            for channel_id in channel_ids
+            if channel_id in self._synthesis_jobs
+        ]
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def _presynthesize(self, channel_id: int, tx_ids: List[str]):
+        """
+        Synthèse anticipée : obtient l'audio des nouvelles TX et enregistre
+        audio_path, pour que le PTT soit activé dès planned_at.
+
+        Toutes les TX d'une même mesure partagent le même texte, donc le même
+        fichier. Une synthèse à la fois (CPU du Raspberry Pi) ; en cas
+        d'échec, l'audio sera synthétisé au moment de la TX.
+        """
+        async with self._synthesis_slot:
+            task = asyncio.current_task()
+            self._synthesis_running.add(task)
+            try:
+                with self._unit_of_work("synthesis") as db:
+                    channel = self.channel_configs.load(
+                        db, Channel.id == channel_id
+                    ).get(channel_id)
+                    pending = (
+                        db.query(TxHistory)
+                        .filter(
+                            TxHistory.tx_id.in_(tx_ids),
+                            TxHistory.status == "PENDING",
+                        )
+                        .all()
+                    )
+                if not channel or not pending:
+                    return
+
+                start = time.monotonic()
+                audio_path = await self._obtain_audio(
+                    channel, pending[0], channel.voice_params
+                )
 
-        db.commit()
+                # Uniquement sur les TX restées PENDING (annulations entre-temps)
+                with self._unit_of_work("synthesis") as db:
+                    updated = (
+                        db.query(TxHistory)
+                        .filter(
+                            TxHistory.tx_id.in_([tx.tx_id for tx in pending]),
+                            TxHistory.status == "PENDING",
+                        )
+                        .update(
+                            {TxHistory.audio_path: audio_path},
+                            synchronize_session=False,
+                        )
+                    )
+
+                logger.info(
+                    f"Audio prêt pour {updated} TX de {channel.name} "
+                    f"en {time.monotonic() - start:.2f}s (anticipé)"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Synthèse anticipée échouée (canal {channel_id}) : {e}. "
+                    "L'audio sera synthétisé au moment de la TX."
+                )
+            finally:
+                self._synthesis_running.discard(task)
+
+    async def _execute_due(self, due: List[ScheduledTx]):
+        """
+        Exécute les TX arrivées à échéance dans le tas.
+
+        Relit les settings (fail-safe master_enabled) : si le système est
+        désactivé, les TX restent PENDING et seront rechargées au prochain poll.
+        """
+        with self._unit_of_work("execute") as db:
+            settings = db.query(SystemSettings).filter_by(id=1).first()
+
+            if not settings or not settings.master_enabled:
+                logger.info(
+                    f"Système désactivé, {len(due)} TX dues laissées en PENDING"
+                )
+                return
+
+            self._init_ptt_controller(settings)
+            self._init_radios(db)
+
+        await self._execute_transmissions(due, settings)
 
     async def _execute_transmissions(
-        self, db: Session, channels: List[Channel], settings: SystemSettings
+        self, due: List[ScheduledTx], settings: SystemSettings
     ):
         """
-        Exécute TOUTES les transmissions PENDING dont planned_at <= now.
+        Exécute les transmissions arrivées à échéance.
 
-        Une par une, en marquant chaque TX avant de l'exécuter.
+        Les TX sont réparties par radio (fréquence du canal) : les radios
+        émettent en parallèle, chaque radio une TX à la fois dans l'ordre
+        chronologique. Seules les TX encore PENDING en DB sont exécutées
+        (annulation possible côté web).
         """
-        now = datetime.utcnow()
+        # Audio en cours de synthèse anticipée : l'attendre plutôt que le refaire
+        await self._wait_synthesis({entry.channel_id for entry in due})
 
-        # Trouver TOUTES les TX PENDING dues (planned_at <= now)
-        due_tx = (
-            db.query(TxHistory)
-            .filter(
-                TxHistory.status == "PENDING",
-                TxHistory.planned_at <= now,
+        with self._unit_of_work("execute") as db:
+            # Relire les TX dues (toujours PENDING) en une seule requête
+            due_tx = (
+                db.query(TxHistory.tx_id, TxHistory.channel_id)
+                .filter(
+                    TxHistory.tx_id.in_([entry.tx_id for entry in due]),
+                    TxHistory.status == "PENDING",
+                )
+                .order_by(TxHistory.planned_at)  # Ordre chronologique
+                .all()
             )
-            .order_by(TxHistory.planned_at)  # Ordre chronologique
-            .all()
-        )
+
+            # Fréquence des canaux, pour la répartition par radio
+            channels = self.channel_configs.load(
+                db, Channel.id.in_({tx.channel_id for tx in due_tx})
+            )
+
+        # TX dues qui ne sont plus PENDING en DB (annulées côté web)
+        still_pending = {tx.tx_id for tx in due_tx}
+        for entry in due:
+            if entry.tx_id not in still_pending:
+                self.scheduler.resolve(entry.tx_id, entry.channel_id)
 
         if not due_tx:
             return
 
-        logger.info(f"{len(due_tx)} TX PENDING à exécuter")
+        frequencies = {
+            channel_id: config.frequency_mhz for channel_id, config in channels.items()
+        }
+        queues = self.arbiter.assign(due_tx, lambda tx: frequencies.get(tx.channel_id))
+        logger.info(
+            f"{len(due_tx)} TX PENDING à exécuter sur {len(queues)} radio(s) : "
+            + ", ".join(f"{radio.name}={len(txs)}" for radio, txs in queues.items())
+        )
+
+        await self.arbiter.run(
+            queues,
+            lambda radio, txs: self._execute_radio_queue(
+                radio, [tx.tx_id for tx in txs], settings
+            ),
+        )
+        self._publish_radio_stats()
+
+    async def _execute_radio_queue(
+        self, radio: RadioLine, tx_ids: List[str], settings: SystemSettings
+    ):
+        """
+        Exécute séquentiellement les TX d'une radio.
+
+        Les TX sont lues une fois puis détachées, les canaux viennent des
+        instantanés (ChannelConfig) : aucune
+        session n'est ouverte pendant l'audio, l'émission ou les pauses ;
+        chaque transition d'état (SENT, ABORTED, FAILED) est une unité de
+        travail courte. Si le mode groupé est actif (VHF_TX_BATCH_GAP_MS), les
+        annonces consécutives partent sous un seul passage en émission.
+        """
+        with self._unit_of_work("execute") as db:
+            due_tx = (
+                db.query(TxHistory)
+                .filter(TxHistory.tx_id.in_(tx_ids), TxHistory.status == "PENDING")
+                .order_by(TxHistory.planned_at)
+                .all()
+            )
+            channels = self.channel_configs.load(
+                db, Channel.id.in_({tx.channel_id for tx in due_tx})
+            )
+
+        if TX_BATCH_GAP_MS is not None and len(due_tx) > 1:
+            await self._execute_batched_queue(radio, due_tx, channels, settings)
+            return
 
-        # Exécuter séquentiellement
         for i, tx_record in enumerate(due_tx):
             try:
-                # Récupérer le canal
-                channel = db.query(Channel).filter_by(id=tx_record.channel_id).first()
+                channel = channels.get(tx_record.channel_id)
                 if not channel:
                     logger.error(f"Canal {tx_record.channel_id} introuvable")
-                    tx_record.status = "FAILED"
-                    tx_record.error_message = "Channel not found"
-                    db.commit()
+                    self._transition(
+                        [tx_record], self._mark_failed, Exception("Channel not found")
+                    )
                     continue
 
                 await self._execute_single_transmission(
-                    db, channel, settings, tx_record
+                    channel, settings, tx_record, radio.transmission
                 )
 
-                # Pause inter-annonce (sauf pour la dernière)
+                # Pause inter-annonce sur cette radio (sauf pour la dernière)
                 if i < len(due_tx) - 1:
                     pause = settings.inter_announcement_pause_seconds
-                    logger.info(f"Pause inter-annonce: {pause}s")
+                    logger.info(f"Pause inter-annonce ({radio.name}): {pause}s")
                     await asyncio.sleep(pause)
 
             except Exception as e:
@@ -487,46 +1074,246 @@ class VHFRunner:
                     f"Erreur lors de la TX {tx_record.tx_id[:12]}...: {e}",
                     exc_info=True,
                 )
-                tx_record.status = "FAILED"
-                tx_record.error_message = str(e)
-                if channel:
-                    channel.runtime.last_error = str(e)
-                db.commit()
+                self._transition([tx_record], self._mark_failed, e)
 
-        # Recalculer next_tx_at pour tous les canaux affectés
-        affected_channels = set(tx.channel_id for tx in due_tx)
-        for channel_id in affected_channels:
-            channel = db.query(Channel).filter_by(id=channel_id).first()
-            if channel and channel.runtime:
-                next_pending = (
-                    db.query(TxHistory)
-                    .filter(
-                        TxHistory.channel_id == channel_id,
-                        TxHistory.status == "PENDING",
-                    )
-                    .order_by(TxHistory.planned_at)
-                    .first()
+    def _update_next_tx(self, channel: Channel):
+        """Met à jour next_tx_at depuis l'index mémoire des TX PENDING."""
+        channel.runtime.next_tx_at = self.scheduler.next_for_channel(channel.id)
+        logger.debug(f"Prochaine TX pour {channel.name}: {channel.runtime.next_tx_at}")
+
+    async def _obtain_audio(
+        self, channel: ChannelConfig, tx_record: TxHistory, voice_params: dict
+    ) -> str:
+        """
+        Obtient l'audio d'une TX : cache TTS d'abord, synthèse Piper sinon.
+
+        La clé de cache (moteur, version du modèle, voix, paramètres, texte)
+        permet de partager un même fichier entre toutes les TX identiques.
+        Le cache est lu puis alimenté dans deux unités de travail courtes,
+        aucune session n'est ouverte pendant la synthèse.
+
+        Returns:
+            Chemin du fichier WAV
+        """
+        if not self.tts_engine:
+            # Fallback : WAV mock si TTS indisponible (jamais mis en cache)
+            logger.warning("TTS indisponible, création audio mock")
+
+            audio_path = str(
+                DATA_DIR / "audio_cache" / f"tx_{tx_record.tx_id[:12]}.wav"
+            )
+            Path(audio_path).parent.mkdir(parents=True, exist_ok=True)
+
+            with wave.open(audio_path, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(16000)
+                wav.writeframes(b"\x00" * 32000)
+            return audio_path
+
+        cache_key = self.tts_cache.compute_cache_key(
+            engine_id=self.tts_engine.engine_id,
+            engine_version=self.tts_engine.engine_version,
+            model_version=self.tts_engine.get_model_version(channel.voice_id),
+            voice_id=channel.voice_id,
+            voice_params=voice_params,
+            locale=channel.voice_id.split("-")[0],
+            rendered_text=tx_record.rendered_text,
+        )
+
+        with self._unit_of_work("tts_cache") as db:
+            cached_path = self.tts_cache.get_cached_audio(db, cache_key)
+        if cached_path:
+            logger.info(f"Audio trouvé en cache ({cache_key[:12]}...) : {cached_path}")
+            return cached_path
+
+        audio_path = str(self.tts_cache.generate_audio_filename(cache_key))
+
+        # Mode concaténatif (voice_params "segment_cache": true) : seuls les
+        # segments jamais vus passent par Piper
+        segments = None
+        engine_params = dict(voice_params)
+        if engine_params.pop("segment_cache", False) and self.segment_synthesizer:
+            segments = self.template_renderer.split_segments(
+                channel.template_text, tx_record.rendered_text
+            )
+            if segments is None:
+                logger.warning(
+                    "Texte non découpable selon le template, synthèse complète"
+                )
+
+        # Synthèse dans un fichier temporaire, renommé atomiquement : une
+        # synthèse concurrente de la même clé ne voit jamais un WAV partiel
+        tmp_path = str(self.tts_cache.generate_temp_filename(cache_key))
+        try:
+            # Piper synthesize est synchrone, on l'exécute dans un thread
+            if segments:
+                logger.info(f"Synthèse par segments : {segments}")
+                produced_path = await asyncio.to_thread(
+                    self.segment_synthesizer.synthesize,
+                    segments,
+                    channel.voice_id,
+                    tmp_path,
+                    engine_params,
+                )
+            else:
+                logger.info(f"Synthèse TTS : '{tx_record.rendered_text[:50]}...'")
+                produced_path = await asyncio.to_thread(
+                    self.tts_engine.synthesize,
+                    tx_record.rendered_text,  # text
+                    channel.voice_id,  # voice_id
+                    tmp_path,  # output_path
+                    engine_params,  # params
                 )
-                channel.runtime.next_tx_at = (
-                    next_pending.planned_at if next_pending else None
+            os.replace(produced_path, audio_path)
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+        logger.info(f"Audio synthétisé : {audio_path}")
+
+        with self._unit_of_work("tts_cache") as db:
+            self.tts_cache.store_audio(
+                db,
+                cache_key,
+                audio_path,
+                meta={
+                    "engine_id": self.tts_engine.engine_id,
+                    "voice_id": channel.voice_id,
+                    "text_preview": tx_record.rendered_text[:100],
+                },
+            )
+        logger.info(f"Cache TTS : {self.tts_cache.get_stats()}")
+
+        return audio_path
+
+    async def _prepare_transmission(
+        self, channel: ChannelConfig, tx_record: TxHistory
+    ) -> Tuple[str, Measurement]:
+        """
+        Vérifie la mesure et obtient l'audio d'une TX (étapes 1 et 2).
+
+        Returns:
+            (chemin du fichier audio, mesure annoncée)
+
+        Raises:
+            MeasurementExpiredError si la mesure est périmée
+            Exception si la mesure ou l'audio est indisponible
+        """
+        # ÉTAPE 1 : Récupérer la mesure et vérifier non périmée
+        provider = provider_manager.get_provider(channel.provider_id)
+        if not provider:
+            raise Exception(f"Provider {channel.provider_id} non disponible")
+
+        # Mesure du dernier poll si récente, appel au provider sinon
+        measurement = self.measurements.get(channel.provider_id, channel.station_id)
+        if measurement is None:
+            logger.info(
+                f"Mesure en cache absente ou trop ancienne pour {channel.name}, "
+                "appel au provider"
+            )
+            measurement = await provider.fetch_measurement(channel.station_id)
+            if measurement:
+                self.measurements.put(
+                    channel.provider_id, channel.station_id, measurement
                 )
-                logger.debug(
-                    f"next_tx_at mis à jour pour {channel.name}: {channel.runtime.next_tx_at}"
+        if not measurement:
+            raise Exception("Mesure non disponible")
+
+        # Vérifier non périmée
+        if is_measurement_expired(
+            measurement.measurement_at, channel.measurement_period_seconds
+        ):
+            raise MeasurementExpiredError(
+                f"Mesure périmée : {measurement.measurement_at}"
+            )
+
+        # ÉTAPE 2 : Obtenir/synthétiser l'audio (cache-first)
+        # Si audio_path déjà dans tx_record, l'utiliser
+        if tx_record.audio_path and Path(tx_record.audio_path).exists():
+            audio_path = tx_record.audio_path
+        else:
+            # Cache TTS d'abord, synthèse Piper sinon
+            audio_path = await self._obtain_audio(
+                channel, tx_record, channel.voice_params
+            )
+
+            if not audio_path or not Path(audio_path).exists():
+                raise Exception("Fichier audio manquant")
+
+            # Sauvegarder audio_path dans tx_history
+            with self._unit_of_work("transition") as db:
+                db.query(TxHistory).filter_by(tx_id=tx_record.tx_id).update(
+                    {TxHistory.audio_path: audio_path}, synchronize_session=False
                 )
 
-        db.commit()
+        logger.info(
+            f"TX {tx_record.tx_id[:12]}... pour {channel.name}, audio: {audio_path}"
+        )
+        return audio_path, measurement
+
+    def _transition(self, tx_records: List[TxHistory], mark, *args):
+        """
+        Applique une transition d'état à des TX dans une unité de travail
+        courte (un seul commit, runtime des canaux compris).
+
+        Args:
+            tx_records: TX concernées (objets détachés)
+            mark: _mark_sent, _mark_aborted ou _mark_failed
+        """
+        with self._unit_of_work("transition") as db:
+            for tx_record in tx_records:
+                tx = db.query(TxHistory).filter_by(tx_id=tx_record.tx_id).one()
+                channel = (
+                    db.query(Channel)
+                    .options(joinedload(Channel.runtime))
+                    .filter_by(id=tx.channel_id)
+                    .first()
+                )
+                mark(channel, tx, *args)
+
+    def _mark_sent(self, channel: Channel, tx_record: TxHistory):
+        """Marque une TX SENT (avant émission) ; next_tx_at dans le même commit."""
+        tx_record.status = "SENT"
+        tx_record.sent_at = datetime.utcnow()
+        channel.runtime.last_tx_at = datetime.utcnow()
+        self.scheduler.resolve(tx_record.tx_id, channel.id)
+        self._update_next_tx(channel)
+
+    def _mark_aborted(
+        self, channel: Optional[Channel], tx_record: TxHistory, error: Exception
+    ):
+        """Mesure périmée : annuler la TX."""
+        logger.warning(f"TX {tx_record.tx_id[:12]}... annulée : {error}")
+        tx_record.status = "ABORTED"
+        tx_record.error_message = str(error)
+        self.scheduler.resolve(tx_record.tx_id, tx_record.channel_id)
+        if channel and channel.runtime:
+            self._update_next_tx(channel)
+
+    def _mark_failed(
+        self, channel: Optional[Channel], tx_record: TxHistory, error: Exception
+    ):
+        """Toute autre erreur : marquer FAILED (même si déjà marquée SENT)."""
+        logger.error(f"❌ Erreur TX {tx_record.tx_id[:12]}...: {error}")
+        tx_record.status = "FAILED"
+        tx_record.error_message = str(error)
+        self.scheduler.resolve(tx_record.tx_id, tx_record.channel_id)
+        if channel and channel.runtime:
+            channel.runtime.last_error = str(error)
+            self._update_next_tx(channel)
 
     async def _execute_single_transmission(
         self,
-        db: Session,
-        channel: Channel,
+        channel: ChannelConfig,
         settings: SystemSettings,
         tx_record: TxHistory,
+        transmission_service: Optional[TransmissionService] = None,
     ):
         """
         Exécute UNE transmission pour un canal.
 
-        La TX est DÉJÀ créée dans tx_history avec status="PENDING".
+        La TX est DÉJÀ créée dans tx_history avec status="PENDING". Le canal
+        et la TX sont des objets détachés : chaque écriture passe par une
+        unité de travail courte.
 
         Procédure :
         1. Vérifier mesure non périmée
@@ -536,74 +1323,8 @@ class VHFRunner:
         5. Marquer status="SENT" ou "FAILED"
         """
         try:
-            # ÉTAPE 1 : Récupérer la mesure et vérifier non périmée
-            provider = provider_manager.get_provider(channel.provider_id)
-            if not provider:
-                raise Exception(f"Provider {channel.provider_id} non disponible")
-
-            measurement = await provider.fetch_measurement(channel.station_id)
-            if not measurement:
-                raise Exception("Mesure non disponible")
-
-            # Vérifier non périmée
-            if is_measurement_expired(
-                measurement.measurement_at, channel.measurement_period_seconds
-            ):
-                raise MeasurementExpiredError(
-                    f"Mesure périmée : {measurement.measurement_at}"
-                )
-
-            # ÉTAPE 2 : Obtenir/synthétiser l'audio (cache-first)
-            import json
-
-            voice_params = json.loads(channel.voice_params_json or "{}")
-
-            # Si audio_path déjà dans tx_record, l'utiliser
-            if tx_record.audio_path and Path(tx_record.audio_path).exists():
-                audio_path = tx_record.audio_path
-            else:
-                # Synthétiser avec Piper
-                from app.database import DATA_DIR
-
-                audio_path = str(
-                    DATA_DIR / "audio_cache" / f"tx_{tx_record.tx_id[:12]}.wav"
-                )
-                Path(audio_path).parent.mkdir(parents=True, exist_ok=True)
-
-                if self.tts_engine:
-                    # Utiliser Piper pour synthétiser
-                    logger.info(f"Synthèse TTS : '{tx_record.rendered_text[:50]}...'")
-
-                    # Piper synthesize est synchrone, on l'exécute dans un thread
-                    audio_path = await asyncio.to_thread(
-                        self.tts_engine.synthesize,
-                        tx_record.rendered_text,  # text
-                        channel.voice_id,  # voice_id
-                        audio_path,  # output_path
-                        voice_params,  # params
-                    )
-
-                    logger.info(f"Audio synthétisé : {audio_path}")
-                else:
-                    # Fallback : WAV mock si TTS indisponible
-                    logger.warning("TTS indisponible, création audio mock")
-                    import wave
-
-                    with wave.open(audio_path, "wb") as wav:
-                        wav.setnchannels(1)
-                        wav.setsampwidth(2)
-                        wav.setframerate(16000)
-                        wav.writeframes(b"\x00" * 32000)
-
-                if not audio_path or not Path(audio_path).exists():
-                    raise Exception("Fichier audio manquant")
-
-                # Sauvegarder audio_path dans tx_record
-                tx_record.audio_path = audio_path
-                db.commit()
-
-            logger.info(
-                f"TX {tx_record.tx_id[:12]}... pour {channel.name}, audio: {audio_path}"
+            audio_path, measurement = await self._prepare_transmission(
+                channel, tx_record
             )
 
             # ÉTAPE 3 : Re-vérifier non périmée JUSTE AVANT TX
@@ -614,14 +1335,12 @@ class VHFRunner:
 
             # ÉTAPE 3.5 : Marquer comme SENT AVANT transmission (évite race condition)
             # Si la TX échoue, on la marquera FAILED dans le except
-            tx_record.status = "SENT"
-            tx_record.sent_at = datetime.utcnow()
-            channel.runtime.last_tx_at = datetime.utcnow()
-            db.commit()
+            # next_tx_at (index mémoire) écrit dans le même commit
+            self._transition([tx_record], self._mark_sent)
 
-            # ÉTAPE 4 : Transmission PTT
+            # ÉTAPE 4 : Transmission PTT (aucune session DB ouverte)
             logger.info(f"Début transmission pour {channel.name}")
-            await self.transmission_service.transmit(
+            await (transmission_service or self.transmission_service).transmit(
                 audio_path=audio_path,
                 lead_ms=settings.ptt_lead_ms,
                 tail_ms=settings.ptt_tail_ms,
@@ -632,69 +1351,112 @@ class VHFRunner:
                 f"✅ TX {tx_record.tx_id[:12]}... envoyée avec succès pour {channel.name}"
             )
 
-            # ÉTAPE 5 : Recalculer next_tx_at
-            next_pending = (
-                db.query(TxHistory)
-                .filter(
-                    TxHistory.channel_id == channel.id,
-                    TxHistory.status == "PENDING",
+        except MeasurementExpiredError as e:
+            self._transition([tx_record], self._mark_aborted, e)
+
+        except Exception as e:
+            logger.error(f"❌ Erreur TX pour {channel.name}: {e}", exc_info=True)
+            self._transition([tx_record], self._mark_failed, e)
+
+    async def _execute_batched_queue(
+        self,
+        radio: RadioLine,
+        due_tx: List[TxHistory],
+        channels: Dict[int, ChannelConfig],
+        settings: SystemSettings,
+    ):
+        """
+        Émet les TX dues d'une radio en regroupant les annonces consécutives
+        sous un seul passage en émission (lead et tail payés une seule fois).
+
+        Un groupe est limité pour tenir dans tx_timeout_seconds (lead + audios
+        + silences + tail) : le watchdog s'applique à la séquence entière.
+        """
+        # Étapes 1-2 pour chaque TX : mesure + audio
+        ready = []
+        for tx_record in due_tx:
+            channel = channels.get(tx_record.channel_id)
+            if not channel:
+                logger.error(f"Canal {tx_record.channel_id} introuvable")
+                self._transition(
+                    [tx_record], self._mark_failed, Exception("Channel not found")
                 )
-                .order_by(TxHistory.planned_at)
-                .first()
-            )
-            if next_pending:
-                channel.runtime.next_tx_at = next_pending.planned_at
-                logger.debug(
-                    f"Prochaine TX pour {channel.name}: {next_pending.planned_at}"
+                continue
+            try:
+                audio_path, measurement = await self._prepare_transmission(
+                    channel, tx_record
                 )
+            except MeasurementExpiredError as e:
+                self._transition([tx_record], self._mark_aborted, e)
+                continue
+            except Exception as e:
+                logger.error(f"❌ Erreur TX pour {channel.name}: {e}", exc_info=True)
+                self._transition([tx_record], self._mark_failed, e)
+                continue
+            ready.append((tx_record, channel, audio_path, measurement))
+
+        # Découpage en groupes tenant dans le timeout du watchdog
+        budget = (
+            settings.tx_timeout_seconds
+            - (settings.ptt_lead_ms + settings.ptt_tail_ms) / 1000.0
+        )
+        groups = []
+        used = budget
+        for item in ready:
+            duration = _wav_duration(item[2])
+            if groups and used + TX_BATCH_GAP_MS / 1000.0 + duration <= budget:
+                groups[-1].append(item)
+                used += TX_BATCH_GAP_MS / 1000.0 + duration
             else:
-                channel.runtime.next_tx_at = None
-                logger.debug(f"Plus de TX PENDING pour {channel.name}")
-            db.commit()
+                groups.append([item])
+                used = duration
 
-        except MeasurementExpiredError as e:
-            # Mesure périmée : annuler la TX
-            logger.warning(f"TX annulée pour {channel.name} : {e}")
-            tx_record.status = "ABORTED"
-            tx_record.error_message = str(e)
+        for i, group in enumerate(groups):
+            # ÉTAPE 3 : Re-vérifier non périmée JUSTE AVANT TX
+            batch, expired = [], []
+            for tx_record, channel, audio_path, measurement in group:
+                if is_measurement_expired(
+                    measurement.measurement_at, channel.measurement_period_seconds
+                ):
+                    expired.append(tx_record)
+                else:
+                    batch.append((tx_record, channel, audio_path))
 
-            # Recalculer next_tx_at
-            next_pending = (
-                db.query(TxHistory)
-                .filter(
-                    TxHistory.channel_id == channel.id,
-                    TxHistory.status == "PENDING",
+            if expired:
+                self._transition(
+                    expired,
+                    self._mark_aborted,
+                    MeasurementExpiredError("Mesure périmée juste avant transmission"),
                 )
-                .order_by(TxHistory.planned_at)
-                .first()
-            )
-            channel.runtime.next_tx_at = (
-                next_pending.planned_at if next_pending else None
-            )
-            db.commit()
+            if not batch:
+                continue
 
-        except Exception as e:
-            # Toute autre erreur : marquer FAILED
-            # Note: Si on avait déjà marqué SENT avant transmission, on repasse en FAILED
-            logger.error(f"❌ Erreur TX pour {channel.name}: {e}", exc_info=True)
-            tx_record.status = "FAILED"
-            tx_record.error_message = str(e)
-            channel.runtime.last_error = str(e)
+            # Toutes les TX du groupe marquées SENT en un commit
+            self._transition([tx for tx, _, _ in batch], self._mark_sent)
 
-            # Recalculer next_tx_at
-            next_pending = (
-                db.query(TxHistory)
-                .filter(
-                    TxHistory.channel_id == channel.id,
-                    TxHistory.status == "PENDING",
-                )
-                .order_by(TxHistory.planned_at)
-                .first()
-            )
-            channel.runtime.next_tx_at = (
-                next_pending.planned_at if next_pending else None
+            # ÉTAPE 4 : une seule transmission PTT pour tout le groupe
+            logger.info(
+                f"Début transmission groupée ({radio.name}) : "
+                f"{', '.join(channel.name for _, channel, _ in batch)}"
             )
-            db.commit()
+            try:
+                await radio.transmission.transmit_sequence(
+                    [audio_path for _, _, audio_path in batch],
+                    gap_ms=TX_BATCH_GAP_MS,
+                    lead_ms=settings.ptt_lead_ms,
+                    tail_ms=settings.ptt_tail_ms,
+                    timeout_seconds=settings.tx_timeout_seconds,
+                )
+                logger.info(f"✅ {len(batch)} TX envoyées en une émission")
+            except Exception as e:
+                logger.error(f"❌ Erreur TX groupée ({radio.name}): {e}", exc_info=True)
+                self._transition([tx for tx, _, _ in batch], self._mark_failed, e)
+
+            # Pause inter-annonce entre deux émissions groupées
+            if i < len(groups) - 1:
+                pause = settings.inter_announcement_pause_seconds
+                logger.info(f"Pause inter-annonce ({radio.name}): {pause}s")
+                await asyncio.sleep(pause)
 
 
 async def main():
@@ -726,8 +1488,11 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Arrêt du runner (Ctrl+C)")
     finally:
-        if runner.ptt_controller:
+        if runner.arbiter:
+            runner.arbiter.cleanup()  # PTT OFF sur toutes les radios
+        elif runner.ptt_controller:
             runner.ptt_controller.cleanup()
+        await provider_manager.aclose()
         release_pid_lock()
 
 
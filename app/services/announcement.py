@@ -6,14 +6,17 @@ entre les aperçus TTS et les vraies transmissions.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
 from app.models import Channel
 from app.providers import Measurement
+from app.services.channel_config import ChannelConfig
 from app.services.template import TemplateRenderer
 
 
-def prepare_announcement_text(channel: Channel, measurement: Measurement) -> str:
+def prepare_announcement_text(
+    channel: Union[Channel, ChannelConfig], measurement: Measurement
+) -> str:
     """
     Prépare le texte d'annonce pour un canal et une mesure donnés.
 
@@ -22,7 +25,7 @@ def prepare_announcement_text(channel: Channel, measurement: Measurement) -> str
     transmis lors de la vraie annonce.
 
     Args:
-        channel: Canal configuré avec son template
+        channel: Canal configuré avec son template (ou son instantané runner)
         measurement: Mesure météo à annoncer
 
     Returns:
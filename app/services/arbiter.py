@@ -0,0 +1,148 @@
+"""
+Arbitrage des transmissions entre plusieurs radios.
+
+Chaque radio est une paire (contrôleur PTT, device audio) desservant une
+fréquence. Les TX de radios différentes partent en parallèle ; sur une même
+radio elles restent strictement une à la fois, dans l'ordre chronologique.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from app.ptt.controller import PTTController
+from app.services.transmission import TransmissionService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Nom de la radio par défaut (PTT de SystemSettings, sortie audio par défaut)
+DEFAULT_RADIO = "default"
+
+
+def _frequency_key(frequency_mhz: Optional[float]) -> Optional[float]:
+    """Normalise une fréquence pour la comparaison (0 ou None = non assignée)."""
+    if not frequency_mhz:
+        return None
+    return round(frequency_mhz, 4)
+
+
+@dataclass(eq=False)
+class RadioLine:
+    """Une radio physique : PTT + sortie audio, une TX à la fois."""
+
+    name: str
+    transmission: TransmissionService
+    frequency_mhz: Optional[float] = None
+    _lock: Optional[asyncio.Lock] = field(default=None, repr=False)
+
+    @property
+    def ptt(self) -> PTTController:
+        return self.transmission.ptt
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """Verrou de la radio (créé dans la boucle asyncio courante)."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+
+class RadioArbiter:
+    """Répartit les TX sur les radios et les exécute en parallèle par radio."""
+
+    def __init__(self, default: RadioLine):
+        """
+        Args:
+            default: Radio utilisée par les canaux sans radio dédiée
+        """
+        self.default = default
+        self._radios: Dict[str, RadioLine] = {default.name: default}
+        self._by_frequency: Dict[float, RadioLine] = {}
+
+    def __len__(self) -> int:
+        return len(self._radios)
+
+    @property
+    def radios(self) -> List[RadioLine]:
+        return list(self._radios.values())
+
+    def add(self, radio: RadioLine):
+        """
+        Ajoute une radio dédiée à une fréquence.
+
+        Raises:
+            ValueError si le nom ou la fréquence est déjà utilisé
+        """
+        key = _frequency_key(radio.frequency_mhz)
+        if key is None:
+            raise ValueError(f"Radio {radio.name} sans fréquence")
+        if radio.name in self._radios or key in self._by_frequency:
+            raise ValueError(f"Radio {radio.name} ({key} MHz) déjà déclarée")
+
+        self._radios[radio.name] = radio
+        self._by_frequency[key] = radio
+
+    def radio_for(self, frequency_mhz: Optional[float]) -> RadioLine:
+        """Radio d'un canal d'après sa fréquence (radio par défaut sinon)."""
+        return self._by_frequency.get(_frequency_key(frequency_mhz), self.default)
+
+    def assign(
+        self, items: Iterable[T], frequency: Callable[[T], Optional[float]]
+    ) -> Dict[RadioLine, List[T]]:
+        """
+        Répartit des éléments par radio en conservant leur ordre.
+
+        Args:
+            items: Éléments à répartir (ex: TX dues, déjà triées)
+            frequency: Fréquence (MHz) du canal de chaque élément
+        """
+        queues: Dict[RadioLine, List[T]] = {}
+        for item in items:
+            queues.setdefault(self.radio_for(frequency(item)), []).append(item)
+        return queues
+
+    async def run(
+        self,
+        queues: Dict[RadioLine, List[T]],
+        worker: Callable[[RadioLine, List[T]], Awaitable[None]],
+    ):
+        """
+        Exécute une file par radio, toutes les radios en parallèle.
+
+        Le verrou de chaque radio est tenu pendant toute sa file : deux
+        appels concurrents ne peuvent pas émettre sur la même radio.
+
+        Args:
+            queues: Éléments à traiter par radio
+            worker: Coroutine traitant la file d'une radio
+        """
+
+        async def run_radio(radio: RadioLine, items: List[T]):
+            async with radio.lock:
+                await worker(radio, items)
+
+        results = await asyncio.gather(
+            *(run_radio(radio, items) for radio, items in queues.items()),
+            return_exceptions=True,
+        )
+        for radio, result in zip(queues, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Erreur sur la radio {radio.name}: {result}",
+                    exc_info=result,
+                )
+
+    def cleanup(self):
+        """Libère les contrôleurs PTT et les lecteurs audio de toutes les radios."""
+        for radio in self._radios.values():
+            try:
+                radio.ptt.cleanup()
+            except Exception as e:
+                logger.error(f"Erreur nettoyage PTT radio {radio.name}: {e}")
+            try:
+                radio.transmission.close()
+            except Exception as e:
+                logger.error(f"Erreur fermeture audio radio {radio.name}: {e}")
@@ -0,0 +1,268 @@
+"""
+Lecteurs audio pour la transmission.
+
+Deux implémentations :
+- AlsaAudioPlayer (pyalsaaudio) : le device ALSA reste ouvert entre deux TX,
+  le PCM est chargé en mémoire avant le passage en émission et l'écriture
+  démarre immédiatement ; les instants réels de début/fin sont mesurés.
+- SubprocessAudioPlayer : un processus aplay (ou paplay) par TX. Utilisé si
+  pyalsaaudio n'est pas installé ; le démarrage du processus et l'ouverture
+  du device ajoutent un délai variable après PTT ON.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import wave
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import alsaaudio
+except ImportError:
+    alsaaudio = None
+
+from app.exceptions import PTTError
+
+logger = logging.getLogger(__name__)
+
+# Taille d'une période ALSA (frames écrites par appel)
+PERIOD_FRAMES = 1024
+
+
+@dataclass
+class PreparedAudio:
+    """Audio prêt à être joué (PCM en mémoire si le lecteur le permet)."""
+
+    path: str
+    pcm: Optional[bytes] = None
+    rate: int = 0
+    channels: int = 0
+    sample_width: int = 0
+
+    @property
+    def duration_seconds(self) -> float:
+        if not self.pcm or not self.rate:
+            return 0.0
+        return len(self.pcm) / (self.rate * self.channels * self.sample_width)
+
+
+@dataclass
+class PlaybackTiming:
+    """Instants réels de lecture (horloge time.monotonic)."""
+
+    started_at: float
+    ended_at: float
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.ended_at - self.started_at
+
+
+def alsaaudio_available() -> bool:
+    """Indique si pyalsaaudio (lecture en processus) est installé."""
+    return alsaaudio is not None
+
+
+class SubprocessAudioPlayer:
+    """Lecture via aplay (ALSA), repli paplay si aucun device n'est imposé."""
+
+    def __init__(self, device: Optional[str] = None):
+        """
+        Args:
+            device: Device ALSA de sortie (None = device par défaut)
+        """
+        self.device = device
+
+    def prepare(self, audio_path: str) -> PreparedAudio:
+        """Rien à pré-charger : aplay lit le fichier lui-même."""
+        return PreparedAudio(path=audio_path)
+
+    async def play(self, audio: PreparedAudio) -> PlaybackTiming:
+        """
+        Joue le fichier et attend la fin de la lecture.
+
+        Raises:
+            PTTError si la lecture échoue
+        """
+        started_at = time.monotonic()
+
+        # Essayer aplay (ALSA) en premier, sur le device de la radio si défini
+        device_args = ["-D", self.device] if self.device else []
+        proc = await asyncio.create_subprocess_exec(
+            "aplay",
+            *device_args,
+            audio.path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        _, stderr = await proc.communicate()
+
+        if proc.returncode != 0 and self.device:
+            # Pas de repli sur la sortie par défaut : ce serait une autre radio
+            raise PTTError(
+                f"Impossible de jouer l'audio sur {self.device}: {stderr.decode()}"
+            )
+
+        if proc.returncode != 0:
+            # Si aplay échoue, essayer paplay (PulseAudio)
+            logger.warning(f"aplay échoué, tentative avec paplay")
+
+            proc = await asyncio.create_subprocess_exec(
+                "paplay",
+                audio.path,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+
+            _, stderr = await proc.communicate()
+
+            if proc.returncode != 0:
+                raise PTTError(f"Impossible de jouer l'audio: {stderr.decode()}")
+
+        return PlaybackTiming(started_at=started_at, ended_at=time.monotonic())
+
+    def close(self):
+        """Rien à fermer."""
+        pass
+
+
+class AlsaAudioPlayer:
+    """Lecture en processus sur un device ALSA gardé ouvert."""
+
+    _FORMATS = {
+        1: "PCM_FORMAT_U8",
+        2: "PCM_FORMAT_S16_LE",
+        4: "PCM_FORMAT_S32_LE",
+    }
+
+    def __init__(
+        self, device: Optional[str] = None, period_frames: int = PERIOD_FRAMES
+    ):
+        """
+        Args:
+            device: Device ALSA de sortie (None = "default")
+            period_frames: Frames écrites par appel
+        """
+        if alsaaudio is None:
+            raise ImportError(
+                "pyalsaaudio non disponible. "
+                "Installez-le avec: pip install pyalsaaudio "
+                "ou utilisez SubprocessAudioPlayer."
+            )
+
+        self.device = device or "default"
+        self.period_frames = period_frames
+        self._pcm = None
+        self._format = None  # (rate, channels, sample_width) du PCM ouvert
+        self._lock = threading.Lock()
+
+    def _open(self, rate: int, channels: int, sample_width: int):
+        """Ouvre le device, ou le réutilise s'il est déjà au bon format."""
+        fmt = (rate, channels, sample_width)
+        if self._pcm is not None and self._format == fmt:
+            return self._pcm
+
+        if sample_width not in self._FORMATS:
+            raise PTTError(f"Format audio non supporté ({8 * sample_width} bits)")
+
+        self._close_pcm()
+        try:
+            self._pcm = alsaaudio.PCM(
+                alsaaudio.PCM_PLAYBACK,
+                device=self.device,
+                channels=channels,
+                rate=rate,
+                format=getattr(alsaaudio, self._FORMATS[sample_width]),
+                periodsize=self.period_frames,
+            )
+        except alsaaudio.ALSAAudioError as e:
+            raise PTTError(f"Impossible d'ouvrir le device audio {self.device}: {e}")
+
+        self._format = fmt
+        logger.info(
+            f"Device audio {self.device} ouvert ({rate} Hz, {channels} canal/aux, "
+            f"{8 * sample_width} bits)"
+        )
+        return self._pcm
+
+    def prepare(self, audio_path: str) -> PreparedAudio:
+        """
+        Charge le PCM en mémoire et ouvre le device au bon format.
+
+        À appeler avant PTT ON (bloquant : exécuter dans un thread).
+        """
+        try:
+            with wave.open(audio_path, "rb") as wav:
+                audio = PreparedAudio(
+                    path=audio_path,
+                    pcm=wav.readframes(wav.getnframes()),
+                    rate=wav.getframerate(),
+                    channels=wav.getnchannels(),
+                    sample_width=wav.getsampwidth(),
+                )
+        except (wave.Error, EOFError) as e:
+            raise PTTError(f"Fichier audio invalide {audio_path}: {e}")
+
+        with self._lock:
+            self._open(audio.rate, audio.channels, audio.sample_width)
+        return audio
+
+    def _write(self, audio: PreparedAudio) -> PlaybackTiming:
+        """Écrit le PCM période par période puis attend la fin de la lecture."""
+        with self._lock:
+            pcm = self._open(audio.rate, audio.channels, audio.sample_width)
+            chunk = self.period_frames * audio.channels * audio.sample_width
+
+            started_at = time.monotonic()
+            try:
+                for offset in range(0, len(audio.pcm), chunk):
+                    pcm.write(audio.pcm[offset : offset + chunk])
+
+                if hasattr(pcm, "drain"):
+                    pcm.drain()
+            except alsaaudio.ALSAAudioError as e:
+                # Device dans un état inconnu : le rouvrir à la prochaine TX
+                self._close_pcm()
+                raise PTTError(f"Erreur de lecture sur {self.device}: {e}")
+
+        # Sans drain(), les dernières périodes sont encore dans le buffer
+        remaining = started_at + audio.duration_seconds - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+        return PlaybackTiming(started_at=started_at, ended_at=time.monotonic())
+
+    async def play(self, audio: PreparedAudio) -> PlaybackTiming:
+        """
+        Joue un audio préparé par prepare() et attend la fin de la lecture.
+
+        Raises:
+            PTTError si la lecture échoue
+        """
+        if audio.pcm is None:
+            audio = await asyncio.to_thread(self.prepare, audio.path)
+        return await asyncio.to_thread(self._write, audio)
+
+    def _close_pcm(self):
+        if self._pcm is not None:
+            try:
+                self._pcm.close()
+            except Exception as e:
+                logger.warning(f"Erreur fermeture device audio {self.device}: {e}")
+            self._pcm = None
+            self._format = None
+
+    def close(self):
+        """Ferme le device audio."""
+        with self._lock:
+            self._close_pcm()
+
+
+def create_audio_player(device: Optional[str] = None):
+    """Lecteur en processus si pyalsaaudio est installé, aplay sinon."""
+    if alsaaudio_available():
+        return AlsaAudioPlayer(device)
+    return SubprocessAudioPlayer(device)
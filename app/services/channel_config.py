@@ -0,0 +1,163 @@
+"""
+Configuration des canaux figée pour le runner.
+
+Le runner ne manipule plus les objets SQLAlchemy `Channel` dans ses boucles
+(planification, synthèse, TX) : il travaille sur des instantanés immuables,
+détachés de toute session, dont les offsets et les paramètres de voix sont
+déjà décodés. Un instantané n'est reconstruit que si `Channel.updated_at` a
+changé (modification côté web) ; sinon seul le couple (id, updated_at) est
+relu en base.
+"""
+
+import json
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models import Channel
+
+
+class ChannelConfig:
+    """Instantané immuable de la configuration d'un canal."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "is_enabled",
+        "provider_id",
+        "station_id",
+        "frequency_mhz",
+        "measurement_period_seconds",
+        "offsets",
+        "template_text",
+        "engine_id",
+        "voice_id",
+        "voice_params",
+        "voice_params_json",
+        "updated_at",
+    )
+
+    id: int
+    name: str
+    is_enabled: bool
+    provider_id: str
+    station_id: str
+    frequency_mhz: float
+    measurement_period_seconds: int
+    offsets: Tuple[int, ...]
+    template_text: str
+    engine_id: str
+    voice_id: str
+    voice_params: dict  # Partagé entre les TX : copier avant de modifier
+    voice_params_json: str  # Texte brut, entrée du tx_id (idempotence)
+    updated_at: Optional[datetime]
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ChannelConfig est immuable ({name})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"ChannelConfig est immuable ({name})")
+
+    def __repr__(self) -> str:
+        return f"ChannelConfig(id={self.id}, name={self.name!r})"
+
+    @classmethod
+    def from_channel(cls, channel: Channel) -> "ChannelConfig":
+        """Construit l'instantané d'un canal (JSON décodé une fois ici)."""
+        voice_params_json = channel.voice_params_json or "{}"
+        return cls(
+            id=channel.id,
+            name=channel.name,
+            is_enabled=channel.is_enabled,
+            provider_id=channel.provider_id,
+            station_id=channel.station_id,
+            frequency_mhz=channel.frequency_mhz,
+            measurement_period_seconds=channel.measurement_period_seconds,
+            offsets=tuple(json.loads(channel.offsets_seconds_json or "[0]")),
+            template_text=channel.template_text,
+            engine_id=channel.engine_id,
+            voice_id=channel.voice_id,
+            voice_params=json.loads(voice_params_json),
+            voice_params_json=voice_params_json,
+            updated_at=channel.updated_at,
+        )
+
+
+class ChannelConfigCache:
+    """Instantanés par canal, reconstruits quand `updated_at` change."""
+
+    def __init__(self):
+        self._configs: Dict[int, ChannelConfig] = {}
+
+        # Compteurs du processus courant
+        self.hits = 0
+        self.rebuilds = 0
+
+    def __len__(self) -> int:
+        return len(self._configs)
+
+    def get(self, channel: Channel) -> ChannelConfig:
+        """Instantané d'un canal déjà chargé (reconstruit s'il a été modifié)."""
+        config = self._configs.get(channel.id)
+        if config is not None and config.updated_at == channel.updated_at:
+            self.hits += 1
+            return config
+
+        config = ChannelConfig.from_channel(channel)
+        self._configs[channel.id] = config
+        self.rebuilds += 1
+        return config
+
+    def load(self, db: Session, *criteria) -> Dict[int, ChannelConfig]:
+        """
+        Instantanés des canaux correspondant aux critères.
+
+        Seuls (id, updated_at) sont relus ; les lignes complètes ne sont
+        chargées que pour les canaux nouveaux ou modifiés.
+
+        Args:
+            db: Session SQLAlchemy
+            criteria: Filtres sur Channel (ex: Channel.is_enabled.is_(True))
+
+        Returns:
+            Dictionnaire {channel_id: ChannelConfig}, par id croissant
+        """
+        versions = (
+            db.query(Channel.id, Channel.updated_at)
+            .filter(*criteria)
+            .order_by(Channel.id)
+            .all()
+        )
+
+        stale = [
+            channel_id
+            for channel_id, updated_at in versions
+            if channel_id not in self._configs
+            or self._configs[channel_id].updated_at != updated_at
+        ]
+        if stale:
+            for channel in db.query(Channel).filter(Channel.id.in_(stale)):
+                self._configs[channel.id] = ChannelConfig.from_channel(channel)
+            self.rebuilds += len(stale)
+        self.hits += len(versions) - len(stale)
+
+        return {
+            channel_id: self._configs[channel_id]
+            for channel_id, _ in versions
+            if channel_id in self._configs
+        }
+
+    def get_stats(self) -> dict:
+        """Statistiques du cache (processus courant)."""
+        total = self.hits + self.rebuilds
+        return {
+            "channels": len(self._configs),
+            "hits": self.hits,
+            "rebuilds": self.rebuilds,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
@@ -0,0 +1,74 @@
+"""
+Métriques des unités de travail DB du runner.
+
+Chaque unité de travail (session courte autour d'une transition d'état) est
+mesurée : durée totale pendant laquelle la session est ouverte, et durée des
+commits. Sous SQLite, un commit bloqué par un autre écrivain attend jusqu'à
+busy_timeout : la durée des commits mesure donc l'attente du verrou
+d'écriture.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# Au-delà, un commit est compté comme ayant attendu le verrou d'écriture (s)
+SLOW_COMMIT_SECONDS = 0.1
+
+
+@dataclass
+class _LabelStats:
+    count: int = 0
+    held_total: float = 0.0
+    held_max: float = 0.0
+    commit_total: float = 0.0
+    commit_max: float = 0.0
+    slow_commits: int = 0
+    lock_errors: int = 0
+
+
+class UnitOfWorkMetrics:
+    """Durées des sessions et des commits, par type d'unité de travail."""
+
+    def __init__(self):
+        self._stats: Dict[str, _LabelStats] = {}
+
+    def record(self, label: str, held_seconds: float, commit_seconds: float):
+        """Enregistre une unité de travail terminée."""
+        stats = self._stats.setdefault(label, _LabelStats())
+        stats.count += 1
+        stats.held_total += held_seconds
+        stats.held_max = max(stats.held_max, held_seconds)
+        stats.commit_total += commit_seconds
+        stats.commit_max = max(stats.commit_max, commit_seconds)
+        if commit_seconds >= SLOW_COMMIT_SECONDS:
+            stats.slow_commits += 1
+            logger.warning(
+                f"Commit DB lent ({label}) : {commit_seconds * 1000:.0f} ms "
+                "(verrou d'écriture tenu par un autre processus ?)"
+            )
+
+    def record_lock_error(self, label: str):
+        """Enregistre un échec 'database is locked' (busy_timeout dépassé)."""
+        self._stats.setdefault(label, _LabelStats()).lock_errors += 1
+
+    def get_stats(self) -> dict:
+        """Statistiques par type d'unité de travail (durées en ms)."""
+        return {
+            label: {
+                "count": s.count,
+                "avg_held_ms": (
+                    round(s.held_total / s.count * 1000, 1) if s.count else 0.0
+                ),
+                "max_held_ms": round(s.held_max * 1000, 1),
+                "avg_commit_ms": (
+                    round(s.commit_total / s.count * 1000, 1) if s.count else 0.0
+                ),
+                "max_commit_ms": round(s.commit_max * 1000, 1),
+                "slow_commits": s.slow_commits,
+                "lock_errors": s.lock_errors,
+            }
+            for label, s in self._stats.items()
+        }
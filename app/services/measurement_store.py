@@ -0,0 +1,59 @@
+"""
+Cache mémoire des dernières mesures pollées.
+
+Rempli par le polling du runner, lu par la vérification de péremption au
+moment de la TX : plus besoin de rappeler l'API du provider juste avant de
+passer en émission. Un appel direct n'est fait que si la mesure en cache a
+été récupérée il y a trop longtemps (poll en échec, provider en panne...).
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+
+from app.providers import Measurement
+
+
+class MeasurementStore:
+    """Dernière mesure connue par (provider, station), avec date de récupération."""
+
+    def __init__(self, max_age_seconds: float):
+        """
+        Args:
+            max_age_seconds: Au-delà, la mesure en cache n'est plus utilisée
+        """
+        self.max_age_seconds = max_age_seconds
+        self._entries: Dict[Tuple[str, str], Tuple[Measurement, float]] = {}
+
+        # Compteurs du processus courant
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, provider_id: str, station_id: str, measurement: Measurement):
+        """Enregistre la mesure qui vient d'être récupérée."""
+        self._entries[(provider_id, str(station_id))] = (
+            measurement,
+            time.monotonic(),
+        )
+
+    def get(self, provider_id: str, station_id: str) -> Optional[Measurement]:
+        """
+        Retourne la mesure en cache si elle a été récupérée récemment.
+
+        Returns:
+            Measurement, ou None si absente ou récupérée depuis plus de
+            max_age_seconds (un appel direct au provider est alors nécessaire)
+        """
+        entry = self._entries.get((provider_id, str(station_id)))
+        if entry is None or time.monotonic() - entry[1] > self.max_age_seconds:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry[0]
+
+    def clear(self):
+        """Vide le cache."""
+        self._entries.clear()
@@ -0,0 +1,265 @@
+"""
+Rétention de l'historique : archivage compressé des lignes anciennes.
+
+tx_history et audit_log ne gardent en base que les derniers jours. Au-delà,
+les lignes sont déplacées par lots vers des fichiers JSON Lines compressés
+(gzip), un fichier par table et par jour :
+
+    data/archive/<table>/<AAAA-MM>/<AAAA-MM-JJ>.jsonl.gz
+
+Chaque lot est d'abord écrit (et synchronisé sur disque) dans l'archive,
+puis supprimé de la base dans une transaction courte : le verrou d'écriture
+n'est jamais tenu longtemps. Un arrêt entre les deux étapes laisse au pire
+des doublons dans l'archive, ignorés à la lecture. Les pages libérées sont
+ensuite rendues au système de fichiers (incremental_vacuum).
+"""
+
+import gzip
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models import AuditLog, TxHistory
+
+logger = logging.getLogger(__name__)
+
+# Lignes déplacées par transaction
+CHUNK_SIZE = 500
+
+# Compromis taux de compression / CPU du Raspberry Pi
+COMPRESS_LEVEL = 6
+
+
+@dataclass(frozen=True)
+class _ArchivedTable:
+    model: type
+    timestamp: str  # Colonne de date : partitionnement et rétention
+    keep_pending: bool = False  # Les TX PENDING restent toujours en base
+
+
+ARCHIVED_TABLES: Dict[str, _ArchivedTable] = {
+    "tx_history": _ArchivedTable(TxHistory, "created_at", keep_pending=True),
+    "audit_log": _ArchivedTable(AuditLog, "timestamp"),
+}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Type non sérialisable : {type(value).__name__}")
+
+
+class HistoryArchiver:
+    """Archivage par lots et consultation des archives de l'historique."""
+
+    def __init__(
+        self, archive_dir: Optional[Path] = None, chunk_size: int = CHUNK_SIZE
+    ):
+        """
+        Args:
+            archive_dir: Répertoire des archives (défaut: data/archive/)
+            chunk_size: Nombre de lignes déplacées par transaction
+        """
+        if archive_dir is None:
+            from app.database import DATA_DIR
+
+            archive_dir = DATA_DIR / "archive"
+
+        self.archive_dir = Path(archive_dir)
+        self.chunk_size = chunk_size
+
+    def _day_path(self, table: str, day: date) -> Path:
+        return self.archive_dir / table / f"{day:%Y-%m}" / f"{day:%Y-%m-%d}.jsonl.gz"
+
+    def _append(self, table: str, day: date, rows: List[dict]):
+        """Ajoute des lignes à l'archive d'un jour (membre gzip supplémentaire)."""
+        path = self._day_path(table, day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = "".join(
+            json.dumps(row, default=_json_default, ensure_ascii=False) + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+        with open(path, "ab") as raw:
+            with gzip.GzipFile(
+                fileobj=raw, mode="ab", compresslevel=COMPRESS_LEVEL
+            ) as archive:
+                archive.write(data)
+            raw.flush()
+            os.fsync(raw.fileno())
+
+    def archive_table(self, db: Session, table: str, cutoff: datetime) -> int:
+        """
+        Déplace vers l'archive les lignes d'une table antérieures à cutoff.
+
+        Un commit par lot de chunk_size lignes.
+
+        Returns:
+            Nombre de lignes archivées
+        """
+        spec = ARCHIVED_TABLES[table]
+        model_table = spec.model.__table__
+        timestamp = model_table.c[spec.timestamp]
+
+        query = select(model_table).where(timestamp < cutoff)
+        if spec.keep_pending:
+            query = query.where(model_table.c.status != "PENDING")
+        query = query.order_by(timestamp).limit(self.chunk_size)
+
+        archived = 0
+        while True:
+            rows = [dict(row) for row in db.execute(query).mappings()]
+            if not rows:
+                break
+
+            by_day: Dict[date, List[dict]] = {}
+            for row in rows:
+                by_day.setdefault(row[spec.timestamp].date(), []).append(row)
+            for day, day_rows in by_day.items():
+                self._append(table, day, day_rows)
+
+            db.execute(
+                delete(model_table).where(
+                    model_table.c.id.in_([row["id"] for row in rows])
+                )
+            )
+            db.commit()
+            archived += len(rows)
+
+        return archived
+
+    def archive(
+        self, db: Session, retention_days: int, now: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """
+        Archive toutes les tables au-delà de la durée de rétention.
+
+        Args:
+            db: Session SQLAlchemy
+            retention_days: Nombre de jours gardés en base
+            now: Date courante UTC naïve (défaut: maintenant)
+
+        Returns:
+            Nombre de lignes archivées par table
+        """
+        cutoff = (now or datetime.utcnow()) - timedelta(days=retention_days)
+        return {
+            table: self.archive_table(db, table, cutoff) for table in ARCHIVED_TABLES
+        }
+
+    @staticmethod
+    def vacuum(bind: Engine) -> int:
+        """
+        Rend au système de fichiers les pages libérées par l'archivage.
+
+        Sans effet si la base n'est pas en auto_vacuum=INCREMENTAL (bases
+        créées avant ce réglage) : les pages libres sont alors seulement
+        réutilisées par les écritures suivantes.
+
+        Returns:
+            Nombre de pages rendues
+        """
+        connection = bind.raw_connection()
+        try:
+            sqlite = connection.driver_connection
+
+            def freelist() -> int:
+                return sqlite.execute("PRAGMA freelist_count").fetchone()[0]
+
+            if sqlite.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                return 0
+
+            before = freelist()
+            if before:
+                # executescript exécute le pragma jusqu'au bout (une page par
+                # étape) ; puis le checkpoint tronque réellement le fichier
+                sqlite.executescript(
+                    "PRAGMA incremental_vacuum; PRAGMA wal_checkpoint(TRUNCATE);"
+                )
+            return before - freelist()
+        finally:
+            connection.close()
+
+    def list_ranges(self) -> Dict[str, dict]:
+        """
+        Jours archivés par table.
+
+        Returns:
+            {table: {"first_date", "last_date", "days", "size_bytes"}}
+        """
+        ranges = {}
+        for table in ARCHIVED_TABLES:
+            files = sorted((self.archive_dir / table).glob("*/*.jsonl.gz"))
+            days = [path.name[: -len(".jsonl.gz")] for path in files]
+            ranges[table] = {
+                "first_date": days[0] if days else None,
+                "last_date": days[-1] if days else None,
+                "days": len(days),
+                "size_bytes": sum(path.stat().st_size for path in files),
+            }
+        return ranges
+
+    def query(
+        self,
+        table: str,
+        start: date,
+        end: date,
+        filters: Optional[dict] = None,
+        limit: int = 100,
+    ) -> List[dict]:
+        """
+        Lit les lignes archivées entre deux jours (inclus).
+
+        Args:
+            table: tx_history ou audit_log
+            start: Premier jour
+            end: Dernier jour
+            filters: Égalités à respecter (ex: {"status": "SENT"})
+            limit: Nombre max de lignes retournées
+
+        Returns:
+            Lignes dans l'ordre chronologique (dates en ISO 8601)
+
+        Raises:
+            ValueError si la table n'est pas archivée
+        """
+        if table not in ARCHIVED_TABLES:
+            raise ValueError(f"Table non archivée : {table}")
+        filters = {
+            key: value for key, value in (filters or {}).items() if value is not None
+        }
+
+        results: List[dict] = []
+        seen = set()
+        day = start
+        while day <= end and len(results) < limit:
+            path = self._day_path(table, day)
+            day += timedelta(days=1)
+            if not path.exists():
+                continue
+
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as archive:
+                    for line in archive:
+                        row = json.loads(line)
+                        # Doublons possibles après un arrêt pendant l'archivage
+                        if row["id"] in seen:
+                            continue
+                        seen.add(row["id"])
+                        if all(row.get(key) == value for key, value in filters.items()):
+                            results.append(row)
+                            if len(results) >= limit:
+                                break
+            except (EOFError, gzip.BadGzipFile) as e:
+                # Lot en cours d'écriture par le runner : lignes déjà lues gardées
+                logger.warning(f"Archive {path.name} incomplète : {e}")
+
+        return results
@@ -0,0 +1,55 @@
+"""
+Statistiques du runner publiées pour l'application web.
+
+Le runner et l'application web sont deux processus : le runner écrit
+périodiquement un instantané JSON de ses métriques (par radio), remplacé
+atomiquement, que /api/status relit tel quel.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+STATS_FILENAME = "runner_stats.json"
+
+
+def stats_path() -> Path:
+    """Chemin de l'instantané (data/runner_stats.json)."""
+    from app.database import DATA_DIR
+
+    return DATA_DIR / STATS_FILENAME
+
+
+def write_runner_stats(radios: dict):
+    """
+    Publie les métriques du runner (écriture atomique).
+
+    Args:
+        radios: Métriques par nom de radio
+    """
+    path = stats_path()
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    snapshot = {"updated_at": datetime.utcnow().isoformat() + "Z", "radios": radios}
+    try:
+        tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Publication des statistiques impossible : {e}")
+
+
+def read_runner_stats() -> Optional[dict]:
+    """
+    Dernier instantané publié par le runner.
+
+    Returns:
+        {"updated_at", "radios"}, ou None si absent ou illisible
+    """
+    try:
+        return json.loads(stats_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,224 @@
+"""
+Ordonnanceur des transmissions PENDING.
+
+Garde en mémoire un tas (heap) des TX PENDING trié par planned_at.
+Le runner dort exactement jusqu'à la prochaine échéance (ou jusqu'à ce
+qu'on le réveille) au lieu de relire tx_history toutes les secondes.
+
+La DB reste la source de vérité : le tas n'est qu'un index des échéances,
+chaque TX est relue (status == PENDING) juste avant exécution.
+
+Un second index, par canal, garde toutes les TX encore PENDING (y compris
+celles sorties du tas et en cours d'exécution) pour calculer next_tx_at
+sans requête.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import TxHistory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(order=True)
+class ScheduledTx:
+    """Entrée du tas : une TX PENDING et son échéance (UTC naïf)."""
+
+    planned_at: datetime
+    seq: int
+    tx_id: str = field(compare=False)
+    channel_id: int = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+
+class TxScheduler:
+    """Tas d'échéances des TX PENDING avec réveil événementiel."""
+
+    def __init__(self):
+        self._heap: List[ScheduledTx] = []
+        self._entries: Dict[str, ScheduledTx] = {}
+        # TX PENDING par canal : {channel_id: {tx_id: planned_at}}
+        self._pending: Dict[int, Dict[str, datetime]] = {}
+        self._counter = itertools.count()
+        self._changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, tx_id: str) -> bool:
+        return tx_id in self._entries
+
+    def schedule(self, tx_id: str, channel_id: int, planned_at: datetime):
+        """
+        Ajoute (ou replanifie) une TX PENDING.
+
+        Args:
+            tx_id: Identifiant de la TX
+            channel_id: ID du canal
+            planned_at: Échéance en UTC naïf
+        """
+        existing = self._entries.get(tx_id)
+        if existing is not None:
+            if existing.planned_at == planned_at:
+                return
+            existing.cancelled = True
+
+        entry = ScheduledTx(
+            planned_at=planned_at,
+            seq=next(self._counter),
+            tx_id=tx_id,
+            channel_id=channel_id,
+        )
+        self._entries[tx_id] = entry
+        self._pending.setdefault(channel_id, {})[tx_id] = planned_at
+        heapq.heappush(self._heap, entry)
+        self.notify()
+
+    def cancel(self, tx_id: str) -> bool:
+        """
+        Retire une TX du tas (suppression paresseuse).
+
+        Returns:
+            True si la TX était planifiée
+        """
+        entry = self._entries.pop(tx_id, None)
+        if entry is None:
+            return False
+        entry.cancelled = True
+        self.resolve(tx_id, entry.channel_id)
+        return True
+
+    def resolve(self, tx_id: str, channel_id: int):
+        """
+        Retire une TX de l'index des PENDING (passée SENT/FAILED/ABORTED).
+
+        Args:
+            tx_id: Identifiant de la TX
+            channel_id: ID du canal
+        """
+        pending = self._pending.get(channel_id)
+        if pending is not None:
+            pending.pop(tx_id, None)
+            if not pending:
+                del self._pending[channel_id]
+
+    def next_for_channel(self, channel_id: int) -> Optional[datetime]:
+        """Retourne le planned_at de la prochaine TX PENDING du canal, ou None."""
+        pending = self._pending.get(channel_id)
+        return min(pending.values()) if pending else None
+
+    def cancel_channel(self, channel_id: int) -> List[str]:
+        """
+        Retire toutes les TX d'un canal.
+
+        Returns:
+            Liste des tx_id retirés
+        """
+        tx_ids = list(self._pending.pop(channel_id, {}))
+        for tx_id in tx_ids:
+            self.cancel(tx_id)
+        return tx_ids
+
+    def clear(self):
+        """Vide le tas."""
+        self._heap.clear()
+        self._entries.clear()
+        self._pending.clear()
+
+    def load_pending(self, db: Session) -> int:
+        """
+        Resynchronise le tas depuis les TX PENDING de la DB.
+
+        Returns:
+            Nombre de TX planifiées
+        """
+        rows = (
+            db.query(TxHistory.tx_id, TxHistory.channel_id, TxHistory.planned_at)
+            .filter(TxHistory.status == "PENDING")
+            .all()
+        )
+
+        self.clear()
+        for tx_id, channel_id, planned_at in rows:
+            entry = ScheduledTx(
+                planned_at=planned_at,
+                seq=next(self._counter),
+                tx_id=tx_id,
+                channel_id=channel_id,
+            )
+            self._entries[tx_id] = entry
+            self._pending.setdefault(channel_id, {})[tx_id] = planned_at
+            self._heap.append(entry)
+        heapq.heapify(self._heap)
+        self.notify()
+
+        return len(self._entries)
+
+    def next_deadline(self) -> Optional[datetime]:
+        """Retourne la prochaine échéance, ou None si le tas est vide."""
+        while self._heap and self._heap[0].cancelled:
+            heapq.heappop(self._heap)
+        return self._heap[0].planned_at if self._heap else None
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[ScheduledTx]:
+        """
+        Extrait toutes les TX dont planned_at <= now, dans l'ordre chronologique.
+
+        Les TX extraites restent dans l'index des PENDING jusqu'à resolve().
+
+        Args:
+            now: Instant de référence (UTC naïf, défaut: maintenant)
+        """
+        if now is None:
+            now = datetime.utcnow()
+
+        due = []
+        while self._heap and self._heap[0].planned_at <= now:
+            entry = heapq.heappop(self._heap)
+            if entry.cancelled:
+                continue
+            del self._entries[entry.tx_id]
+            due.append(entry)
+        return due
+
+    def notify(self):
+        """Réveille la boucle qui attend dans wait()."""
+        self._changed.set()
+
+    async def wait(self, until: Optional[datetime] = None) -> bool:
+        """
+        Dort jusqu'à la prochaine échéance, jusqu'à `until`, ou jusqu'à notify().
+
+        Args:
+            until: Borne de réveil supplémentaire (ex: prochain poll), UTC naïf
+
+        Returns:
+            True si réveillé par notify(), False si une échéance est atteinte
+        """
+        deadline = self.next_deadline()
+        if until is not None and (deadline is None or until < deadline):
+            deadline = until
+
+        if self._changed.is_set():
+            self._changed.clear()
+            return True
+
+        timeout = None
+        if deadline is not None:
+            timeout = max(0.0, (deadline - datetime.utcnow()).total_seconds())
+
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        self._changed.clear()
+        return True
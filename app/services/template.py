@@ -5,7 +5,7 @@ Gère les variables {station_name}, {wind_avg_kmh}, {wind_direction_cardinal}, e
 """
 
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import pytz
 
@@ -197,3 +197,39 @@ class TemplateRenderer:
             Ensemble de noms de variables
         """
         return set(re.findall(r"\{(\w+)\}", template))
+
+    def split_segments(self, template: str, rendered_text: str) -> Optional[List[str]]:
+        """
+        Découpe un texte rendu en segments (texte fixe / valeurs de variables).
+
+        Les segments servent à la synthèse concaténative : chaque segment
+        (« Vent moyen », « 12 », « Nord-Este »...) est synthétisé une seule
+        fois par voix puis réutilisé. Le découpage part du template, le texte
+        rendu n'est donc jamais modifié. Les segments sans lettre ni chiffre
+        (ponctuation seule) sont ignorés et la ponctuation en tête est retirée.
+
+        Args:
+            template: Template du canal
+            rendered_text: Texte produit par render() avec ce template
+
+        Returns:
+            Liste des segments, ou None si le texte ne correspond pas au template
+        """
+        parts = re.split(r"\{\w+\}", template)
+        pattern = "(.+?)".join(re.escape(part) for part in parts)
+        match = re.fullmatch(pattern, rendered_text, flags=re.DOTALL)
+        if not match:
+            return None
+
+        pieces = []
+        for i, literal in enumerate(parts):
+            pieces.append(literal)
+            if i < len(match.groups()):
+                pieces.append(match.group(i + 1))
+
+        # La ponctuation en tête appartient à la fin du segment précédent
+        return [
+            piece.strip().lstrip(",;:.!? ")
+            for piece in pieces
+            if any(char.isalnum() for char in piece)
+        ]
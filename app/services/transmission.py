@@ -5,14 +5,16 @@ Gère la séquence complète de transmission radio.
 """
 
 import asyncio
-import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 import logging
 
-from app.exceptions import PTTError
 from app.ptt.controller import PTTController
+from app.ptt.watchdog import PTTWatchdog
+from app.services.audio_player import PlaybackTiming, PreparedAudio, create_audio_player
+from app.services.tx_lock import TransmitLock
 
 logger = logging.getLogger(__name__)
 
@@ -20,15 +22,35 @@ logger = logging.getLogger(__name__)
 class TransmissionService:
     """Service de transmission radio."""
 
-    def __init__(self, ptt_controller: PTTController):
+    def __init__(
+        self,
+        ptt_controller: PTTController,
+        audio_device: Optional[str] = None,
+        tx_lock: Optional[TransmitLock] = None,
+        player=None,
+    ):
         """
         Initialise le service de transmission.
 
         Args:
             ptt_controller: Contrôleur PTT
+            audio_device: Device ALSA de sortie (None = device par défaut)
+            tx_lock: Verrou TX de la radio (défaut: radio "default"),
+                partagé avec les autres processus
+            player: Lecteur audio (défaut: en processus si pyalsaaudio est
+                installé, aplay sinon)
         """
         self.ptt = ptt_controller
-        self._tx_lock = threading.Lock()  # Verrou global TX
+        self.audio_device = audio_device
+        self._tx_lock = tx_lock or TransmitLock()  # Verrou TX de cette radio
+        self.player = player or create_audio_player(audio_device)
+
+        # Watchdog dans un thread dédié : coupe le PTT même si la boucle
+        # asyncio est bloquée
+        self.watchdog = PTTWatchdog(ptt_controller, name=self._tx_lock.name)
+
+        # Mesures de la dernière TX (lead/tail réels, durée audio)
+        self.last_timing: Optional[dict] = None
 
     async def transmit(
         self,
@@ -40,61 +62,94 @@ class TransmissionService:
         """
         Effectue une transmission complète (PTT + audio).
 
+        Voir transmit_sequence() (une seule annonce).
+
+        Raises:
+            PTTError si le verrou TX n'est pas obtenu à temps ou si la lecture
+                audio échoue (levée par le verrou et le lecteur audio)
+            FileNotFoundError si audio absent
+            TimeoutError si timeout dépassé
+        """
+        await self.transmit_sequence(
+            [audio_path],
+            lead_ms=lead_ms,
+            tail_ms=tail_ms,
+            timeout_seconds=timeout_seconds,
+        )
+
+    async def transmit_sequence(
+        self,
+        audio_paths: List[str],
+        gap_ms: int = 0,
+        lead_ms: int = 500,
+        tail_ms: int = 500,
+        timeout_seconds: int = 30,
+    ):
+        """
+        Émet une ou plusieurs annonces sous un seul passage en émission.
+
         Séquence:
-        1. Acquérir verrou TX global
+        1. Acquérir verrou TX de la radio (FIFO, inter-processus)
+           et pré-charger les audios
         2. PTT ON
         3. Attendre lead_ms
-        4. Jouer audio
+        4. Jouer les audios, séparés par gap_ms de silence
         5. Attendre tail_ms
         6. PTT OFF
         7. Libérer verrou
 
-        Le watchdog garantit PTT OFF après timeout_seconds max.
+        Le watchdog garantit PTT OFF après timeout_seconds max, pour
+        l'ensemble de la séquence.
 
         Args:
-            audio_path: Chemin du fichier audio à jouer
+            audio_paths: Chemins des fichiers audio à jouer, dans l'ordre
+            gap_ms: Silence entre deux annonces (ms)
             lead_ms: Délai avant audio (ms)
             tail_ms: Délai après audio (ms)
             timeout_seconds: Timeout max pour toute la TX
 
         Raises:
-            PTTError en cas d'erreur PTT
+            PTTError si le verrou TX n'est pas obtenu à temps ou si la lecture
+                audio échoue (levée par le verrou et le lecteur audio)
             FileNotFoundError si audio absent
             TimeoutError si timeout dépassé
         """
-        # Vérifier que le fichier audio existe
-        if not Path(audio_path).exists():
-            raise FileNotFoundError(f"Fichier audio introuvable: {audio_path}")
+        # Vérifier que les fichiers audio existent
+        for audio_path in audio_paths:
+            if not Path(audio_path).exists():
+                raise FileNotFoundError(f"Fichier audio introuvable: {audio_path}")
 
-        # Acquérir le verrou TX global (bloquant)
-        logger.info(f"Acquisition du verrou TX pour {audio_path}")
-        acquired = self._tx_lock.acquire(timeout=timeout_seconds)
-
-        if not acquired:
-            raise PTTError(
-                f"Impossible d'acquérir le verrou TX (timeout {timeout_seconds}s)"
-            )
+        # Acquérir le verrou TX (attente asyncio, PTTError si timeout)
+        logger.info(f"Acquisition du verrou TX pour {', '.join(audio_paths)}")
+        await self._tx_lock.acquire(timeout=timeout_seconds)
 
         try:
-            logger.info(f"Début transmission: {audio_path}")
-            start_time = datetime.utcnow()
+            # Pré-charger les audios avant PTT ON (lecture, ouverture du device)
+            audios = [
+                await asyncio.to_thread(self.player.prepare, audio_path)
+                for audio_path in audio_paths
+            ]
 
-            # Démarrer le watchdog
-            watchdog_task = asyncio.create_task(
-                self._watchdog(timeout_seconds, start_time)
-            )
+            logger.info(f"Début transmission: {', '.join(audio_paths)}")
+            start_time = datetime.utcnow()
+            timings = []
 
             try:
                 # 1. PTT ON
+                self.watchdog.arm(timeout_seconds)
                 self.ptt.set_ptt(True)
+                ptt_on_at = time.monotonic()
                 logger.debug(f"PTT ON")
 
                 # 2. Lead delay
                 await asyncio.sleep(lead_ms / 1000.0)
 
-                # 3. Jouer l'audio
-                logger.debug(f"Lecture audio: {audio_path}")
-                await self._play_audio(audio_path)
+                # 3. Jouer les audios
+                for i, audio in enumerate(audios):
+                    if i > 0:
+                        await asyncio.sleep(gap_ms / 1000.0)
+                    logger.debug(f"Lecture audio: {audio.path}")
+                    timings.append(await self._play_audio(audio))
 
                 # 4. Tail delay
                 await asyncio.sleep(tail_ms / 1000.0)
@@ -102,76 +157,55 @@ class TransmissionService:
             finally:
                 # 5. PTT OFF (toujours exécuté)
                 self.ptt.set_ptt(False)
+                ptt_off_at = time.monotonic()
                 logger.debug(f"PTT OFF")
 
-                # Annuler le watchdog
-                watchdog_task.cancel()
-                try:
-                    await watchdog_task
-                except asyncio.CancelledError:
-                    pass
+                # Désarmer le watchdog
+                self.watchdog.disarm()
 
             duration = (datetime.utcnow() - start_time).total_seconds()
-            logger.info(f"Transmission terminée en {duration:.2f}s")
+            logger.info(
+                f"Transmission terminée en {duration:.2f}s "
+                f"({len(audios)} annonce(s))"
+            )
+
+            if timings and all(isinstance(t, PlaybackTiming) for t in timings):
+                self.last_timing = {
+                    "lead_ms": round((timings[0].started_at - ptt_on_at) * 1000),
+                    "audio_seconds": round(sum(t.duration_seconds for t in timings), 3),
+                    "tail_ms": round((ptt_off_at - timings[-1].ended_at) * 1000),
+                }
+                logger.info(
+                    f"Lead réel {self.last_timing['lead_ms']} ms, "
+                    f"tail réel {self.last_timing['tail_ms']} ms"
+                )
 
         finally:
             # Libérer le verrou TX
             self._tx_lock.release()
             logger.debug("Verrou TX libéré")
 
-    async def _watchdog(self, timeout_seconds: int, start_time: datetime):
-        """
-        Watchdog qui force PTT OFF après timeout.
+    def get_lock_stats(self) -> dict:
+        """Métriques d'attente du verrou TX de cette radio."""
+        return self._tx_lock.get_stats()
 
-        Args:
-            timeout_seconds: Timeout en secondes
-            start_time: Heure de début de TX
-        """
-        await asyncio.sleep(timeout_seconds)
+    def get_watchdog_stats(self) -> dict:
+        """Coupures forcées par le watchdog et temps de réaction."""
+        return self.watchdog.get_stats()
 
-        # Si on arrive ici, c'est que le timeout a été atteint
-        logger.error(
-            f"WATCHDOG: Timeout de {timeout_seconds}s atteint, forçage PTT OFF"
-        )
-        try:
-            self.ptt.set_ptt(False)
-        except Exception as e:
-            logger.critical(f"WATCHDOG: Impossible de forcer PTT OFF: {e}")
-
-    async def _play_audio(self, audio_path: str):
+    async def _play_audio(self, audio: PreparedAudio) -> PlaybackTiming:
         """
-        Joue un fichier audio.
-
-        Utilise aplay (ALSA) ou paplay (PulseAudio) selon disponibilité.
+        Joue un audio pré-chargé et attend la fin de la lecture.
 
         Args:
-            audio_path: Chemin du fichier audio
-        """
-        # Détecter quel outil utiliser
-        # TODO: permettre sélection du device audio via config
-
-        # Essayer aplay (ALSA) en premier
-        proc = await asyncio.create_subprocess_exec(
-            "aplay",
-            audio_path,
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
-        _, stderr = await proc.communicate()
+            audio: Audio préparé par le lecteur
 
-        if proc.returncode != 0:
-            # Si aplay échoue, essayer paplay (PulseAudio)
-            logger.warning(f"aplay échoué, tentative avec paplay")
-
-            proc = await asyncio.create_subprocess_exec(
-                "paplay",
-                audio_path,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            _, stderr = await proc.communicate()
+        Returns:
+            Instants réels de début et de fin de lecture
+        """
+        return await self.player.play(audio)
 
-            if proc.returncode != 0:
-                raise PTTError(f"Impossible de jouer l'audio: {stderr.decode()}")
+    def close(self):
+        """Arrête le watchdog et libère le lecteur audio (device ALSA)."""
+        self.watchdog.stop()
+        self.player.close()
@@ -0,0 +1,169 @@
+"""
+Verrou d'émission asyncio, partagé entre processus.
+
+Le runner et l'application web (test manuel) ne doivent jamais passer en
+émission en même temps sur une même radio. Le verrou combine :
+- un ticket (fichier horodaté) par demandeur : l'ordre des tickets donne un
+  ordre d'accès FIFO, entre coroutines comme entre processus ;
+- un flock sur un fichier de verrou : l'exclusion est garantie par le noyau
+  et libérée automatiquement si le processus meurt.
+
+L'attente se fait par petites pauses asyncio : la boucle (watchdog, polling)
+n'est jamais bloquée.
+"""
+
+import asyncio
+import fcntl
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from app.exceptions import PTTError
+
+logger = logging.getLogger(__name__)
+
+# Intervalle entre deux tentatives d'acquisition (s)
+POLL_INTERVAL_SECONDS = 0.02
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+class TransmitLock:
+    """Verrou FIFO inter-processus pour une radio, avec métriques d'attente."""
+
+    def __init__(self, name: str = "default", lock_dir: Optional[Path] = None):
+        """
+        Args:
+            name: Nom de la radio protégée
+            lock_dir: Répertoire des verrous (défaut: data/locks/)
+        """
+        if lock_dir is None:
+            from app.database import DATA_DIR
+
+            lock_dir = DATA_DIR / "locks"
+
+        self.name = name
+        self._ticket_dir = Path(lock_dir) / f"tx_{name}.queue"
+        self._lock_path = Path(lock_dir) / f"tx_{name}.lock"
+        self._fd: Optional[int] = None
+
+        # Métriques d'attente (processus courant)
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.last_wait_seconds = 0.0
+
+    @property
+    def locked(self) -> bool:
+        """Indique si ce processus détient le verrou via cette instance."""
+        return self._fd is not None
+
+    def _is_first(self, ticket: str) -> bool:
+        """Vrai si `ticket` est le plus ancien ticket vivant de la file."""
+        for name in sorted(os.listdir(self._ticket_dir)):
+            if name == ticket:
+                return True
+            # Ticket d'un processus mort : le retirer de la file
+            try:
+                pid = int(name.split("-")[1])
+            except (IndexError, ValueError):
+                pid = None
+            if pid is not None and pid != os.getpid() and not _pid_alive(pid):
+                (self._ticket_dir / name).unlink(missing_ok=True)
+                continue
+            return False
+        return False
+
+    def _try_flock(self) -> bool:
+        # Nouveau descripteur à chaque tentative : le flock exclut aussi les
+        # coroutines de ce processus tant que le détenteur n'a pas libéré
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    async def acquire(self, timeout: float) -> float:
+        """
+        Attend son tour (FIFO) puis prend le verrou.
+
+        Plusieurs coroutines peuvent attendre sur la même instance : chacune a
+        son ticket, et le flock (un descripteur par tentative) n'est accordé
+        qu'à une seule à la fois, y compris dans ce processus. Le détenteur
+        appelle release().
+
+        Args:
+            timeout: Attente max (s)
+
+        Returns:
+            Durée d'attente (s)
+
+        Raises:
+            PTTError si le verrou n'est pas obtenu dans le délai
+        """
+        self._ticket_dir.mkdir(parents=True, exist_ok=True)
+        start = time.monotonic()
+        deadline = start + timeout
+        ticket = f"{time.time_ns():020d}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        ticket_path = self._ticket_dir / ticket
+        ticket_path.touch()
+
+        try:
+            while not (self._is_first(ticket) and self._try_flock()):
+                if time.monotonic() >= deadline:
+                    self.timeouts += 1
+                    raise PTTError(
+                        f"Impossible d'acquérir le verrou TX {self.name} "
+                        f"(timeout {timeout}s)"
+                    )
+                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+        finally:
+            ticket_path.unlink(missing_ok=True)
+
+        waited = time.monotonic() - start
+        self.acquisitions += 1
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        self.last_wait_seconds = waited
+        if waited >= 1.0:
+            logger.info(f"Verrou TX {self.name} obtenu après {waited:.2f}s d'attente")
+        return waited
+
+    def release(self):
+        """Libère le verrou (appelé par la coroutine qui le détient)."""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def get_stats(self) -> dict:
+        """Métriques d'attente du verrou."""
+        return {
+            "acquisitions": self.acquisitions,
+            "timeouts": self.timeouts,
+            "avg_wait_seconds": (
+                round(self.total_wait_seconds / self.acquisitions, 3)
+                if self.acquisitions
+                else 0.0
+            ),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+            "last_wait_seconds": round(self.last_wait_seconds, 3),
+        }
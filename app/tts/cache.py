@@ -4,14 +4,30 @@ Service de cache TTS.
 Gère le cache des fichiers audio synthétisés.
 """
 
+import logging
+import os
+import uuid
 from pathlib import Path
 from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from app.models import AudioCache
+from app.models import AudioCache, AudioCacheStats, TxHistory
 from app.utils import compute_hash
 
+logger = logging.getLogger(__name__)
+
+# Quota disque du cache audio (octets)
+AUDIO_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Âge max d'un fichier non réutilisé (jours)
+AUDIO_CACHE_MAX_AGE_DAYS = 30
+
+# Délai de grâce des fichiers hors index (écriture possiblement en cours)
+UNTRACKED_GRACE_SECONDS = 600
+
 
 class TTSCacheService:
     """Service de gestion du cache audio."""
@@ -31,6 +47,10 @@ class TTSCacheService:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # Compteurs du processus courant
+        self.hits = 0
+        self.misses = 0
+
     def compute_cache_key(
         self,
         engine_id: str,
@@ -74,21 +94,42 @@ class TTSCacheService:
             # Vérifier que le fichier existe toujours
             audio_path = Path(cache_entry.audio_path)
             if audio_path.exists():
-                # Mettre à jour last_used_at
+                # Mettre à jour last_used_at et le compteur de hits persistant
                 cache_entry.last_used_at = datetime.utcnow()
+                self._count(db, hits=1)
                 db.commit()
+                self.hits += 1
                 return str(audio_path)
             else:
                 # Fichier supprimé, nettoyer l'entrée DB
                 db.delete(cache_entry)
-                db.commit()
 
+        self._count(db, misses=1)
+        db.commit()
+        self.misses += 1
         return None
 
+    def _count(self, db: Session, hits: int = 0, misses: int = 0):
+        """Incrémente les compteurs persistants (upsert de la row id=1)."""
+        statement = insert(AudioCacheStats).values(id=1, hits=hits, misses=misses)
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[AudioCacheStats.id],
+                set_={
+                    "hits": AudioCacheStats.hits + hits,
+                    "misses": AudioCacheStats.misses + misses,
+                },
+            )
+        )
+
     def store_audio(self, db: Session, cache_key: str, audio_path: str, meta: dict):
         """
         Stocke un audio dans le cache.
 
+        Upsert sur tts_cache_key : si un autre processus (ou une autre tâche)
+        a déjà indexé la même clé entre la recherche et la synthèse, l'entrée
+        existante est réutilisée et seul last_used_at est rafraîchi.
+
         Args:
             db: Session DB
             cache_key: Clé de cache
@@ -100,17 +141,26 @@ class TTSCacheService:
         if not path.exists():
             raise FileNotFoundError(f"Fichier audio introuvable: {audio_path}")
 
-        # Créer l'entrée de cache
-        cache_entry = AudioCache(
+        now = datetime.utcnow()
+        size_bytes = path.stat().st_size
+        statement = insert(AudioCache).values(
             tts_cache_key=cache_key,
             audio_path=str(audio_path),
-            size_bytes=path.stat().st_size,
+            size_bytes=size_bytes,
             meta_json=meta,
-            created_at=datetime.utcnow(),
-            last_used_at=datetime.utcnow(),
+            created_at=now,
+            last_used_at=now,
+        )
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[AudioCache.tts_cache_key],
+                set_={
+                    "audio_path": statement.excluded.audio_path,
+                    "size_bytes": statement.excluded.size_bytes,
+                    "last_used_at": statement.excluded.last_used_at,
+                },
+            )
         )
-
-        db.add(cache_entry)
         db.commit()
 
     def generate_audio_filename(self, cache_key: str) -> Path:
@@ -121,3 +171,146 @@ class TTSCacheService:
             Chemin complet du fichier audio
         """
         return self.cache_dir / f"{cache_key}.wav"
+
+    def generate_temp_filename(self, cache_key: str) -> Path:
+        """
+        Génère un nom de fichier temporaire unique pour une synthèse.
+
+        La synthèse écrit dans ce fichier, ensuite renommé (os.replace) vers
+        generate_audio_filename : deux synthèses concurrentes de la même clé
+        ne produisent jamais de fichier à moitié écrit.
+
+        Returns:
+            Chemin complet du fichier temporaire (ignoré par le nettoyage *.wav)
+        """
+        return self.cache_dir / f"{cache_key}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+
+    def get_stats(self, db: Optional[Session] = None) -> dict:
+        """
+        Statistiques du cache.
+
+        Args:
+            db: Session DB (optionnelle) pour inclure le contenu du cache
+
+        Returns:
+            Hits/misses du processus courant et, si db fourni, nombre
+            d'entrées, taille totale et hits/misses cumulés (tous processus)
+        """
+        lookups = self.hits + self.misses
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+        if db is not None:
+            entries, total_size = db.query(
+                func.count(AudioCache.id),
+                func.coalesce(func.sum(AudioCache.size_bytes), 0),
+            ).one()
+            counters = db.get(AudioCacheStats, 1)
+            stats.update(
+                {
+                    "entries": entries,
+                    "total_size_bytes": total_size,
+                    "total_hits": counters.hits if counters else 0,
+                    "total_misses": counters.misses if counters else 0,
+                }
+            )
+
+        return stats
+
+    def collect_garbage(
+        self,
+        db: Session,
+        max_bytes: int = AUDIO_CACHE_MAX_BYTES,
+        max_age_days: float = AUDIO_CACHE_MAX_AGE_DAYS,
+        now: Optional[datetime] = None,
+    ) -> dict:
+        """
+        Supprime les fichiers audio les moins récemment utilisés.
+
+        Supprime d'abord les fichiers plus vieux que max_age_days, puis, si le
+        cache dépasse max_bytes, les plus anciens (LRU) jusqu'à repasser sous
+        le quota. Les entrées AudioCache utilisent last_used_at/size_bytes ;
+        les fichiers hors index (tx_*.wav, preview_*.wav, segments/*.wav) leur
+        date de modification. Les fichiers référencés par une TX PENDING ne sont
+        jamais supprimés.
+
+        Args:
+            db: Session DB
+            max_bytes: Taille max du cache (octets)
+            max_age_days: Âge max depuis la dernière utilisation (jours)
+            now: Date courante UTC naïve (défaut: maintenant)
+
+        Returns:
+            Fichiers supprimés, octets récupérés, octets restants
+        """
+        now = now or datetime.utcnow()
+        age_limit = now - timedelta(days=max_age_days)
+
+        protected = {
+            str(Path(path))
+            for (path,) in db.query(TxHistory.audio_path).filter(
+                TxHistory.status == "PENDING", TxHistory.audio_path.isnot(None)
+            )
+        }
+
+        # (dernière utilisation, taille, chemin, entrée DB ou None)
+        candidates = []
+        tracked = set()
+        for entry in db.query(AudioCache).all():
+            path = Path(entry.audio_path)
+            tracked.add(str(path))
+            if not path.exists():
+                # Fichier déjà disparu : l'entrée ne sert plus à rien
+                db.delete(entry)
+                continue
+            candidates.append((entry.last_used_at, entry.size_bytes, path, entry))
+
+        grace_limit = now - timedelta(seconds=UNTRACKED_GRACE_SECONDS)
+        # rglob : inclut les segments de SegmentSynthesizer (segments/)
+        for path in self.cache_dir.rglob("*.wav"):
+            if str(path) in tracked:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            modified_at = datetime.utcfromtimestamp(stat.st_mtime)
+            if modified_at > grace_limit:
+                continue
+            candidates.append((modified_at, stat.st_size, path, None))
+
+        candidates.sort(key=lambda c: c[0])
+        total_bytes = sum(c[1] for c in candidates)
+        deleted = 0
+        reclaimed = 0
+
+        for last_used_at, size, path, entry in candidates:
+            if last_used_at >= age_limit and total_bytes <= max_bytes:
+                break
+            if str(path) in protected:
+                continue
+
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Suppression impossible de {path}: {e}")
+                continue
+
+            if entry is not None:
+                db.delete(entry)
+            total_bytes -= size
+            reclaimed += size
+            deleted += 1
+
+        db.commit()
+
+        return {
+            "files_deleted": deleted,
+            "bytes_reclaimed": reclaimed,
+            "bytes_remaining": total_bytes,
+        }
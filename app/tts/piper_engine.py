@@ -4,9 +4,14 @@ Moteur TTS Piper.
 Synthèse vocale hors ligne avec Piper (https://github.com/rhasspy/piper).
 """
 
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, Iterable, List, Dict, Optional
 import json
+import logging
+import threading
+import time
 import wave
 
 try:
@@ -17,16 +22,35 @@ except ImportError:
 from app.tts import TTSEngine, Voice
 from app.exceptions import TTSError
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _LoadedVoice:
+    """Voix Piper chargée en mémoire (session ONNX prête)."""
+
+    voice: Any
+    model_mtime: float
+    size_bytes: int
+    last_used: float
+
 
 class PiperEngine(TTSEngine):
     """Moteur TTS utilisant Piper."""
 
-    def __init__(self, models_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        models_dir: Optional[Path] = None,
+        memory_budget_bytes: int = 256 * 1024 * 1024,
+        idle_unload_seconds: float = 3600,
+    ):
         """
         Initialise le moteur Piper.
 
         Args:
             models_dir: Répertoire contenant les modèles .onnx (défaut: data/tts_models/)
+            memory_budget_bytes: Taille cumulée max des modèles gardés chargés
+            idle_unload_seconds: Décharge une voix inutilisée depuis ce délai
         """
         if models_dir is None:
             from app.database import DATA_DIR
@@ -39,6 +63,15 @@ class PiperEngine(TTSEngine):
         # Découvrir les voix disponibles
         self._voices = self._discover_voices()
 
+        # Cache LRU des voix chargées (clé voice_id, invalidé si mtime change)
+        self.memory_budget_bytes = memory_budget_bytes
+        self.idle_unload_seconds = idle_unload_seconds
+        self._loaded: "OrderedDict[str, _LoadedVoice]" = OrderedDict()
+        self._loaded_lock = threading.Lock()
+        # Un verrou par voix : un chargement (plusieurs secondes) ne bloque
+        # ni les autres voix, ni preload/unload_idle, et n'a lieu qu'une fois
+        self._loading_locks: Dict[str, threading.Lock] = {}
+
     @property
     def engine_id(self) -> str:
         return "piper"
@@ -116,26 +149,15 @@ class PiperEngine(TTSEngine):
         Synthétise un texte avec Piper (API Python).
 
         Utilise piper-tts avec synthesize_wav() qui nécessite un objet wave.
+        Le modèle reste chargé entre deux synthèses (cache LRU des voix).
         """
         if PiperVoice is None:
             raise TTSError(
                 "piper-tts n'est pas installé. Installez avec: pip install piper-tts"
             )
 
-        # Vérifier que la voix existe
-        model_file = f"{voice_id}.onnx"
-        model_path = self.models_dir / model_file
-        config_path = self.models_dir / f"{voice_id}.onnx.json"
-
-        if not model_path.exists():
-            raise TTSError(f"Modèle Piper non trouvé: {model_path}")
-
-        if not config_path.exists():
-            raise TTSError(f"Config Piper non trouvée: {config_path}")
-
         try:
-            # Charger le modèle
-            voice = PiperVoice.load(str(model_path), config_path=str(config_path))
+            voice = self._get_voice(voice_id)
 
             # Synthétiser dans un fichier WAV
             with wave.open(output_path, "wb") as wav_file:
@@ -147,9 +169,130 @@ class PiperEngine(TTSEngine):
 
             return output_path
 
+        except TTSError:
+            raise
         except Exception as e:
             raise TTSError(f"Erreur lors de la synthèse Piper: {e}")
 
+    def _get_voice(self, voice_id: str):
+        """
+        Retourne la voix chargée, depuis le cache LRU ou en chargeant le modèle.
+
+        Raises:
+            TTSError si le modèle ou sa config sont absents
+        """
+        model_path = self.models_dir / f"{voice_id}.onnx"
+        config_path = self.models_dir / f"{voice_id}.onnx.json"
+
+        if not model_path.exists():
+            raise TTSError(f"Modèle Piper non trouvé: {model_path}")
+
+        if not config_path.exists():
+            raise TTSError(f"Config Piper non trouvée: {config_path}")
+
+        stat = model_path.stat()
+
+        with self._loaded_lock:
+            self._unload_idle_locked()
+            voice = self._cached_voice_locked(voice_id, stat.st_mtime)
+            if voice is not None:
+                return voice
+            loading_lock = self._loading_locks.setdefault(voice_id, threading.Lock())
+
+        # Chargement hors de _loaded_lock, un seul à la fois pour cette voix
+        with loading_lock:
+            with self._loaded_lock:
+                # Chargée par un autre thread pendant l'attente
+                voice = self._cached_voice_locked(voice_id, stat.st_mtime)
+                if voice is not None:
+                    return voice
+
+            # Absente ou modèle remplacé sur disque : (re)charger
+            start = time.monotonic()
+            voice = PiperVoice.load(str(model_path), config_path=str(config_path))
+            logger.info(
+                f"Voix Piper {voice_id} chargée en {time.monotonic() - start:.2f}s"
+            )
+
+            with self._loaded_lock:
+                self._loaded[voice_id] = _LoadedVoice(
+                    voice=voice,
+                    model_mtime=stat.st_mtime,
+                    size_bytes=stat.st_size,
+                    last_used=time.monotonic(),
+                )
+                self._loaded.move_to_end(voice_id)
+                self._evict_over_budget_locked()
+
+            return voice
+
+    def _cached_voice_locked(self, voice_id: str, model_mtime: float):
+        """Voix chargée à jour (même mtime) marquée utilisée, sinon None."""
+        entry = self._loaded.get(voice_id)
+        if entry is None or entry.model_mtime != model_mtime:
+            return None
+        entry.last_used = time.monotonic()
+        self._loaded.move_to_end(voice_id)
+        return entry.voice
+
+    def _evict_over_budget_locked(self):
+        """Décharge les voix les moins récemment utilisées au-delà du budget."""
+        total = sum(entry.size_bytes for entry in self._loaded.values())
+        # On garde toujours au moins la voix la plus récente
+        while total > self.memory_budget_bytes and len(self._loaded) > 1:
+            voice_id, entry = self._loaded.popitem(last=False)
+            total -= entry.size_bytes
+            logger.info(f"Voix Piper {voice_id} déchargée (budget mémoire)")
+
+    def _unload_idle_locked(self) -> int:
+        """Décharge les voix inutilisées depuis idle_unload_seconds."""
+        cutoff = time.monotonic() - self.idle_unload_seconds
+        idle = [
+            voice_id
+            for voice_id, entry in self._loaded.items()
+            if entry.last_used < cutoff
+        ]
+        for voice_id in idle:
+            del self._loaded[voice_id]
+            logger.info(f"Voix Piper {voice_id} déchargée (inactive)")
+        return len(idle)
+
+    def unload_idle(self) -> int:
+        """
+        Décharge les voix inactives.
+
+        Returns:
+            Nombre de voix déchargées
+        """
+        with self._loaded_lock:
+            return self._unload_idle_locked()
+
+    def preload(self, voice_ids: Iterable[str]) -> List[str]:
+        """
+        Précharge des voix (ex: celles des canaux actifs).
+
+        Les voix absentes ou en erreur sont ignorées (journalisées).
+
+        Returns:
+            Liste des voix effectivement chargées
+        """
+        if PiperVoice is None:
+            return []
+
+        loaded = []
+        for voice_id in voice_ids:
+            try:
+                self._get_voice(voice_id)
+                loaded.append(voice_id)
+            except Exception as e:
+                logger.warning(f"Préchargement de la voix {voice_id} impossible: {e}")
+        return loaded
+
+    def loaded_voices(self) -> List[str]:
+        """Voix actuellement chargées, de la moins à la plus récemment utilisée."""
+        with self._loaded_lock:
+            return list(self._loaded)
+
     def get_model_version(self, voice_id: str) -> str:
         """
         Retourne la version du modèle.
@@ -0,0 +1,195 @@
+"""
+Synthèse concaténative par segments.
+
+Les annonces sont construites à partir d'un vocabulaire réduit (nom de
+station, entiers, directions, texte fixe du template). Chaque segment est
+synthétisé une seule fois par voix, débarrassé de ses silences de bord et
+mis en cache ; l'annonce finale est assemblée échantillon par échantillon
+avec un court fondu enchaîné. Piper n'est appelé que pour les segments
+jamais vus.
+"""
+
+import logging
+import os
+import sys
+import uuid
+import wave
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.exceptions import TTSError
+from app.tts import TTSEngine
+from app.utils import compute_hash
+
+logger = logging.getLogger(__name__)
+
+# Durée du fondu enchaîné entre deux segments (ms)
+CROSSFADE_MS = 15
+
+# Silence conservé de part et d'autre d'un segment après découpe (ms)
+EDGE_PADDING_MS = 40
+
+# Amplitude (PCM 16 bits) en dessous de laquelle un échantillon est du silence
+SILENCE_THRESHOLD = 300
+
+
+def _read_samples(path: Path) -> Tuple[tuple, array]:
+    """Lit un WAV PCM 16 bits mono : (paramètres, échantillons)."""
+    with wave.open(str(path), "rb") as wav:
+        params = (wav.getnchannels(), wav.getsampwidth(), wav.getframerate())
+        frames = wav.readframes(wav.getnframes())
+
+    if params[0] != 1 or params[1] != 2:
+        raise TTSError(f"Segment non supporté (mono 16 bits requis) : {path}")
+
+    samples = array("h", frames)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return params, samples
+
+
+def _write_samples(path: Path, params: tuple, samples: array):
+    """Écrit un WAV PCM 16 bits mono."""
+    if sys.byteorder == "big":
+        samples = array("h", samples)
+        samples.byteswap()
+
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(params[0])
+        wav.setsampwidth(params[1])
+        wav.setframerate(params[2])
+        wav.writeframes(samples.tobytes())
+
+
+def trim_silence(samples: array, padding: int) -> array:
+    """Retire le silence en début et fin, en gardant `padding` échantillons."""
+    start = 0
+    while start < len(samples) and abs(samples[start]) < SILENCE_THRESHOLD:
+        start += 1
+    if start == len(samples):
+        return array("h")
+
+    end = len(samples)
+    while abs(samples[end - 1]) < SILENCE_THRESHOLD:
+        end -= 1
+
+    return samples[max(0, start - padding) : min(len(samples), end + padding)]
+
+
+def crossfade_join(chunks: List[array], overlap: int) -> array:
+    """Concatène des segments avec un fondu enchaîné linéaire de `overlap`."""
+    output = array("h")
+    for chunk in chunks:
+        n = min(overlap, len(output), len(chunk))
+        base = len(output) - n
+        for i in range(n):
+            weight = (i + 1) / (n + 1)
+            output[base + i] = int(output[base + i] * (1 - weight) + chunk[i] * weight)
+        output.extend(chunk[n:])
+    return output
+
+
+class SegmentSynthesizer:
+    """Assemble l'audio d'une annonce à partir de segments en cache."""
+
+    def __init__(self, engine: TTSEngine, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            engine: Moteur TTS utilisé pour les segments manquants
+            cache_dir: Répertoire des segments (défaut: data/audio_cache/segments/)
+        """
+        if cache_dir is None:
+            from app.database import DATA_DIR
+
+            cache_dir = DATA_DIR / "audio_cache" / "segments"
+
+        self.engine = engine
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Compteurs du processus courant
+        self.hits = 0
+        self.misses = 0
+
+    def segment_path(self, text: str, voice_id: str, params: Dict) -> Path:
+        """Chemin du fichier d'un segment (clé : moteur, modèle, voix, texte)."""
+        key = compute_hash(
+            self.engine.engine_id,
+            self.engine.engine_version,
+            self.engine.get_model_version(voice_id),
+            voice_id,
+            params,
+            text,
+        )
+        return self.cache_dir / f"{key}.wav"
+
+    def _get_segment(self, text: str, voice_id: str, params: Dict) -> Path:
+        """Retourne le segment depuis le cache, en le synthétisant si absent."""
+        path = self.segment_path(text, voice_id, params)
+        if path.exists():
+            self.hits += 1
+            try:
+                # mtime = dernière utilisation, pour le GC du cache audio
+                os.utime(path)
+            except FileNotFoundError:
+                pass  # Évincé entre-temps : resynthétisé à la prochaine annonce
+            return path
+
+        self.misses += 1
+        # Nom temporaire unique : plusieurs threads peuvent synthétiser le
+        # même segment en parallèle (même schéma que TTSCacheService)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.engine.synthesize(text, voice_id, str(tmp_path), params)
+            audio_params, samples = _read_samples(tmp_path)
+            padding = audio_params[2] * EDGE_PADDING_MS // 1000
+            _write_samples(tmp_path, audio_params, trim_silence(samples, padding))
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        logger.debug(f"Segment synthétisé : '{text}' → {path.name}")
+        return path
+
+    def synthesize(
+        self,
+        segments: List[str],
+        voice_id: str,
+        output_path: str,
+        params: Optional[Dict] = None,
+    ) -> str:
+        """
+        Produit le WAV d'une annonce à partir de ses segments.
+
+        Args:
+            segments: Segments de texte (voir TemplateRenderer.split_segments)
+            voice_id: ID de la voix
+            output_path: Chemin du WAV à produire
+            params: Paramètres de voix
+
+        Returns:
+            Chemin du fichier audio généré
+
+        Raises:
+            TTSError si un segment ne peut être synthétisé ou assemblé
+        """
+        params = params or {}
+        if not segments:
+            raise TTSError("Aucun segment à synthétiser")
+
+        audio_params = None
+        chunks = []
+        for text in segments:
+            seg_params, samples = _read_samples(
+                self._get_segment(text, voice_id, params)
+            )
+            if audio_params is None:
+                audio_params = seg_params
+            elif seg_params != audio_params:
+                raise TTSError(f"Format audio incohérent pour le segment '{text}'")
+            chunks.append(samples)
+
+        overlap = audio_params[2] * CROSSFADE_MS // 1000
+        _write_samples(Path(output_path), audio_params, crossfade_join(chunks, overlap))
+        return output_path
@@ -50,6 +50,7 @@ apt-get install -y \
     python3-dev \
     build-essential \
     alsa-utils \
+    sqlite3 \
     wget
 
 echo ""
@@ -1,5 +1,10 @@
 """Fixtures pytest communes."""
 
+import time
+import wave
+from array import array
+from contextlib import contextmanager
+
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -18,3 +23,65 @@ def db_session():
     yield session
 
     session.close()
+
+
+@pytest.fixture
+def runner_db(tmp_path, monkeypatch):
+    """
+    Base SQLite fichier (tmp_path/test.db) branchée sur le runner.
+
+    Chaque unité de travail du runner ouvre sa propre session, comme en
+    production. Retourne la fabrique de sessions (gestionnaire de contexte)
+    à utiliser aussi dans le test.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    @contextmanager
+    def session():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr("app.runner.get_db_session", session)
+    yield session
+    engine.dispose()
+
+
+class FakeTTSEngine:
+    """Moteur TTS factice : un ton par caractère, entouré de 100 ms de silence.
+
+    Enregistre les textes synthétisés ; delay simule la durée de synthèse.
+    """
+
+    engine_id = "fake"
+    engine_version = "1.0"
+
+    def __init__(self, rate=16000, delay=0.0):
+        self.rate = rate
+        self.delay = delay
+        self.calls = []
+
+    def get_model_version(self, voice_id):
+        return "v1"
+
+    def synthesize(self, text, voice_id, output_path, params=None):
+        time.sleep(self.delay)
+        self.calls.append(text)
+        silence = [0] * (self.rate // 10)
+        samples = array("h", silence + [1000] * (len(text) * 10) + silence)
+        with wave.open(output_path, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.rate)
+            wav.writeframes(samples.tobytes())
+        return output_path
+
+
+@pytest.fixture
+def fake_engine():
+    """Moteur TTS factice (voir FakeTTSEngine)."""
+    return FakeTTSEngine()
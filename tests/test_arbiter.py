@@ -0,0 +1,87 @@
+"""Tests de l'arbitrage des transmissions entre radios."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.ptt.controller import MockPTTController
+from app.services.arbiter import RadioArbiter, RadioLine
+from app.services.transmission import TransmissionService
+from app.services.tx_lock import TransmitLock
+
+
+def _radio(lock_dir, name, frequency=None):
+    return RadioLine(
+        name=name,
+        frequency_mhz=frequency,
+        transmission=TransmissionService(
+            MockPTTController(), tx_lock=TransmitLock(name, lock_dir=lock_dir)
+        ),
+    )
+
+
+def test_assign_by_frequency(tmp_path):
+    """Les canaux vont sur la radio de leur fréquence, sinon la radio par défaut."""
+    arbiter = RadioArbiter(_radio(tmp_path, "default"))
+    club = _radio(tmp_path, "club", 143.9875)
+    arbiter.add(club)
+
+    queues = arbiter.assign(
+        [("a", 143.9875), ("b", 0.0), ("c", 143.98750001), ("d", 144.5)],
+        lambda item: item[1],
+    )
+
+    assert [item[0] for item in queues[club]] == ["a", "c"]
+    assert [item[0] for item in queues[arbiter.default]] == ["b", "d"]
+
+    with pytest.raises(ValueError):
+        arbiter.add(_radio(tmp_path, "doublon", 143.9875))
+
+
+@pytest.mark.asyncio
+async def test_radios_in_parallel_sequential_within_radio(tmp_path):
+    """Deux radios émettent en même temps, une TX à la fois par radio."""
+    arbiter = RadioArbiter(_radio(tmp_path, "default"))
+    arbiter.add(_radio(tmp_path, "club", 143.9875))
+    events = []
+
+    async def worker(radio, items):
+        for item in items:
+            events.append((radio.name, "start", item))
+            await asyncio.sleep(0.1)
+            events.append((radio.name, "end", item))
+
+    queues = arbiter.assign(
+        [("a", None), ("b", 143.9875), ("c", None), ("d", 143.9875)],
+        lambda item: item[1],
+    )
+
+    start = time.monotonic()
+    await arbiter.run(queues, worker)
+    elapsed = time.monotonic() - start
+
+    # 2 TX par radio, radios en parallèle : ~0.2 s au lieu de 0.4 s
+    assert elapsed < 0.35
+    for name in ("default", "club"):
+        radio_events = [(kind, item[0]) for r, kind, item in events if r == name]
+        assert [kind for kind, _ in radio_events] == ["start", "end"] * 2
+
+
+@pytest.mark.asyncio
+async def test_radio_error_isolated(tmp_path):
+    """Une erreur sur une radio n'interrompt pas les autres."""
+    arbiter = RadioArbiter(_radio(tmp_path, "default"))
+    club = _radio(tmp_path, "club", 143.9875)
+    arbiter.add(club)
+    done = []
+
+    async def worker(radio, items):
+        if radio is club:
+            raise RuntimeError("carte son absente")
+        await asyncio.sleep(0.01)
+        done.extend(items)
+
+    await arbiter.run({club: ["x"], arbiter.default: ["y"]}, worker)
+
+    assert done == ["y"]
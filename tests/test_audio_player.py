@@ -0,0 +1,122 @@
+"""Tests des lecteurs audio (device gardé ouvert, timings réels)."""
+
+import time
+import types
+import wave
+
+import pytest
+
+from app.ptt.controller import MockPTTController
+from app.services import audio_player
+from app.services.audio_player import AlsaAudioPlayer, PlaybackTiming
+from app.services.transmission import TransmissionService
+from app.services.tx_lock import TransmitLock
+
+
+class FakePCM:
+    """PCM ALSA simulé : enregistre les écritures."""
+
+    opened = []
+
+    def __init__(self, kind, device, channels, rate, format, periodsize):
+        self.device = device
+        self.rate = rate
+        self.written = b""
+        self.closed = False
+        FakePCM.opened.append(self)
+
+    def write(self, data):
+        self.written += data
+        return len(data)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_alsa(monkeypatch):
+    FakePCM.opened = []
+    module = types.SimpleNamespace(
+        PCM=FakePCM,
+        PCM_PLAYBACK=0,
+        PCM_FORMAT_U8=1,
+        PCM_FORMAT_S16_LE=2,
+        PCM_FORMAT_S32_LE=3,
+        ALSAAudioError=OSError,
+    )
+    monkeypatch.setattr(audio_player, "alsaaudio", module)
+    return module
+
+
+def _write_wav(path, rate=16000, frames=1600):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\x01\x00" * frames)
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_device_kept_open_between_plays(tmp_path, fake_alsa):
+    """Le device n'est ouvert qu'une fois tant que le format ne change pas."""
+    player = AlsaAudioPlayer("plughw:1,0")
+    first = _write_wav(tmp_path / "a.wav")
+    second = _write_wav(tmp_path / "b.wav")
+
+    for path in (first, second):
+        audio = player.prepare(path)
+        timing = await player.play(audio)
+        # Sans drain(), la fin de lecture suit la durée du PCM (100 ms)
+        assert timing.duration_seconds >= 0.1
+
+    assert len(FakePCM.opened) == 1
+    assert FakePCM.opened[0].device == "plughw:1,0"
+    assert len(FakePCM.opened[0].written) == 2 * 1600 * 2
+
+    # Changement de fréquence d'échantillonnage : réouverture
+    await player.play(player.prepare(_write_wav(tmp_path / "c.wav", rate=22050)))
+    assert len(FakePCM.opened) == 2
+    assert FakePCM.opened[0].closed
+
+    player.close()
+    assert FakePCM.opened[1].closed
+
+
+def test_prepare_opens_device_before_ptt(tmp_path, fake_alsa):
+    """prepare() charge le PCM et ouvre le device (rien à faire après PTT ON)."""
+    player = AlsaAudioPlayer()
+    audio = player.prepare(_write_wav(tmp_path / "a.wav"))
+
+    assert len(audio.pcm) == 1600 * 2
+    assert audio.duration_seconds == pytest.approx(0.1)
+    assert len(FakePCM.opened) == 1
+
+
+@pytest.mark.asyncio
+async def test_transmission_reports_real_lead_and_tail(tmp_path):
+    """La TX mesure le lead/tail réels autour de la lecture."""
+
+    class InstantPlayer:
+        def prepare(self, path):
+            return audio_player.PreparedAudio(path=path)
+
+        async def play(self, audio):
+            now = time.monotonic()
+            return PlaybackTiming(started_at=now, ended_at=now)
+
+        def close(self):
+            pass
+
+    service = TransmissionService(
+        MockPTTController(),
+        tx_lock=TransmitLock(lock_dir=tmp_path),
+        player=InstantPlayer(),
+    )
+    await service.transmit(
+        _write_wav(tmp_path / "a.wav"), lead_ms=50, tail_ms=30, timeout_seconds=5
+    )
+
+    assert service.last_timing["lead_ms"] >= 50
+    assert service.last_timing["tail_ms"] >= 30
+    assert service.last_timing["lead_ms"] < 200
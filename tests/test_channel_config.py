@@ -0,0 +1,68 @@
+"""Tests des instantanés de configuration des canaux (runner)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models import Channel
+from app.services.channel_config import ChannelConfig, ChannelConfigCache
+
+
+def _channel(db_session, **fields) -> Channel:
+    channel = Channel(
+        name="Test",
+        provider_id="ffvl",
+        station_id="67",
+        template_text="Vent {wind_avg_kmh}",
+        offsets_seconds_json="[0, 600, 1200]",
+        voice_params_json='{"speed": 1.1}',
+        is_enabled=True,
+        **fields,
+    )
+    db_session.add(channel)
+    db_session.commit()
+    return channel
+
+
+def test_snapshot_decoded_and_immutable(db_session):
+    """Offsets en tuple, paramètres de voix en dict, aucune modification possible."""
+    config = ChannelConfig.from_channel(_channel(db_session))
+
+    assert config.offsets == (0, 600, 1200)
+    assert config.voice_params == {"speed": 1.1}
+    assert config.voice_params_json == '{"speed": 1.1}'
+    with pytest.raises(AttributeError):
+        config.name = "Autre"
+    with pytest.raises(AttributeError):
+        config.extra = 1  # __slots__ : pas de __dict__
+
+
+def test_rebuilt_only_when_updated_at_changes(db_session):
+    """Canal inchangé : seul (id, updated_at) est relu, sans reconstruction."""
+    channel = _channel(db_session)
+    cache = ChannelConfigCache()
+
+    first = cache.load(db_session, Channel.is_enabled.is_(True))[channel.id]
+
+    statements = []
+    event.listen(
+        db_session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    again = cache.load(db_session, Channel.is_enabled.is_(True))[channel.id]
+    assert again is first
+    assert len(statements) == 1
+    assert cache.get_stats()["rebuilds"] == 1
+
+    # Modification côté web : updated_at change, instantané reconstruit
+    channel.offsets_seconds_json = "[0]"
+    channel.updated_at = datetime.utcnow() + timedelta(seconds=1)
+    db_session.commit()
+
+    updated = cache.load(db_session, Channel.is_enabled.is_(True))[channel.id]
+    assert updated is not first
+    assert updated.offsets == (0,)
+    assert cache.get(channel) is updated
+    assert cache.get_stats()["rebuilds"] == 2
@@ -0,0 +1,54 @@
+"""Tests de la configuration SQLite (WAL, pragmas, pool)."""
+
+import threading
+
+from sqlalchemy import text
+
+from app.database import create_db_engine
+
+
+def test_pragmas_applied_on_connect(tmp_path):
+    """Chaque connexion du pool est en WAL avec les pragmas réglés."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'test.db'}")
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -8000
+        assert conn.execute(text("PRAGMA auto_vacuum")).scalar() == 2  # Base neuve
+
+
+def test_connections_reused(tmp_path):
+    """Le pool réutilise la connexion au lieu d'en ouvrir une par session."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'test.db'}")
+
+    with engine.connect() as conn:
+        first = conn.connection.dbapi_connection
+    with engine.connect() as conn:
+        assert conn.connection.dbapi_connection is first
+
+
+def test_reader_not_blocked_by_writer(tmp_path):
+    """En WAL, une lecture aboutit pendant une transaction d'écriture ouverte."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    results = []
+    with engine.connect() as writer:
+        writer.execute(text("BEGIN IMMEDIATE"))
+        writer.execute(text("INSERT INTO t VALUES (2)"))
+
+        def read():
+            with engine.connect() as reader:
+                results.append(reader.execute(text("SELECT COUNT(*) FROM t")).scalar())
+
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join(timeout=2)
+        writer.execute(text("COMMIT"))
+
+    # Lecture immédiate de l'état validé, sans attendre le busy_timeout
+    assert results == [1]
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 
 from app.ptt.controller import MockPTTController
 from app.services.transmission import TransmissionService
+from app.services.tx_lock import TransmitLock
 from app.utils import is_measurement_expired
 
 
@@ -42,10 +43,10 @@ async def test_ptt_controller_mock():
 
 
 @pytest.mark.asyncio
-async def test_transmission_service_basic():
+async def test_transmission_service_basic(tmp_path):
     """Teste le service de transmission de base."""
     ptt = MockPTTController()
-    tx_service = TransmissionService(ptt)
+    tx_service = TransmissionService(ptt, tx_lock=TransmitLock(lock_dir=tmp_path))
 
     # Créer un fichier audio temporaire pour le test
     import tempfile
@@ -72,10 +73,10 @@ async def test_transmission_service_basic():
 
 
 @pytest.mark.asyncio
-async def test_no_tx_on_missing_audio():
+async def test_no_tx_on_missing_audio(tmp_path):
     """Vérifie qu'aucune émission ne part si l'audio est manquant."""
     ptt = MockPTTController()
-    tx_service = TransmissionService(ptt)
+    tx_service = TransmissionService(ptt, tx_lock=TransmitLock(lock_dir=tmp_path))
 
     # Essayer de transmettre avec un fichier inexistant
     with pytest.raises(FileNotFoundError):
@@ -91,10 +92,10 @@ async def test_no_tx_on_missing_audio():
 
 
 @pytest.mark.asyncio
-async def test_watchdog_timeout():
+async def test_watchdog_timeout(tmp_path):
     """Teste que le watchdog force PTT OFF après timeout."""
     ptt = MockPTTController()
-    tx_service = TransmissionService(ptt)
+    tx_service = TransmissionService(ptt, tx_lock=TransmitLock(lock_dir=tmp_path))
 
     import tempfile
     import os
@@ -0,0 +1,122 @@
+"""Tests du fetch bulk concurrent FFVL."""
+
+import asyncio
+import time
+import httpx
+import pytest
+
+from app.providers.ffvl import FFVLProvider
+from app.providers.manager import ProviderManager
+
+
+def _mock_client_factory(handler):
+    """Remplace httpx.AsyncClient par un client sur MockTransport."""
+    real_client = httpx.AsyncClient
+
+    def factory(*args, **kwargs):
+        kwargs.pop("transport", None)
+        return real_client(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+    return factory
+
+
+@pytest.fixture
+def ffvl_server(monkeypatch):
+    """Serveur FFVL simulé : 100 ms par requête, station 13 en erreur 500."""
+    stats = {"in_flight": 0, "max_in_flight": 0, "calls": 0}
+
+    async def handler(request):
+        stats["calls"] += 1
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        try:
+            await asyncio.sleep(0.1)
+        finally:
+            stats["in_flight"] -= 1
+
+        station_id = request.url.params["idbalise"]
+        if station_id == "13":
+            return httpx.Response(500)
+        return httpx.Response(
+            200,
+            json=[
+                {
+                    "idbalise": station_id,
+                    "date": "2025-06-01 14:00:00",
+                    "vitesseVentMoy": "20",
+                    "vitesseVentMax": "30",
+                }
+            ],
+        )
+
+    monkeypatch.setattr(
+        "app.providers.ffvl.httpx.AsyncClient", _mock_client_factory(handler)
+    )
+    return stats
+
+
+@pytest.mark.asyncio
+async def test_bulk_is_concurrent_and_bounded(ffvl_server):
+    """15 stations en ~4 vagues de 100 ms, jamais plus de max_concurrency."""
+    provider = FFVLProvider(max_concurrency=4, min_request_interval=0)
+    provider.set_credentials({"api_key": "test"})
+    station_ids = [str(i) for i in range(15)]
+
+    start = time.monotonic()
+    results = await provider.fetch_measurements_bulk(station_ids)
+    elapsed = time.monotonic() - start
+
+    assert ffvl_server["max_in_flight"] <= 4
+    assert ffvl_server["calls"] == 15
+    assert elapsed < 1.0
+    assert set(results) == set(station_ids)
+
+
+@pytest.mark.asyncio
+async def test_bulk_errors_isolated(ffvl_server):
+    """Une station en erreur n'efface pas les résultats des autres."""
+    provider = FFVLProvider(max_concurrency=4, min_request_interval=0)
+    provider.set_credentials({"api_key": "test"})
+
+    results = await provider.fetch_measurements_bulk(["12", "13", "14"])
+
+    assert results["13"] is None
+    assert results["12"].wind_avg_kmh == 20.0
+    assert results["14"].wind_max_kmh == 30.0
+
+
+@pytest.mark.asyncio
+async def test_bulk_rate_limited(ffvl_server):
+    """Le rate limiter espace les démarrages de requêtes."""
+    provider = FFVLProvider(max_concurrency=10, min_request_interval=0.05)
+    provider.set_credentials({"api_key": "test"})
+
+    start = time.monotonic()
+    await provider.fetch_measurements_bulk([str(i) for i in range(5)])
+
+    # 5 requêtes espacées de 50 ms : la dernière démarre à ~200 ms
+    assert time.monotonic() - start >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_default_settings_fit_latency_goal(ffvl_server):
+    """Réglages par défaut : 15 stations en à peine plus de deux requêtes."""
+    provider = FFVLProvider()
+    provider.set_credentials({"api_key": "test"})
+
+    start = time.monotonic()
+    await provider.fetch_measurements_bulk([str(i) for i in range(15)])
+
+    # 14 x 50 ms d'espacement + 100 ms pour la dernière requête
+    assert time.monotonic() - start < 1.2
+
+
+def test_manager_settings_from_environment(monkeypatch):
+    """Le gestionnaire applique les réglages VHF_FFVL_* au provider."""
+    monkeypatch.setattr("app.providers.manager.FFVL_MAX_CONCURRENCY", 2)
+    monkeypatch.setattr("app.providers.manager.FFVL_MIN_REQUEST_INTERVAL", 0.5)
+
+    provider = ProviderManager().get_provider("ffvl")
+
+    assert provider.max_concurrency == 2
+    assert provider._rate_limiter.min_interval == 0.5
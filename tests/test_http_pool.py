@@ -0,0 +1,134 @@
+"""Tests des clients HTTP partagés des providers (keep-alive, cache DNS)."""
+
+import asyncio
+import httpx
+import pytest
+
+from app.providers.http import (
+    CachingDNSBackend,
+    _install_dns_cache,
+    create_http_client,
+)
+from app.providers.manager import ProviderManager
+
+
+@pytest.fixture
+async def http_server():
+    """Serveur HTTP/1.1 keep-alive minimal qui compte les connexions TCP."""
+    stats = {"connections": 0, "requests": 0}
+
+    async def handle(reader, writer):
+        stats["connections"] += 1
+        try:
+            while True:
+                headers = await reader.readuntil(b"\r\n\r\n")
+                if not headers:
+                    break
+                stats["requests"] += 1
+                body = b'{"ok": true}'
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://localhost:{port}", stats
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_reuses_connection(http_server):
+    """Plusieurs requêtes successives réutilisent la même connexion TCP."""
+    url, stats = http_server
+    client = create_http_client(http2=False)
+
+    try:
+        for _ in range(5):
+            response = await client.get(url)
+            assert response.json() == {"ok": True}
+    finally:
+        await client.aclose()
+
+    assert stats["requests"] == 5
+    assert stats["connections"] == 1
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_installed():
+    """
+    Le cache DNS est bien branché sur le pool httpcore.
+
+    Échoue si une mise à jour de httpx/httpcore renomme l'attribut privé
+    `_pool._network_backend` : le cache serait alors désactivé silencieusement
+    (simple avertissement dans les logs).
+    """
+    client = create_http_client(http2=False)
+    try:
+        assert isinstance(client._transport._pool._network_backend, CachingDNSBackend)
+    finally:
+        await client.aclose()
+
+
+def test_dns_cache_skipped_without_backend(caplog):
+    """Attribut privé absent : avertissement et client sans cache DNS."""
+
+    class Transport(httpx.AsyncBaseTransport):
+        pass
+
+    assert _install_dns_cache(Transport()) is False
+    assert "Cache DNS désactivé" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_dns_cache(monkeypatch):
+    """Une seule résolution DNS tant que l'entrée est valide."""
+    backend = CachingDNSBackend(ttl_seconds=60)
+    loop = asyncio.get_running_loop()
+    calls = []
+    real_getaddrinfo = loop.getaddrinfo
+
+    async def counting_getaddrinfo(host, port, **kwargs):
+        calls.append(host)
+        return await real_getaddrinfo(host, port, **kwargs)
+
+    monkeypatch.setattr(loop, "getaddrinfo", counting_getaddrinfo)
+
+    first = await backend._resolve("localhost", 80)
+    second = await backend._resolve("localhost", 80)
+    assert first == second
+    assert calls == ["localhost"]
+
+    # Les IP littérales ne sont jamais résolues
+    assert await backend._resolve("127.0.0.1", 80) == ["127.0.0.1"]
+
+    backend.invalidate("localhost")
+    await backend._resolve("localhost", 80)
+    assert calls == ["localhost", "localhost"]
+
+
+@pytest.mark.asyncio
+async def test_manager_owns_and_closes_clients():
+    """ProviderManager attache un client par provider et les ferme à l'arrêt."""
+    manager = ProviderManager()
+    manager.open_http_clients(http2=False)
+
+    ffvl = manager.get_provider("ffvl")
+    client = ffvl._http_client
+    assert client is not None and not client.is_closed
+    assert manager.get_provider("openwindmap")._http_client is not client
+
+    async with ffvl._client() as shared:
+        assert shared is client
+
+    await manager.aclose()
+
+    assert client.is_closed
+    assert ffvl._http_client is None
@@ -0,0 +1,40 @@
+"""Tests du cache mémoire des mesures pollées."""
+
+from datetime import datetime, timezone
+
+from app.providers import Measurement
+from app.services.measurement_store import MeasurementStore
+
+
+def _measurement():
+    return Measurement(
+        measurement_at=datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc),
+        wind_avg_kmh=10,
+        wind_max_kmh=20,
+    )
+
+
+def test_get_recent_measurement():
+    """Une mesure récemment pollée est réutilisée (station id normalisé)."""
+    store = MeasurementStore(max_age_seconds=60)
+    measurement = _measurement()
+    store.put("ffvl", 67, measurement)
+
+    assert store.get("ffvl", "67") is measurement
+    assert store.get("openwindmap", "67") is None
+    assert (store.hits, store.misses) == (1, 1)
+
+
+def test_stale_entry_ignored(monkeypatch):
+    """Au-delà de max_age_seconds, il faut re-demander au provider."""
+    clock = [1000.0]
+    monkeypatch.setattr(
+        "app.services.measurement_store.time.monotonic", lambda: clock[0]
+    )
+    store = MeasurementStore(max_age_seconds=60)
+    store.put("ffvl", "67", _measurement())
+
+    clock[0] += 59
+    assert store.get("ffvl", "67") is not None
+    clock[0] += 2
+    assert store.get("ffvl", "67") is None
@@ -0,0 +1,93 @@
+"""Tests des requêtes conditionnelles et de la compression sur /live/all."""
+
+import gzip
+import json
+import httpx
+import pytest
+
+from app.providers.openwindmap import OpenWindMapProvider
+
+LIVE_ALL = {
+    "data": [
+        {
+            "id": 385,
+            "measurements": {
+                "date": "2025-06-01T14:00:00.000Z",
+                "wind_speed_avg": 12.5,
+                "wind_speed_max": 20.0,
+                "wind_heading": 270,
+            },
+        },
+        {"id": 386, "measurements": {}},
+    ]
+}
+
+
+@pytest.fixture
+def live_all_server():
+    """Serveur /live/all gzip avec ETag, répond 304 si If-None-Match correspond."""
+    requests = []
+    body = gzip.compress(json.dumps(LIVE_ALL).encode())
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(
+            200,
+            stream=httpx.ByteStream(body),
+            headers={
+                "Content-Encoding": "gzip",
+                "Content-Type": "application/json",
+                "ETag": '"v1"',
+                "Last-Modified": "Sun, 01 Jun 2025 14:00:00 GMT",
+            },
+        )
+
+    return handler, requests, len(body)
+
+
+@pytest.mark.asyncio
+async def test_conditional_request_reuses_cache(live_all_server):
+    """Le second poll envoie l'ETag et réutilise le résultat sur 304."""
+    handler, requests, compressed_size = live_all_server
+    provider = OpenWindMapProvider()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider.set_http_client(client)
+
+    try:
+        first = await provider.fetch_measurements_bulk(["385", "386"])
+        second = await provider.fetch_measurements_bulk(["385"])
+    finally:
+        await client.aclose()
+
+    assert first["385"].wind_avg_kmh == 12.5
+    assert first["386"] is None
+    assert second["385"] is first["385"]
+
+    assert "If-None-Match" not in requests[0].headers
+    assert "gzip" in requests[0].headers["Accept-Encoding"]
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert requests[1].headers["If-Modified-Since"] == "Sun, 01 Jun 2025 14:00:00 GMT"
+
+
+@pytest.mark.asyncio
+async def test_transfer_stats(live_all_server):
+    """Les compteurs distinguent octets compressés/décompressés et hits 304."""
+    handler, _, compressed_size = live_all_server
+    provider = OpenWindMapProvider()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider.set_http_client(client)
+
+    try:
+        await provider.fetch_measurements_bulk(["385"])
+        await provider.fetch_measurements_bulk(["385"])
+    finally:
+        await client.aclose()
+
+    stats = provider.get_transfer_stats()["live_all"]
+    assert stats["requests"] == 2
+    assert stats["not_modified"] == 1
+    assert stats["cache_hit_ratio"] == 0.5
+    assert stats["bytes_on_wire"] == compressed_size
+    assert stats["bytes_decoded"] == len(json.dumps(LIVE_ALL).encode())
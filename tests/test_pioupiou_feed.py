@@ -0,0 +1,117 @@
+"""Tests du parser incrémental et du snapshot colonnaire Pioupiou."""
+
+import json
+import math
+import httpx
+import pytest
+
+from app.exceptions import ProviderError
+from app.providers.openwindmap import OpenWindMapProvider
+from app.providers.pioupiou_feed import LiveFeedParser, LiveSnapshot
+
+
+def _station(station_id, avg=10.0):
+    return {
+        "id": station_id,
+        "meta": {"name": f"Station {station_id}", "description": "a [b] {c}"},
+        "measurements": {
+            "date": "2025-06-01T14:00:00.000Z",
+            "wind_speed_avg": avg,
+            "wind_speed_max": avg * 2,
+            "wind_speed_min": None,
+            "wind_heading": 180,
+        },
+    }
+
+
+FEED = json.dumps(
+    {
+        "doc": "http://developers.pioupiou.fr/api/live/",
+        "license": "http://developers.pioupiou.fr/data-licensing",
+        "data": [_station(i, avg=float(i)) for i in range(1, 201)],
+    }
+)
+
+
+def _chunks(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 4096, len(FEED)])
+def test_parser_across_chunk_boundaries(chunk_size):
+    """Tous les objets sont extraits quel que soit le découpage du flux."""
+    parser = LiveFeedParser()
+    stations = []
+    for chunk in _chunks(FEED, chunk_size):
+        stations.extend(parser.feed(chunk))
+    parser.close()
+
+    assert [s["id"] for s in stations] == list(range(1, 201))
+    assert stations[0]["meta"]["description"] == "a [b] {c}"
+
+
+def test_parser_truncated_feed():
+    """Un flux tronqué est détecté à la fermeture."""
+    parser = LiveFeedParser()
+    list(parser.feed(FEED[: len(FEED) // 2]))
+
+    with pytest.raises(ProviderError):
+        parser.close()
+
+
+def test_snapshot_columns():
+    """Le snapshot stocke les colonnes en arrays compacts (NaN si absent)."""
+    snapshot = LiveSnapshot()
+    snapshot.append(_station(385, avg=12.5))
+    snapshot.append({"id": 386, "measurements": {}})
+    snapshot.append({"id": "invalide"})
+
+    assert len(snapshot) == 2
+    row = snapshot.row(385)
+    assert row["wind_avg"] == 12.5
+    assert row["wind_heading"] == 180.0
+    assert math.isnan(row["wind_min"])
+    assert math.isnan(snapshot.row(386)["measured_at"])
+    assert snapshot.row(999) is None
+    assert snapshot.nbytes() == 2 * 6 * 8
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, data: bytes, size: int):
+        self._data = data
+        self._size = size
+
+    async def __aiter__(self):
+        for i in range(0, len(self._data), self._size):
+            yield self._data[i : i + self._size]
+
+
+@pytest.mark.asyncio
+async def test_provider_parses_only_requested_stations(monkeypatch):
+    """Seules les stations demandées deviennent des Measurement."""
+    provider = OpenWindMapProvider(keep_snapshot=True)
+
+    def handler(request):
+        return httpx.Response(200, stream=_ChunkedStream(FEED.encode(), 512))
+
+    parsed = []
+    real_parse = provider._parse_measurement
+
+    def counting_parse(data):
+        parsed.append(data["id"])
+        return real_parse(data)
+
+    monkeypatch.setattr(provider, "_parse_measurement", counting_parse)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider.set_http_client(client)
+
+    try:
+        results = await provider.fetch_measurements_bulk(["42", "150", "9999"])
+    finally:
+        await client.aclose()
+
+    assert sorted(parsed) == [42, 150]
+    assert results["42"].wind_avg_kmh == 42.0
+    assert results["150"].wind_max_kmh == 300.0
+    assert results["9999"] is None
+    assert len(provider.live_snapshot) == 200
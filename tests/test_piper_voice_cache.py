@@ -0,0 +1,121 @@
+"""Tests du cache LRU des voix Piper chargées."""
+
+import os
+import threading
+import time
+import wave
+import pytest
+
+from app.tts.piper_engine import PiperEngine
+
+
+class FakePiperVoice:
+    """Remplace PiperVoice : compte les chargements de modèles."""
+
+    loads = []
+    delays = {}  # Durée de chargement par fichier modèle
+
+    @classmethod
+    def load(cls, model_path, config_path=None):
+        name = os.path.basename(model_path)
+        time.sleep(cls.delays.get(name, 0))
+        cls.loads.append(name)
+        return cls()
+
+    def synthesize_wav(self, text, wav_file):
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(b"\x00\x00" * 160)
+
+
+def _add_voice(models_dir, voice_id, size=1000):
+    (models_dir / f"{voice_id}.onnx").write_bytes(b"\x00" * size)
+    (models_dir / f"{voice_id}.onnx.json").write_text("{}")
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    FakePiperVoice.loads = []
+    FakePiperVoice.delays = {}
+    monkeypatch.setattr("app.tts.piper_engine.PiperVoice", FakePiperVoice)
+    for voice_id in ("voix-a", "voix-b", "voix-c"):
+        _add_voice(tmp_path, voice_id)
+    return PiperEngine(models_dir=tmp_path, memory_budget_bytes=2500)
+
+
+def test_voice_loaded_once(engine, tmp_path):
+    """Deux synthèses avec la même voix ne chargent le modèle qu'une fois."""
+    for i in range(2):
+        output = str(tmp_path / f"out{i}.wav")
+        engine.synthesize("Bonjour", "voix-a", output)
+        with wave.open(output, "rb") as wav:
+            assert wav.getnframes() == 160
+
+    assert FakePiperVoice.loads == ["voix-a.onnx"]
+
+
+def test_reload_when_model_changes(engine, tmp_path):
+    """Un modèle remplacé sur disque (mtime différent) est rechargé."""
+    engine.synthesize("Bonjour", "voix-a", str(tmp_path / "out.wav"))
+
+    model = tmp_path / "voix-a.onnx"
+    stat = model.stat()
+    os.utime(model, (stat.st_atime, stat.st_mtime + 10))
+    engine.synthesize("Bonjour", "voix-a", str(tmp_path / "out.wav"))
+
+    assert FakePiperVoice.loads == ["voix-a.onnx", "voix-a.onnx"]
+
+
+def test_lru_eviction_over_budget(engine, tmp_path):
+    """Au-delà du budget mémoire, la voix la moins récente est déchargée."""
+    engine.preload(["voix-a", "voix-b"])
+    engine.synthesize("Bonjour", "voix-a", str(tmp_path / "out.wav"))
+    engine.preload(["voix-c"])
+
+    assert engine.loaded_voices() == ["voix-a", "voix-c"]
+
+
+def test_idle_unload(engine):
+    """Les voix inactives sont déchargées."""
+    engine.preload(["voix-a"])
+    engine.idle_unload_seconds = 0
+
+    assert engine.unload_idle() == 1
+    assert engine.loaded_voices() == []
+
+
+def test_preload_ignores_missing_voice(engine):
+    """Une voix absente n'empêche pas le préchargement des autres."""
+    assert engine.preload(["inconnue", "voix-b"]) == ["voix-b"]
+
+
+def test_slow_load_does_not_block_other_voices(engine):
+    """Pendant le chargement d'une voix, les autres voix restent accessibles."""
+    FakePiperVoice.delays = {"voix-a.onnx": 0.5}
+    slow = threading.Thread(target=engine.preload, args=(["voix-a"],))
+    slow.start()
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    assert engine.preload(["voix-b"]) == ["voix-b"]
+    assert engine.loaded_voices() == ["voix-b"]
+    assert engine.unload_idle() == 0
+    assert time.monotonic() - start < 0.2
+
+    slow.join()
+    assert engine.loaded_voices() == ["voix-b", "voix-a"]
+
+
+def test_concurrent_requests_load_voice_once(engine):
+    """Plusieurs threads demandant la même voix : un seul chargement."""
+    FakePiperVoice.delays = {"voix-a.onnx": 0.1}
+    threads = [
+        threading.Thread(target=engine.preload, args=(["voix-a"],)) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert FakePiperVoice.loads == ["voix-a.onnx"]
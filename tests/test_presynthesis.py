@@ -0,0 +1,90 @@
+"""Tests de la synthèse audio anticipée (dès la planification des TX)."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.models import Channel, TxHistory
+from app.runner import VHFRunner
+from app.tts.cache import TTSCacheService
+
+
+@pytest.fixture
+def runner(runner_db, fake_engine, tmp_path):
+    """Runner branché sur une base SQLite fichier (sessions multiples)."""
+
+    with runner_db() as db:
+        channel = Channel(
+            name="Test", provider_id="ffvl", station_id="67", template_text="x"
+        )
+        db.add(channel)
+        db.commit()
+        for i, status in enumerate(["PENDING", "PENDING", "ABORTED"]):
+            db.add(
+                TxHistory(
+                    tx_id=str(i) * 64,
+                    channel_id=channel.id,
+                    mode="SCHEDULED",
+                    status=status,
+                    station_id="67",
+                    measurement_at=datetime(2025, 1, 1, 12, 0),
+                    offset_seconds=i,
+                    planned_at=datetime(2025, 1, 1, 12, 0, i),
+                    rendered_text="Vent 12 km/h",
+                )
+            )
+        db.commit()
+
+    runner = VHFRunner()
+    runner.tts_engine = fake_engine
+    runner.tts_cache = TTSCacheService(cache_dir=tmp_path / "cache")
+    runner.session = runner_db
+    return runner
+
+
+@pytest.mark.asyncio
+async def test_presynthesis_sets_audio_path(runner):
+    """Un seul fichier synthétisé, enregistré sur les TX encore PENDING."""
+    runner._start_synthesis(1, ["0" * 64, "1" * 64, "2" * 64])
+    await runner._wait_synthesis({1})
+
+    assert runner.tts_engine.calls == ["Vent 12 km/h"]
+    with runner.session() as db:
+        paths = {tx.status: tx.audio_path for tx in db.query(TxHistory)}
+        pending = [
+            tx.audio_path for tx in db.query(TxHistory).filter_by(status="PENDING")
+        ]
+    assert len(set(pending)) == 1 and pending[0] is not None
+    assert paths["ABORTED"] is None
+    assert runner._synthesis_jobs == {}
+
+
+@pytest.mark.asyncio
+async def test_queued_synthesis_cancelled(runner):
+    """Une synthèse encore en file d'attente est annulée avec ses TX."""
+    runner._start_synthesis(1, ["0" * 64])
+    await runner._synthesis_slot.acquire()  # Slot occupé : le job attend
+    runner._start_synthesis(2, ["1" * 64])
+    await asyncio.sleep(0)
+
+    runner._cancel_synthesis(2)
+    runner._synthesis_slot.release()
+    await runner._wait_synthesis({1})
+
+    assert runner.tts_engine.calls == ["Vent 12 km/h"]
+    assert 2 not in runner._synthesis_jobs
+
+
+@pytest.mark.asyncio
+async def test_running_synthesis_completes(runner):
+    """Une synthèse démarrée n'est pas interrompue par une annulation."""
+    runner.tts_engine.delay = 0.1
+    runner._start_synthesis(1, ["0" * 64])
+    await asyncio.sleep(0.02)
+
+    task = runner._synthesis_jobs[1]
+    runner._cancel_synthesis(1)
+    await asyncio.wait([task])
+
+    assert runner.tts_engine.calls == ["Vent 12 km/h"]
@@ -0,0 +1,178 @@
+"""Tests du polling concurrent des providers dans le runner."""
+
+import asyncio
+import time
+import pytest
+from datetime import datetime, timezone
+
+import app.runner
+from app.models import Channel, ChannelRuntime, TxHistory
+from app.providers import WeatherProvider, Measurement
+from app.runner import VHFRunner
+from app.services.channel_config import ChannelConfig
+
+
+class FakeProvider(WeatherProvider):
+    """Provider factice avec latence et échec configurables."""
+
+    def __init__(self, provider_id, delay=0.0, fail=False, timeout=30.0):
+        self._provider_id = provider_id
+        self._delay = delay
+        self._fail = fail
+        self.poll_timeout_seconds = timeout
+
+    @property
+    def provider_id(self) -> str:
+        return self._provider_id
+
+    def resolve_station_from_url(self, url):
+        return None
+
+    async def fetch_measurement(self, station_id):
+        return (await self.fetch_measurements_bulk([station_id]))[station_id]
+
+    async def fetch_measurements_bulk(self, station_ids):
+        await asyncio.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("API en panne")
+        return {
+            station_id: Measurement(
+                measurement_at=datetime.now(timezone.utc),
+                wind_avg_kmh=10,
+                wind_max_kmh=20,
+            )
+            for station_id in station_ids
+        }
+
+
+@pytest.fixture
+def runner(runner_db, monkeypatch):
+    """Runner branché sur une base SQLite fichier, synthèse désactivée."""
+    runner = VHFRunner()
+    monkeypatch.setattr(runner, "_start_synthesis", lambda *a: None)
+    runner.session = runner_db
+    return runner
+
+
+def _channels(runner, monkeypatch, providers):
+    """Un canal par provider ; retourne les instantanés passés au polling."""
+    by_id = {provider.provider_id: provider for provider in providers}
+    monkeypatch.setattr(
+        "app.runner.provider_manager.get_provider",
+        lambda provider_id: by_id.get(provider_id),
+    )
+    with runner.session() as db:
+        for provider in providers:
+            channel = Channel(
+                name=provider.provider_id.upper(),
+                provider_id=provider.provider_id,
+                station_id="1",
+                template_text="Vent {wind_avg_kmh}",
+                offsets_seconds_json="[0, 600]",
+                is_enabled=True,
+            )
+            channel.runtime = ChannelRuntime()
+            db.add(channel)
+        db.commit()
+        return [
+            ChannelConfig.from_channel(c)
+            for c in db.query(Channel).order_by(Channel.id)
+        ]
+
+
+def _pending_by_channel(runner):
+    with runner.session() as db:
+        return {
+            channel.name: db.query(TxHistory)
+            .filter_by(channel_id=channel.id, status="PENDING")
+            .count()
+            for channel in db.query(Channel)
+        }
+
+
+@pytest.mark.asyncio
+async def test_fetch_providers_concurrently(runner, monkeypatch):
+    """La durée du polling est celle du provider le plus lent, pas la somme."""
+    channels = _channels(
+        runner,
+        monkeypatch,
+        [FakeProvider("a", delay=0.2), FakeProvider("b", delay=0.2)],
+    )
+
+    start = time.monotonic()
+    await runner._poll_measurements(channels)
+    elapsed = time.monotonic() - start
+
+    assert 0.2 <= elapsed < 0.35
+    assert _pending_by_channel(runner) == {"A": 2, "B": 2}
+
+
+@pytest.mark.asyncio
+async def test_channel_update_failure_isolated(runner, monkeypatch):
+    """Un canal en échec est annulé seul (savepoint), les autres sont mis à jour."""
+    channels = _channels(runner, monkeypatch, [FakeProvider("a"), FakeProvider("b")])
+    real_render = app.runner.prepare_announcement_text
+
+    def failing_render(config, measurement):
+        if config.name == "A":
+            raise ValueError("template invalide")
+        return real_render(config, measurement)
+
+    monkeypatch.setattr(app.runner, "prepare_announcement_text", failing_render)
+
+    await runner._poll_measurements(channels)
+
+    assert _pending_by_channel(runner) == {"A": 0, "B": 2}
+    with runner.session() as db:
+        runtimes = {
+            channel.name: channel.runtime.last_measurement_at
+            for channel in db.query(Channel)
+        }
+    assert runtimes["A"] is None
+    assert runtimes["B"] is not None
+
+
+@pytest.mark.asyncio
+async def test_measurements_committed_once(runner, monkeypatch):
+    """Unité de travail interrompue : aucun canal validé ni planifié."""
+    channels = _channels(runner, monkeypatch, [FakeProvider("a"), FakeProvider("b")])
+    real_render = app.runner.prepare_announcement_text
+
+    def cancelled_render(config, measurement):
+        if config.name == "B":
+            raise asyncio.CancelledError()
+        return real_render(config, measurement)
+
+    monkeypatch.setattr(app.runner, "prepare_announcement_text", cancelled_render)
+
+    with pytest.raises(asyncio.CancelledError):
+        await runner._poll_measurements(channels)
+
+    # Savepoint de A libéré mais transaction annulée : rien n'est validé
+    assert _pending_by_channel(runner) == {"A": 0, "B": 0}
+    assert len(runner.scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_provider_timeout_isolated():
+    """Un provider trop lent est abandonné sans bloquer les autres."""
+    runner = VHFRunner()
+    slow = FakeProvider("slow", delay=5, timeout=0.1)
+    fast = FakeProvider("fast")
+
+    start = time.monotonic()
+    slow_result, fast_result = await asyncio.gather(
+        runner._fetch_provider(slow, ["1"]), runner._fetch_provider(fast, ["2"])
+    )
+
+    assert slow_result is None
+    assert "2" in fast_result
+    assert time.monotonic() - start < 1.0
+
+
+@pytest.mark.asyncio
+async def test_fetch_provider_error_isolated():
+    """Une exception d'un provider est journalisée et retourne None."""
+    runner = VHFRunner()
+
+    assert await runner._fetch_provider(FakeProvider("ko", fail=True), ["1"]) is None
@@ -0,0 +1,49 @@
+"""Tests du contrôleur PTT libgpiod (chip simulée)."""
+
+import time
+
+from app.ptt.controller import GpiodPTTController, MockGpioChip
+
+
+def test_levels_follow_active_level():
+    """Ligne réservée au niveau inactif, inversée si active_level=0."""
+    chip = MockGpioChip()
+    ptt = GpiodPTTController(pin=17, active_level=0, chip=chip)
+    assert chip.levels[17] == 1
+
+    ptt.set_ptt(True)
+    assert chip.levels[17] == 0
+
+    ptt.cleanup()
+    assert chip.levels[17] == 1
+    assert 17 in chip.released
+
+
+def test_edges_timestamped_once_per_transition():
+    """Un front horodaté par changement d'état, pas par écriture."""
+    ptt = GpiodPTTController(pin=17, chip=MockGpioChip())
+
+    before = time.monotonic()
+    ptt.set_ptt(True)
+    ptt.set_ptt(True)
+    ptt.set_ptt(False)
+    ptt.set_ptt(False)
+
+    assert [active for _, active, _ in ptt.edges] == [True, False]
+    assert before <= ptt.edges[0][0] <= ptt.edges[1][0]
+
+
+def test_edge_stats_duty_cycle():
+    """Durée des émissions et taux d'émission calculés depuis les fronts."""
+    ptt = GpiodPTTController(pin=17, chip=MockGpioChip())
+
+    time.sleep(0.1)
+    ptt.set_ptt(True)
+    time.sleep(0.1)
+    ptt.set_ptt(False)
+
+    stats = ptt.get_edge_stats()
+    assert stats["key_ups"] == 1
+    assert 0.09 <= stats["avg_tx_seconds"] < 0.2
+    assert 0.3 < stats["duty_cycle"] < 0.7
+    assert stats["max_write_us"] >= 0
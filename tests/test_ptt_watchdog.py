@@ -0,0 +1,90 @@
+"""Tests du watchdog PTT (thread indépendant de la boucle asyncio)."""
+
+import time
+
+import pytest
+
+from app.ptt.controller import MockPTTController
+from app.ptt.watchdog import PTTWatchdog
+from app.services.audio_player import PreparedAudio
+from app.services.transmission import TransmissionService
+from app.services.tx_lock import TransmitLock
+
+
+class RecordingPTT(MockPTTController):
+    """PTT simulé qui horodate chaque changement d'état."""
+
+    def __init__(self):
+        super().__init__()
+        self.changes = []
+
+    def set_ptt(self, active):
+        super().set_ptt(active)
+        self.changes.append((active, time.monotonic()))
+
+
+class BlockingPlayer:
+    """Lecteur qui bloque la boucle asyncio (appel synchrone)."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def prepare(self, path):
+        return PreparedAudio(path=path)
+
+    async def play(self, audio):
+        time.sleep(self.seconds)
+
+    def close(self):
+        pass
+
+
+def test_trip_forces_ptt_off():
+    """Échéance dépassée : PTT coupé par le thread, latence mesurée."""
+    ptt = RecordingPTT()
+    watchdog = PTTWatchdog(ptt)
+    ptt.set_ptt(True)
+    watchdog.arm(0.1)
+
+    time.sleep(0.3)
+
+    assert ptt._state is False
+    stats = watchdog.get_stats()
+    assert stats["trips"] == 1
+    assert 0 <= stats["last_latency_ms"] < 100
+    assert not watchdog.armed
+    watchdog.stop()
+
+
+def test_disarm_prevents_trip():
+    """PTT OFF normal avant l'échéance : aucune coupure forcée."""
+    ptt = RecordingPTT()
+    watchdog = PTTWatchdog(ptt)
+    watchdog.arm(0.1)
+    watchdog.disarm()
+
+    time.sleep(0.2)
+
+    assert watchdog.get_stats()["trips"] == 0
+    assert ptt.changes == []
+    watchdog.stop()
+
+
+@pytest.mark.asyncio
+async def test_ptt_cut_while_event_loop_blocked(tmp_path):
+    """La boucle asyncio bloquée n'empêche pas la coupure à l'échéance."""
+    audio_path = tmp_path / "a.wav"
+    audio_path.write_bytes(b"fake audio data")
+    ptt = RecordingPTT()
+    service = TransmissionService(
+        ptt, tx_lock=TransmitLock(lock_dir=tmp_path), player=BlockingPlayer(1.0)
+    )
+
+    await service.transmit(str(audio_path), lead_ms=0, tail_ms=0, timeout_seconds=0.3)
+
+    # PTT ON, coupure forcée pendant le blocage, puis PTT OFF normal
+    assert [active for active, _ in ptt.changes] == [True, False, False]
+    forced_after = ptt.changes[1][1] - ptt.changes[0][1]
+    assert 0.3 <= forced_after < 0.5
+    assert service.get_watchdog_stats()["trips"] == 1
+    service.close()
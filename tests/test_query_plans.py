@@ -0,0 +1,192 @@
+"""Plans d'exécution des requêtes chaudes sur tx_history (EXPLAIN QUERY PLAN)."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, insert, text
+
+from app.database import migrate_db
+from app.models import Base, Channel, ChannelRuntime, TxHistory
+from app.providers import Measurement
+from app.services.scheduler import TxScheduler
+
+# Historique accumulé : les requêtes chaudes doivent rester des recherches
+# par index (O(log n)), jamais un parcours de la table
+HISTORY_ROWS = 20000
+
+
+@pytest.fixture
+def history(runner_db):
+    """Deux canaux, un long historique SENT et quelques TX PENDING.
+
+    Base fichier partagée avec le runner (runner_db).
+    """
+    with runner_db() as db_session:
+        yield _seed_history(db_session)
+
+
+def _seed_history(db_session):
+    channels = []
+    for name in ("A", "B"):
+        channel = Channel(
+            name=name,
+            provider_id="ffvl",
+            station_id="67",
+            template_text="Vent {wind_avg_kmh}",
+            offsets_seconds_json="[0, 600]",
+        )
+        channel.runtime = ChannelRuntime()
+        db_session.add(channel)
+        channels.append(channel)
+    db_session.flush()
+
+    start = datetime(2024, 1, 1)
+    db_session.execute(
+        insert(TxHistory),
+        [
+            {
+                "tx_id": f"{i:064x}",
+                "channel_id": channels[i % 2].id,
+                "mode": "SCHEDULED",
+                "status": "PENDING" if i >= HISTORY_ROWS - 4 else "SENT",
+                "station_id": "67",
+                "measurement_at": start + timedelta(minutes=i),
+                "offset_seconds": 0,
+                "planned_at": start + timedelta(minutes=i),
+                "rendered_text": "Vent 12",
+                "created_at": start + timedelta(minutes=i),
+            }
+            for i in range(HISTORY_ROWS)
+        ],
+    )
+    db_session.commit()
+    migrate_db(db_session.get_bind())  # Statistiques, comme au démarrage
+    return db_session, channels[0]
+
+
+def _capture(db_session, action):
+    """Exécute action() et retourne les requêtes unitaires sur tx_history."""
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if executemany or statement.startswith("INSERT"):
+            return
+        if "tx_history" in statement:
+            statements.append((statement, parameters))
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", listener)
+    try:
+        action()
+    finally:
+        event.remove(bind, "before_cursor_execute", listener)
+    return statements
+
+
+def _plan(db_session, statement, parameters=()) -> str:
+    rows = db_session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", tuple(parameters)
+    )
+    return " | ".join(row[3] for row in rows)
+
+
+def _assert_indexed(db_session, statements):
+    assert statements
+    for statement, parameters in statements:
+        plan = _plan(db_session, statement, parameters)
+        assert "SEARCH tx_history USING" in plan, (statement, plan)
+        assert "SCAN tx_history" not in plan, (statement, plan)
+
+
+def test_load_pending_indexed(history):
+    """Resynchronisation du tas : seules les TX PENDING sont lues."""
+    db_session, _ = history
+    scheduler = TxScheduler()
+
+    statements = _capture(db_session, lambda: scheduler.load_pending(db_session))
+
+    _assert_indexed(db_session, statements)
+    assert len(scheduler) == 4
+
+
+def test_schedule_cancellation_indexed(history, monkeypatch):
+    """Annulation des TX PENDING d'un canal : index (channel_id, status, ...)."""
+    import app.runner
+
+    db_session, channel = history
+    runner = app.runner.VHFRunner()
+    monkeypatch.setattr(runner, "_start_synthesis", lambda *a: None)
+    measurement = Measurement(
+        measurement_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        wind_avg_kmh=12,
+        wind_max_kmh=20,
+    )
+    assert channel.runtime is not None
+
+    statements = _capture(
+        db_session,
+        lambda: runner._schedule_transmissions(db_session, channel, measurement),
+    )
+
+    _assert_indexed(db_session, statements)
+    cancel = next(s for s in statements if s[0].startswith("UPDATE tx_history"))
+    assert "idx_tx_history_channel_status_planned" in _plan(db_session, *cancel)
+
+
+def test_channel_pending_ordered_without_sort(history):
+    """TX PENDING d'un canal par échéance : ni parcours ni tri temporaire."""
+    db_session, channel = history
+    query = (
+        db_session.query(TxHistory)
+        .filter(TxHistory.channel_id == channel.id, TxHistory.status == "PENDING")
+        .order_by(TxHistory.planned_at)
+    )
+    compiled = query.statement.compile(db_session.get_bind())
+
+    plan = _plan(
+        db_session,
+        str(compiled),
+        [compiled.params[name] for name in compiled.positiontup],
+    )
+
+    assert "idx_tx_history_channel_status_planned" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_old_pending_cleanup_uses_partial_index(history):
+    """TX PENDING échues (nettoyage au démarrage) : index partiel."""
+    import app.runner
+
+    db_session, _ = history
+    runner = app.runner.VHFRunner()
+
+    statements = _capture(db_session, runner._cleanup_old_pending)
+
+    _assert_indexed(db_session, statements)
+    assert "idx_tx_history_pending" in _plan(db_session, *statements[0])
+
+
+def test_migrate_existing_database(tmp_path):
+    """Base existante : nouveaux index créés, ancien index supprimé, idempotent."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX idx_tx_history_channel_status_planned"))
+        conn.execute(text("DROP INDEX idx_tx_history_pending"))
+        conn.execute(
+            text(
+                "CREATE INDEX idx_tx_history_status_planned "
+                "ON tx_history (status, planned_at)"
+            )
+        )
+
+    created = migrate_db(engine)
+
+    assert set(created) == {
+        "idx_tx_history_channel_status_planned",
+        "idx_tx_history_pending",
+    }
+    names = {index["name"] for index in inspect(engine).get_indexes("tx_history")}
+    assert "idx_tx_history_pending" in names
+    assert "idx_tx_history_status_planned" not in names
+    assert migrate_db(engine) == []
@@ -0,0 +1,127 @@
+"""Tests du router des radios (création, liste, suppression, conflits)."""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import AuditLog, Radio, SystemSettings
+from app.routers.radios import (
+    RadioRequest,
+    create_radio,
+    delete_radio,
+    list_radios,
+)
+from app.routers.settings import SystemSettingsUpdate, update_system_settings
+
+ADMIN = SimpleNamespace(id=1)
+
+
+def _create(db, **fields):
+    request = RadioRequest(**{"name": "Club", "frequency_mhz": 143.9875, **fields})
+    return create_radio(request, db=db, current_user=ADMIN)
+
+
+def test_create_list_delete(db_session):
+    """Radios listées par fréquence ; création et suppression journalisées."""
+    club = _create(db_session, ptt_gpio_pin=27, audio_device="plughw:1,0")
+    _create(db_session, name="Treuil", frequency_mhz=143.9500, audio_device="hw:2")
+
+    radios = list_radios(db=db_session, current_user=ADMIN)
+    assert [r.name for r in radios] == ["Treuil", "Club"]
+    assert radios[1].ptt_gpio_pin == 27
+
+    delete_radio(club.id, db=db_session, current_user=ADMIN)
+
+    assert [r.name for r in db_session.query(Radio)] == ["Treuil"]
+    actions = [a.action for a in db_session.query(AuditLog).order_by(AuditLog.id)]
+    assert actions == ["create_radio", "create_radio", "delete_radio"]
+
+
+def test_duplicate_name_or_frequency(db_session):
+    """Nom ou fréquence déjà déclarés : 400."""
+    _create(db_session, audio_device="hw:1")
+
+    with pytest.raises(HTTPException) as exc:
+        _create(db_session, name="Autre", audio_device="hw:2")
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"ptt_gpio_pin": 27},
+        {"audio_device": "plughw:1,0"},
+    ],
+)
+def test_hardware_conflict(db_session, fields):
+    """Pin PTT ou device audio déjà utilisés par une autre radio : 409."""
+    _create(db_session, ptt_gpio_pin=27, audio_device="plughw:1,0")
+
+    with pytest.raises(HTTPException) as exc:
+        _create(
+            db_session,
+            name="Treuil",
+            frequency_mhz=143.95,
+            **{"audio_device": "hw:2", **fields},
+        )
+
+    assert exc.value.status_code == 409
+    assert "Club" in exc.value.detail
+    assert db_session.query(Radio).count() == 1
+
+
+def test_conflict_with_default_radio(db_session):
+    """Pin PTT de la radio par défaut (paramètres système) : 409."""
+    db_session.add(SystemSettings(id=1, ptt_gpio_pin=17))
+    db_session.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        _create(db_session, ptt_gpio_pin=17, audio_device="hw:1")
+    assert exc.value.status_code == 409
+
+    radio = _create(db_session, ptt_gpio_pin=27, audio_device="hw:1")
+    assert radio.ptt_gpio_pin == 27
+
+
+def test_default_audio_output_conflict(db_session):
+    """Sans device audio, la radio partagerait la sortie par défaut : 409."""
+    with pytest.raises(HTTPException) as exc:
+        _create(db_session, ptt_gpio_pin=27)
+
+    assert exc.value.status_code == 409
+    assert db_session.query(Radio).count() == 0
+
+
+def test_settings_pin_used_by_radio(db_session):
+    """Pin PTT système déjà utilisée par une radio dédiée : 409, rien modifié."""
+    _create(db_session, ptt_gpio_pin=27, audio_device="hw:1")
+    update = SystemSettingsUpdate(
+        master_enabled=True,
+        poll_interval_seconds=60,
+        inter_announcement_pause_seconds=10,
+        ptt_gpio_pin=27,
+        ptt_active_level=1,
+        ptt_lead_ms=500,
+        ptt_tail_ms=500,
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        update_system_settings(update, db=db_session, current_user=ADMIN)
+    assert exc.value.status_code == 409
+    assert db_session.query(SystemSettings).count() == 0
+
+    update.ptt_gpio_pin = 17
+    assert (
+        update_system_settings(update, db=db_session, current_user=ADMIN)[
+            "ptt_gpio_pin"
+        ]
+        == 17
+    )
+
+
+def test_delete_unknown_radio(db_session):
+    """Radio inconnue : 404."""
+    with pytest.raises(HTTPException) as exc:
+        delete_radio(42, db=db_session, current_user=ADMIN)
+    assert exc.value.status_code == 404
@@ -0,0 +1,145 @@
+"""Tests de la rétention de l'historique (archivage compressé, vacuum)."""
+
+import gzip
+from datetime import date, datetime, timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from app.database import create_db_engine
+from app.models import AuditLog, Base, Channel, ChannelRuntime, TxHistory
+from app.routers.status import get_system_status
+from app.services.retention import HistoryArchiver
+
+NOW = datetime(2025, 6, 1, 12, 0, 0)
+
+
+def _tx(channel_id, i, status, created_at):
+    return TxHistory(
+        tx_id=f"{i:064x}",
+        channel_id=channel_id,
+        mode="SCHEDULED",
+        status=status,
+        station_id="67",
+        measurement_at=created_at,
+        offset_seconds=0,
+        planned_at=created_at,
+        sent_at=created_at if status == "SENT" else None,
+        rendered_text="Vent 12",
+        created_at=created_at,
+    )
+
+
+def _seed(db):
+    channel = Channel(
+        name="Test", provider_id="ffvl", station_id="67", template_text="x"
+    )
+    db.add(channel)
+    db.flush()
+    old = NOW - timedelta(days=100)
+    for i in range(30):
+        db.add(_tx(channel.id, i, "SENT", old + timedelta(hours=i)))
+    db.add(_tx(channel.id, 100, "PENDING", old))  # Jamais archivée
+    db.add(_tx(channel.id, 101, "FAILED", NOW - timedelta(hours=1)))
+    db.add(AuditLog(timestamp=old, action="login"))
+    db.add(AuditLog(timestamp=NOW, action="login"))
+    db.commit()
+    return channel
+
+
+def test_archive_moves_old_rows_in_chunks(db_session, tmp_path):
+    """Lignes anciennes déplacées par lots vers des fichiers gzip par jour."""
+    channel = _seed(db_session)
+    archiver = HistoryArchiver(tmp_path, chunk_size=7)
+
+    archived = archiver.archive(db_session, retention_days=90, now=NOW)
+
+    assert archived == {"tx_history": 30, "audit_log": 1}
+    remaining = {tx.status for tx in db_session.query(TxHistory)}
+    assert remaining == {"PENDING", "FAILED"}
+    assert db_session.query(AuditLog).count() == 1
+
+    day = (NOW - timedelta(days=100)).date()
+    path = tmp_path / "tx_history" / f"{day:%Y-%m}" / f"{day:%Y-%m-%d}.jsonl.gz"
+    with gzip.open(path, "rt") as archive:
+        assert len(archive.readlines()) == 12  # De 12h à minuit, sur plusieurs lots
+
+    ranges = archiver.list_ranges()
+    assert ranges["tx_history"]["days"] == 2
+    assert ranges["tx_history"]["first_date"] == day.isoformat()
+    assert ranges["audit_log"]["days"] == 1
+
+    rows = archiver.query(
+        "tx_history",
+        day,
+        day + timedelta(days=1),
+        {"channel_id": channel.id, "status": "SENT"},
+        limit=100,
+    )
+    assert len(rows) == 30
+    assert rows[0]["created_at"] == (NOW - timedelta(days=100)).isoformat()
+
+    # Rien de plus à archiver
+    assert archiver.archive(db_session, retention_days=90, now=NOW) == {
+        "tx_history": 0,
+        "audit_log": 0,
+    }
+
+
+def test_query_ignores_duplicates(db_session, tmp_path):
+    """Lot réécrit après un arrêt avant suppression : doublons ignorés."""
+    _seed(db_session)
+    archiver = HistoryArchiver(tmp_path)
+    archiver.archive(db_session, retention_days=90, now=NOW)
+
+    day = (NOW - timedelta(days=100)).date()
+    rows = archiver.query("tx_history", day, day, limit=1000)
+    archiver._append("tx_history", day, rows)
+
+    assert len(archiver.query("tx_history", day, day, limit=1000)) == len(rows)
+    assert archiver.query("tx_history", date(2020, 1, 1), date(2020, 1, 31)) == []
+
+
+def test_vacuum_returns_freed_pages(tmp_path):
+    """Base en auto_vacuum incrémental : les pages libérées sont rendues."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    channel = Channel(
+        name="Test", provider_id="ffvl", station_id="67", template_text="x"
+    )
+    db.add(channel)
+    db.flush()
+    old = NOW - timedelta(days=100)
+    db.add_all(_tx(channel.id, i, "SENT", old) for i in range(2000))
+    db.commit()
+
+    archiver = HistoryArchiver(tmp_path / "archive")
+    assert archiver.archive(db, retention_days=90, now=NOW)["tx_history"] == 2000
+    db.close()
+
+    assert archiver.vacuum(engine) > 0
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA freelist_count").scalar() == 0
+
+
+def test_status_aggregates_last_24h(db_session, monkeypatch):
+    """Statut : compteurs 24h calculés en SQL, par statut et par canal."""
+    monkeypatch.setattr("app.routers.status.check_runner_status", lambda: "stopped")
+    channel = _seed(db_session)
+    db_session.add(ChannelRuntime(channel_id=channel.id))
+    recent = datetime.utcnow() - timedelta(hours=1)
+    db_session.add(_tx(channel.id, 200, "SENT", recent))
+    db_session.add(_tx(channel.id, 201, "ABORTED", recent))
+    db_session.commit()
+
+    status = get_system_status(db=db_session)
+
+    assert status["tx_stats_24h"] == {
+        "total": 2,
+        "sent": 1,
+        "failed": 0,
+        "aborted": 1,
+        "pending": 0,
+    }
+    assert status["channels_stats"][0]["tx_count_24h"] == 2
+    assert status["recent_tx"][0]["channel_name"] == "Test"
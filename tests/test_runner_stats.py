@@ -0,0 +1,91 @@
+"""Tests des statistiques du runner publiées dans /api/status."""
+
+import time
+
+import pytest
+
+from app.ptt.controller import GpiodPTTController, MockGpioChip, MockPTTController
+from app.routers.status import get_system_status
+from app.runner import VHFRunner
+from app.services.arbiter import RadioArbiter, RadioLine
+from app.services.transmission import TransmissionService
+from app.services.tx_lock import TransmitLock
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    """Runner avec une radio par défaut, verrou et instantané sous tmp_path."""
+    monkeypatch.setattr(
+        "app.services.runner_stats.stats_path", lambda: tmp_path / "stats.json"
+    )
+    monkeypatch.setattr("app.routers.status.check_runner_status", lambda: "running")
+
+    runner = VHFRunner()
+    runner.arbiter = RadioArbiter(
+        RadioLine(
+            name="default",
+            transmission=TransmissionService(
+                MockPTTController(), tx_lock=TransmitLock(lock_dir=tmp_path)
+            ),
+        )
+    )
+    return runner
+
+
+def test_status_without_runner_stats(db_session, runner):
+    """Runner jamais lancé : pas d'instantané, pas d'erreur."""
+    assert get_system_status(db=db_session)["runner_stats"] is None
+
+
+@pytest.mark.asyncio
+async def test_status_exposes_tx_lock_stats(db_session, runner):
+    """Attente du verrou TX publiée par le runner et relue par /api/status."""
+    lock = runner.arbiter.default.transmission._tx_lock
+    await lock.acquire(timeout=1)
+    lock.release()
+
+    runner._publish_radio_stats()
+    stats = get_system_status(db=db_session)["runner_stats"]
+
+    assert stats["updated_at"].endswith("Z")
+    assert stats["radios"]["default"]["tx_lock"]["acquisitions"] == 1
+    assert stats["radios"]["default"]["tx_lock"]["timeouts"] == 0
+
+
+def test_status_exposes_watchdog_stats(db_session, runner):
+    """Coupure forcée par le watchdog visible dans /api/status."""
+    transmission = runner.arbiter.default.transmission
+    transmission.ptt.set_ptt(True)
+    transmission.watchdog.arm(0.05)
+    time.sleep(0.3)
+
+    runner._publish_radio_stats()
+    watchdog = get_system_status(db=db_session)["runner_stats"]["radios"]["default"][
+        "watchdog"
+    ]
+
+    assert watchdog["trips"] == 1
+    assert watchdog["max_latency_ms"] >= watchdog["last_latency_ms"] >= 0
+    transmission.close()
+
+
+def test_status_exposes_gpio_edge_stats(db_session, runner, tmp_path):
+    """Radio sur libgpiod : fronts PTT publiés ; absents pour les autres."""
+    ptt = GpiodPTTController(pin=17, chip=MockGpioChip())
+    runner.arbiter.add(
+        RadioLine(
+            name="club",
+            frequency_mhz=143.9875,
+            transmission=TransmissionService(
+                ptt, tx_lock=TransmitLock("club", lock_dir=tmp_path)
+            ),
+        )
+    )
+    ptt.set_ptt(True)
+    ptt.set_ptt(False)
+
+    runner._publish_radio_stats()
+    radios = get_system_status(db=db_session)["runner_stats"]["radios"]
+
+    assert radios["club"]["ptt_edges"]["key_ups"] == 1
+    assert "ptt_edges" not in radios["default"]
@@ -0,0 +1,156 @@
+"""Tests pour l'ordonnanceur des TX PENDING (tas d'échéances)."""
+
+import asyncio
+import time
+import pytest
+from datetime import datetime, timedelta
+
+from app.models import Channel, TxHistory
+from app.services.scheduler import TxScheduler
+
+
+def test_pop_due_chronological_order():
+    """Les TX dues sortent dans l'ordre de planned_at."""
+    scheduler = TxScheduler()
+    now = datetime(2025, 1, 1, 12, 0, 0)
+
+    scheduler.schedule("c", 1, now - timedelta(seconds=10))
+    scheduler.schedule("a", 1, now - timedelta(seconds=30))
+    scheduler.schedule("b", 2, now - timedelta(seconds=20))
+    scheduler.schedule("future", 1, now + timedelta(seconds=60))
+
+    due = scheduler.pop_due(now)
+
+    assert [entry.tx_id for entry in due] == ["a", "b", "c"]
+    assert len(scheduler) == 1
+    assert scheduler.next_deadline() == now + timedelta(seconds=60)
+
+
+def test_cancel_channel():
+    """L'annulation d'un canal retire uniquement ses TX."""
+    scheduler = TxScheduler()
+    now = datetime(2025, 1, 1, 12, 0, 0)
+
+    scheduler.schedule("a", 1, now)
+    scheduler.schedule("b", 1, now + timedelta(seconds=600))
+    scheduler.schedule("c", 2, now + timedelta(seconds=300))
+
+    assert sorted(scheduler.cancel_channel(1)) == ["a", "b"]
+    assert "a" not in scheduler
+    assert scheduler.next_deadline() == now + timedelta(seconds=300)
+    assert scheduler.pop_due(now + timedelta(hours=1))[0].tx_id == "c"
+
+
+def test_reschedule_replaces_entry():
+    """Replanifier une TX ne crée pas de doublon."""
+    scheduler = TxScheduler()
+    now = datetime(2025, 1, 1, 12, 0, 0)
+
+    scheduler.schedule("a", 1, now + timedelta(seconds=60))
+    scheduler.schedule("a", 1, now)
+
+    due = scheduler.pop_due(now + timedelta(seconds=120))
+    assert [entry.tx_id for entry in due] == ["a"]
+
+
+def test_next_for_channel_index():
+    """L'index par canal suit les TX PENDING, y compris celles en cours."""
+    scheduler = TxScheduler()
+    now = datetime(2025, 1, 1, 12, 0, 0)
+
+    scheduler.schedule("a", 1, now)
+    scheduler.schedule("b", 1, now + timedelta(seconds=600))
+    scheduler.schedule("c", 2, now + timedelta(seconds=300))
+    assert scheduler.next_for_channel(1) == now
+
+    # Extraite du tas mais pas encore exécutée : toujours PENDING
+    scheduler.pop_due(now)
+    assert scheduler.next_for_channel(1) == now
+
+    scheduler.resolve("a", 1)
+    assert scheduler.next_for_channel(1) == now + timedelta(seconds=600)
+
+    scheduler.cancel("b")
+    assert scheduler.next_for_channel(1) is None
+    assert scheduler.next_for_channel(2) == now + timedelta(seconds=300)
+
+    scheduler.cancel_channel(2)
+    assert scheduler.next_for_channel(2) is None
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_on_deadline():
+    """wait() se réveille à la prochaine échéance, pas avant."""
+    scheduler = TxScheduler()
+    scheduler.schedule("a", 1, datetime.utcnow() + timedelta(milliseconds=100))
+    await scheduler.wait()  # Consomme la notification de schedule()
+
+    start = time.monotonic()
+    woken_by_notify = await scheduler.wait()
+    elapsed = time.monotonic() - start
+
+    assert woken_by_notify is False
+    assert 0.05 <= elapsed < 1.0
+    assert [entry.tx_id for entry in scheduler.pop_due()] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_on_notify():
+    """Une nouvelle TX réveille immédiatement la boucle en attente."""
+    scheduler = TxScheduler()
+
+    async def add_later():
+        await asyncio.sleep(0.05)
+        scheduler.schedule("a", 1, datetime.utcnow())
+
+    task = asyncio.create_task(add_later())
+    start = time.monotonic()
+    woken_by_notify = await scheduler.wait(
+        until=datetime.utcnow() + timedelta(seconds=10)
+    )
+    await task
+
+    assert woken_by_notify is True
+    assert time.monotonic() - start < 1.0
+
+
+def test_load_pending(db_session):
+    """Le tas est reconstruit à partir des seules TX PENDING."""
+    channel = Channel(
+        name="Test",
+        provider_id="ffvl",
+        station_id="67",
+        template_text="{wind_avg_kmh}",
+    )
+    db_session.add(channel)
+    db_session.commit()
+
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    for tx_id, status, offset in [
+        ("p1", "PENDING", 600),
+        ("p2", "PENDING", 0),
+        ("s1", "SENT", 0),
+    ]:
+        db_session.add(
+            TxHistory(
+                tx_id=tx_id,
+                channel_id=channel.id,
+                mode="SCHEDULED",
+                status=status,
+                station_id="67",
+                measurement_at=now,
+                offset_seconds=offset,
+                planned_at=now + timedelta(seconds=offset),
+                rendered_text="test",
+            )
+        )
+    db_session.commit()
+
+    scheduler = TxScheduler()
+    scheduler.schedule("stale", 1, now)
+
+    assert scheduler.load_pending(db_session) == 2
+    assert "stale" not in scheduler
+    assert scheduler.next_deadline() == now
+    due = scheduler.pop_due(now + timedelta(hours=1))
+    assert [entry.tx_id for entry in due] == ["p2", "p1"]
@@ -1,7 +1,7 @@
 """Tests pour le calcul de planning et offsets."""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 
 def test_offset_calculation():
@@ -40,3 +40,66 @@ def test_offset_multiple():
     for i in range(1, len(tx_times)):
         delta = (tx_times[i] - tx_times[i - 1]).total_seconds()
         assert delta == 600  # 10 minutes
+
+
+def test_schedule_transmissions_batched(db_session, monkeypatch):
+    """Une mesure, 12 offsets : rendu unique et nombre de requêtes constant."""
+    import app.runner
+    from sqlalchemy import event
+    from app.models import Channel, ChannelRuntime, TxHistory
+    from app.providers import Measurement
+
+    channel = Channel(
+        name="Test",
+        provider_id="ffvl",
+        station_id="67",
+        template_text="Vent {wind_avg_kmh}",
+        offsets_seconds_json=str([i * 300 for i in range(12)]),
+    )
+    channel.runtime = ChannelRuntime()
+    db_session.add(channel)
+    db_session.commit()
+
+    runner = app.runner.VHFRunner()
+    started = []
+    monkeypatch.setattr(runner, "_start_synthesis", lambda *a: started.append(a))
+
+    renders = []
+    real_render = app.runner.prepare_announcement_text
+
+    def counting_render(*args):
+        renders.append(args)
+        return real_render(*args)
+
+    monkeypatch.setattr(app.runner, "prepare_announcement_text", counting_render)
+
+    assert channel.runtime is not None  # Runtime chargé, comme dans le runner
+    statements = []
+    event.listen(
+        db_session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    measurement = Measurement(
+        measurement_at=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        wind_avg_kmh=10,
+        wind_max_kmh=20,
+    )
+    plan = runner._schedule_transmissions(db_session, channel, measurement)
+
+    # UPDATE (annulation), SELECT IN, INSERT groupé, UPDATE runtime ; pas de commit
+    assert len(statements) == 4
+    assert len(renders) == 1
+    assert db_session.query(TxHistory).filter_by(status="PENDING").count() == 12
+    assert channel.runtime.next_tx_at == datetime(2025, 1, 1, 12, 0, 0)
+    assert not started  # Planification en mémoire après le commit seulement
+
+    db_session.commit()
+    runner._apply_schedule(*plan)
+    assert len(runner.scheduler) == 12
+    assert len(started) == 1 and len(started[0][1]) == 12
+
+    # Même mesure rejouée (idempotence) : rien n'est recréé
+    runner._schedule_transmissions(db_session, channel, measurement)
+    assert db_session.query(TxHistory).count() == 12
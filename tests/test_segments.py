@@ -0,0 +1,88 @@
+"""Tests de la synthèse concaténative par segments."""
+
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+
+import pytest
+
+from app.exceptions import TTSError
+from app.services.template import TemplateRenderer
+from app.tts.segments import SegmentSynthesizer, crossfade_join, trim_silence
+
+TEMPLATE = (
+    "{station_name}, vent moyen {wind_avg_kmh} kilomètres heure, "
+    "rafales {wind_max_kmh}. Direction {wind_direction_name}."
+)
+
+
+def test_split_segments():
+    """Le texte rendu est découpé en texte fixe et valeurs."""
+    renderer = TemplateRenderer()
+    text = renderer.render(TEMPLATE, "Col du Lautaret", 12.4, 20, None, 45)
+
+    assert renderer.split_segments(TEMPLATE, text) == [
+        "Col du Lautaret",
+        "vent moyen",
+        "12",
+        "kilomètres heure, rafales",
+        "20",
+        "Direction",
+        "Nord-Este",
+    ]
+    assert renderer.split_segments(TEMPLATE, "Autre texte") is None
+
+
+def test_trim_and_crossfade():
+    """Découpe des silences de bord puis fondu enchaîné."""
+    samples = array("h", [0] * 50 + [1000] * 10 + [0] * 50)
+    assert len(trim_silence(samples, padding=5)) == 20
+    assert len(trim_silence(array("h", [0] * 10), padding=5)) == 0
+
+    joined = crossfade_join([array("h", [1000] * 10), array("h", [0] * 10)], 4)
+    assert len(joined) == 16
+    assert joined[5] == 1000
+    assert 0 < joined[7] < 1000
+
+
+def test_segments_synthesized_once(fake_engine, tmp_path):
+    """Les segments déjà vus ne repassent pas par le moteur."""
+    engine = fake_engine
+    synth = SegmentSynthesizer(engine, cache_dir=tmp_path / "segments")
+
+    synth.synthesize(["Station", "vent", "12"], "voix", str(tmp_path / "a.wav"))
+    synth.synthesize(["Station", "vent", "15"], "voix", str(tmp_path / "b.wav"))
+
+    assert engine.calls == ["Station", "vent", "12", "15"]
+    assert (synth.hits, synth.misses) == (2, 4)
+
+    with wave.open(str(tmp_path / "a.wav"), "rb") as wav:
+        assert wav.getframerate() == 16000
+        # 3 segments (tons + 2 x 40 ms de marge) moins 2 fondus de 15 ms
+        expected = (70 + 40 + 20) + 3 * 2 * 640 - 2 * 240
+        assert wav.getnframes() == expected
+
+
+def test_segment_format_mismatch(fake_engine, tmp_path):
+    """Des segments de fréquences différentes ne sont pas assemblés."""
+    engine = fake_engine
+    synth = SegmentSynthesizer(engine, cache_dir=tmp_path)
+    synth.synthesize(["un"], "voix", str(tmp_path / "a.wav"))
+
+    engine.rate = 22050
+    with pytest.raises(TTSError):
+        synth.synthesize(["un", "deux"], "voix", str(tmp_path / "b.wav"))
+
+
+def test_parallel_synthesis_same_segment(fake_engine, tmp_path):
+    """Deux threads sur le même segment : fichiers temporaires distincts."""
+    fake_engine.delay = 0.05
+    synth = SegmentSynthesizer(fake_engine, cache_dir=tmp_path / "segments")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        paths = list(
+            pool.map(lambda _: synth._get_segment("Station", "voix", {}), range(4))
+        )
+
+    assert len(set(paths)) == 1 and paths[0].exists()
+    assert list((tmp_path / "segments").glob("*.tmp")) == []
@@ -0,0 +1,217 @@
+"""Tests du cache audio TTS et de son utilisation par le runner."""
+
+import os
+import pytest
+from datetime import datetime
+
+from app.models import AudioCache, Channel, TxHistory
+from app.runner import VHFRunner
+from app.tts.cache import TTSCacheService
+from app.tts.segments import SegmentSynthesizer
+
+
+def test_cache_hit_miss_counters(db_session, tmp_path):
+    """Un miss puis un hit, comptés en mémoire et en base."""
+    cache = TTSCacheService(cache_dir=tmp_path)
+    key = cache.compute_cache_key("piper", "1", "v1", "voix", {}, "fr", "Bonjour")
+
+    assert cache.get_cached_audio(db_session, key) is None
+
+    path = cache.generate_audio_filename(key)
+    path.write_bytes(b"RIFF")
+    cache.store_audio(db_session, key, str(path), meta={"voice_id": "voix"})
+
+    assert cache.get_cached_audio(db_session, key) == str(path)
+    assert cache.get_cached_audio(db_session, key) == str(path)
+
+    stats = cache.get_stats(db_session)
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+    assert stats["total_size_bytes"] == 4
+    assert stats["total_hits"] == 2
+    assert stats["total_misses"] == 1
+
+
+def test_persistent_counters_survive_gc(db_session, tmp_path):
+    """Entrée évincée puis resynthétisée : un miss de plus, hits conservés."""
+    cache = TTSCacheService(cache_dir=tmp_path)
+    key = cache.compute_cache_key("piper", "1", "v1", "voix", {}, "fr", "Bonjour")
+    for _ in range(2):
+        assert cache.get_cached_audio(db_session, key) is None
+        path = cache.generate_audio_filename(key)
+        path.write_bytes(b"RIFF")
+        cache.store_audio(db_session, key, str(path), meta={})
+        assert cache.get_cached_audio(db_session, key) == str(path)
+        cache.collect_garbage(db_session, max_bytes=0)
+
+    # Autre processus (ex: le web) : compteurs lus en base
+    stats = TTSCacheService(cache_dir=tmp_path).get_stats(db_session)
+    assert stats["entries"] == 0
+    assert (stats["total_hits"], stats["total_misses"]) == (2, 2)
+
+
+def test_store_same_key_twice(db_session, tmp_path):
+    """Clé déjà indexée (synthèse concurrente) : entrée réutilisée, pas d'erreur."""
+    cache = TTSCacheService(cache_dir=tmp_path)
+    key = cache.compute_cache_key("piper", "1", "v1", "voix", {}, "fr", "Bonjour")
+    path = cache.generate_audio_filename(key)
+    path.write_bytes(b"RIFF")
+    cache.store_audio(db_session, key, str(path), meta={"voice_id": "voix"})
+    first = db_session.query(AudioCache).one()
+    first_id, first_used_at = first.id, first.last_used_at
+
+    path.write_bytes(b"RIFFWAVE")
+    cache.store_audio(db_session, key, str(path), meta={"voice_id": "voix"})
+
+    db_session.expire_all()
+    entry = db_session.query(AudioCache).one()
+    assert entry.id == first_id
+    assert entry.last_used_at >= first_used_at
+    assert entry.size_bytes == 8
+
+
+def _make_tx(db, channel, tx_id, text):
+    tx = TxHistory(
+        tx_id=tx_id,
+        channel_id=channel.id,
+        mode="SCHEDULED",
+        status="PENDING",
+        station_id=channel.station_id,
+        measurement_at=datetime(2025, 1, 1, 12, 0, 0),
+        offset_seconds=0,
+        planned_at=datetime(2025, 1, 1, 12, 0, 0),
+        rendered_text=text,
+    )
+    db.add(tx)
+    db.commit()
+    return tx
+
+
+@pytest.mark.asyncio
+async def test_runner_shares_audio_between_identical_tx(
+    runner_db, fake_engine, tmp_path
+):
+    """Deux TX au texte identique partagent un seul fichier synthétisé."""
+    runner = VHFRunner()
+    runner.tts_engine = fake_engine
+    runner.tts_cache = TTSCacheService(cache_dir=tmp_path / "cache")
+
+    with runner_db() as db:
+        channel = Channel(
+            name="Test",
+            provider_id="ffvl",
+            station_id="67",
+            template_text="{wind_avg_kmh}",
+            voice_id="fr_FR-siwis-medium",
+        )
+        db.add(channel)
+        db.commit()
+
+        tx1 = _make_tx(db, channel, "a" * 64, "Vent 12 km/h")
+        tx2 = _make_tx(db, channel, "b" * 64, "Vent 12 km/h")
+        tx3 = _make_tx(db, channel, "c" * 64, "Vent 15 km/h")
+
+        path1 = await runner._obtain_audio(channel, tx1, {})
+        path2 = await runner._obtain_audio(channel, tx2, {})
+        path3 = await runner._obtain_audio(channel, tx3, {})
+
+        assert db.query(AudioCache).count() == 2
+
+    assert path1 == path2
+    assert path3 != path1
+    assert runner.tts_engine.calls == ["Vent 12 km/h", "Vent 15 km/h"]
+    # Synthèse renommée atomiquement, aucun fichier temporaire laissé
+    cache_files = (tmp_path / "cache").iterdir()
+    assert sorted(p.suffix for p in cache_files) == [".wav", ".wav"]
+    assert runner.tts_cache.get_stats() == {
+        "hits": 1,
+        "misses": 2,
+        "hit_ratio": 0.333,
+    }
+
+
+def _cached_file(db, cache, name, size, last_used_at):
+    key = name * 64
+    path = cache.generate_audio_filename(key)
+    path.write_bytes(b"\x00" * size)
+    cache.store_audio(db, key, str(path), meta={})
+    entry = db.query(AudioCache).filter_by(tts_cache_key=key).one()
+    entry.last_used_at = last_used_at
+    db.commit()
+    return path
+
+
+def test_gc_evicts_lru_over_quota(db_session, tmp_path):
+    """Au-delà du quota, les fichiers les moins récemment utilisés partent."""
+    cache = TTSCacheService(cache_dir=tmp_path)
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    old = _cached_file(db_session, cache, "a", 100, datetime(2025, 6, 1, 9, 0))
+    mid = _cached_file(db_session, cache, "b", 100, datetime(2025, 6, 1, 10, 0))
+    new = _cached_file(db_session, cache, "c", 100, datetime(2025, 6, 1, 11, 0))
+
+    result = cache.collect_garbage(db_session, max_bytes=150, now=now)
+
+    assert result == {
+        "files_deleted": 2,
+        "bytes_reclaimed": 200,
+        "bytes_remaining": 100,
+    }
+    assert not old.exists() and not mid.exists() and new.exists()
+    assert db_session.query(AudioCache).count() == 1
+
+
+def test_gc_max_age_and_pending_protection(db_session, tmp_path):
+    """Les fichiers trop vieux partent, sauf ceux d'une TX PENDING."""
+    cache = TTSCacheService(cache_dir=tmp_path)
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    stale = _cached_file(db_session, cache, "a", 100, datetime(2025, 1, 1))
+    pending = _cached_file(db_session, cache, "b", 100, datetime(2025, 1, 1))
+    recent = _cached_file(db_session, cache, "c", 100, datetime(2025, 5, 31))
+
+    channel = Channel(
+        name="Test", provider_id="ffvl", station_id="67", template_text="x"
+    )
+    db_session.add(channel)
+    db_session.commit()
+    tx = _make_tx(db_session, channel, "d" * 64, "x")
+    tx.audio_path = str(pending)
+    db_session.commit()
+
+    result = cache.collect_garbage(db_session, max_age_days=30, now=now)
+
+    assert result["files_deleted"] == 1
+    assert not stale.exists() and pending.exists() and recent.exists()
+
+
+def test_gc_untracked_files(db_session, tmp_path):
+    """Les fichiers hors index (previews) sont évincés selon leur mtime."""
+    cache = TTSCacheService(cache_dir=tmp_path)
+    preview = tmp_path / "preview_abc.wav"
+    preview.write_bytes(b"\x00" * 50)
+    fresh = tmp_path / "preview_def.wav"
+    fresh.write_bytes(b"\x00" * 50)
+    old_mtime = datetime(2025, 1, 1).timestamp()
+    os.utime(preview, (old_mtime, old_mtime))
+
+    result = cache.collect_garbage(db_session, max_bytes=0, max_age_days=30)
+
+    # Le fichier récent est dans son délai de grâce (écriture en cours ?)
+    assert result["bytes_reclaimed"] == 50
+    assert not preview.exists() and fresh.exists()
+
+
+def test_gc_segments(db_session, tmp_path, fake_engine):
+    """Les segments inutilisés depuis max_age_days sont évincés."""
+    cache = TTSCacheService(cache_dir=tmp_path)
+    synth = SegmentSynthesizer(fake_engine, cache_dir=tmp_path / "segments")
+    old = synth._get_segment("vieux", "voix", {})
+    used = synth._get_segment("utilisé", "voix", {})
+    old_mtime = datetime(2025, 1, 1).timestamp()
+    for path in (old, used):
+        os.utime(path, (old_mtime, old_mtime))
+    synth._get_segment("utilisé", "voix", {})  # Hit : rafraîchit le mtime
+
+    cache.collect_garbage(db_session, max_age_days=30)
+
+    assert not old.exists() and used.exists()
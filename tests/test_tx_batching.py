@@ -0,0 +1,144 @@
+"""Tests du mode groupé (plusieurs annonces sous un seul passage en émission)."""
+
+import wave
+from datetime import datetime
+
+import pytest
+
+from app.models import Channel, ChannelRuntime, SystemSettings, TxHistory
+from app.providers import Measurement
+from app.ptt.controller import MockPTTController
+from app.runner import VHFRunner
+from app.services.arbiter import RadioLine
+from app.services.transmission import TransmissionService
+from app.services.tx_lock import TransmitLock
+
+
+class RecordingTransmission(TransmissionService):
+    """Service de transmission qui enregistre les émissions sans jouer l'audio."""
+
+    def __init__(self, lock_dir):
+        super().__init__(MockPTTController(), tx_lock=TransmitLock(lock_dir=lock_dir))
+        self.sequences = []
+
+    async def transmit_sequence(self, audio_paths, gap_ms=0, **kwargs):
+        self.sequences.append((list(audio_paths), gap_ms))
+
+
+def _wav(path, seconds):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(1000)
+        wav.writeframes(b"\x00\x00" * int(1000 * seconds))
+    return str(path)
+
+
+@pytest.fixture
+def runner(runner_db, tmp_path, monkeypatch):
+    """Runner avec 3 canaux ayant chacun une TX due et son audio prêt."""
+    monkeypatch.setattr(
+        "app.runner.provider_manager.get_provider", lambda provider_id: object()
+    )
+
+    runner = VHFRunner()
+    now = datetime.utcnow()
+    with runner_db() as db:
+        for i in range(3):
+            channel = Channel(
+                name=f"Canal {i}",
+                provider_id="ffvl",
+                station_id=str(i),
+                template_text="x",
+                measurement_period_seconds=3600,
+            )
+            db.add(channel)
+            db.flush()
+            db.add(ChannelRuntime(channel_id=channel.id))
+            db.add(
+                TxHistory(
+                    tx_id=str(i) * 64,
+                    channel_id=channel.id,
+                    mode="SCHEDULED",
+                    status="PENDING",
+                    station_id=str(i),
+                    measurement_at=now,
+                    offset_seconds=0,
+                    planned_at=datetime(2025, 1, 1, 12, 0, i),
+                    rendered_text=f"Annonce {i}",
+                    audio_path=_wav(tmp_path / f"{i}.wav", seconds=4),
+                )
+            )
+            runner.measurements.put(
+                "ffvl",
+                str(i),
+                Measurement(measurement_at=now, wind_avg_kmh=10, wind_max_kmh=15),
+            )
+        db.commit()
+
+    runner.session = runner_db
+    return runner
+
+
+def _settings(timeout=30):
+    return SystemSettings(
+        inter_announcement_pause_seconds=0,
+        ptt_lead_ms=500,
+        ptt_tail_ms=500,
+        tx_timeout_seconds=timeout,
+    )
+
+
+def _statuses(runner):
+    with runner.session() as db:
+        return [tx.status for tx in db.query(TxHistory).order_by(TxHistory.planned_at)]
+
+
+@pytest.mark.asyncio
+async def test_batched_under_single_key_up(runner, monkeypatch, tmp_path):
+    """Les annonces dues ensemble partent en une seule émission."""
+    monkeypatch.setattr("app.runner.TX_BATCH_GAP_MS", 300)
+    radio = RadioLine(name="default", transmission=RecordingTransmission(tmp_path))
+
+    await runner._execute_radio_queue(
+        radio, [str(i) * 64 for i in range(3)], _settings()
+    )
+
+    assert len(radio.transmission.sequences) == 1
+    paths, gap_ms = radio.transmission.sequences[0]
+    assert [p.rsplit("/", 1)[-1] for p in paths] == ["0.wav", "1.wav", "2.wav"]
+    assert gap_ms == 300
+    assert _statuses(runner) == ["SENT"] * 3
+
+
+@pytest.mark.asyncio
+async def test_batch_split_to_fit_watchdog(runner, monkeypatch, tmp_path):
+    """Un groupe ne dépasse jamais tx_timeout_seconds (lead + audios + tail)."""
+    monkeypatch.setattr("app.runner.TX_BATCH_GAP_MS", 500)
+    radio = RadioLine(name="default", transmission=RecordingTransmission(tmp_path))
+
+    # 10 s : 1 s de lead/tail, 4 s + 0.5 s + 4 s tiennent, pas une 3e annonce
+    await runner._execute_radio_queue(
+        radio, [str(i) * 64 for i in range(3)], _settings(timeout=10)
+    )
+
+    assert [len(paths) for paths, _ in radio.transmission.sequences] == [2, 1]
+    assert _statuses(runner) == ["SENT"] * 3
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_marks_whole_group(runner, monkeypatch, tmp_path):
+    """Une émission groupée en échec passe toutes ses TX en FAILED."""
+    monkeypatch.setattr("app.runner.TX_BATCH_GAP_MS", 0)
+
+    class FailingTransmission(RecordingTransmission):
+        async def transmit_sequence(self, audio_paths, gap_ms=0, **kwargs):
+            raise RuntimeError("carte son absente")
+
+    radio = RadioLine(name="default", transmission=FailingTransmission(tmp_path))
+    await runner._execute_radio_queue(
+        radio, [str(i) * 64 for i in range(3)], _settings()
+    )
+
+    assert _statuses(runner) == ["FAILED"] * 3
+    assert runner.scheduler.next_for_channel(1) is None
@@ -0,0 +1,186 @@
+"""Tests du verrou d'émission (FIFO, timeout, inter-processus)."""
+
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+
+from app.exceptions import PTTError
+from app.ptt.controller import MockPTTController
+from app.services.transmission import TransmissionService
+from app.services.tx_lock import TransmitLock
+
+
+def _hold_lock(lock_dir, ready, release):
+    """Processus tiers : prend le verrou jusqu'au signal de libération."""
+
+    async def hold():
+        lock = TransmitLock("default", lock_dir=lock_dir)
+        await lock.acquire(timeout=5)
+        ready.set()
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+        lock.release()
+
+    asyncio.run(hold())
+
+
+@pytest.mark.asyncio
+async def test_fifo_order(tmp_path):
+    """Les demandeurs obtiennent le verrou dans leur ordre d'arrivée."""
+    holder = TransmitLock(lock_dir=tmp_path)
+    await holder.acquire(timeout=1)
+
+    order = []
+
+    async def waiter(i):
+        lock = TransmitLock(lock_dir=tmp_path)
+        await lock.acquire(timeout=5)
+        order.append(i)
+        await asyncio.sleep(0.01)
+        lock.release()
+
+    tasks = []
+    for i in range(5):
+        tasks.append(asyncio.create_task(waiter(i)))
+        await asyncio.sleep(0.005)
+
+    await asyncio.sleep(0.05)
+    holder.release()
+    await asyncio.gather(*tasks)
+
+    assert order == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_shared_instance_queues_coroutines(tmp_path):
+    """Coroutines sur la même instance : attente FIFO, jamais d'échec immédiat."""
+    lock = TransmitLock(lock_dir=tmp_path)
+    order = []
+    holders = []
+
+    async def waiter(i):
+        await lock.acquire(timeout=5)
+        holders.append(i)
+        assert len(holders) == 1  # Exclusion mutuelle
+        order.append(i)
+        await asyncio.sleep(0.05)
+        holders.remove(i)
+        lock.release()
+
+    tasks = []
+    for i in range(3):
+        tasks.append(asyncio.create_task(waiter(i)))
+        await asyncio.sleep(0.005)
+    await asyncio.gather(*tasks)
+
+    assert order == [0, 1, 2]
+    assert lock.get_stats()["acquisitions"] == 3
+    assert not lock.locked
+
+
+@pytest.mark.asyncio
+async def test_shared_transmission_service_queues(tmp_path):
+    """Émissions concurrentes sur un même TransmissionService : toutes passent."""
+    service = TransmissionService(
+        MockPTTController(), tx_lock=TransmitLock(lock_dir=tmp_path)
+    )
+    audio_path = tmp_path / "a.wav"
+    audio_path.write_bytes(b"RIFF")
+    played = []
+
+    async def play(audio):
+        played.append(audio)
+        await asyncio.sleep(0.05)
+
+    service._play_audio = play
+    try:
+        await asyncio.gather(
+            *(
+                service.transmit(
+                    str(audio_path), lead_ms=0, tail_ms=0, timeout_seconds=5
+                )
+                for _ in range(3)
+            )
+        )
+    finally:
+        service.close()
+
+    assert len(played) == 3
+    assert service.get_lock_stats()["acquisitions"] == 3
+
+
+@pytest.mark.asyncio
+async def test_wait_does_not_block_loop(tmp_path):
+    """L'attente laisse tourner les autres tâches (watchdog, polling)."""
+    holder = TransmitLock(lock_dir=tmp_path)
+    await holder.acquire(timeout=1)
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        for _ in range(10):
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    waiter = TransmitLock(lock_dir=tmp_path)
+    tick_task = asyncio.create_task(ticker())
+    with pytest.raises(PTTError):
+        await waiter.acquire(timeout=0.2)
+    await tick_task
+
+    assert ticks == 10
+    stats = waiter.get_stats()
+    assert stats["timeouts"] == 1
+    assert stats["acquisitions"] == 0
+
+    # Le ticket abandonné ne bloque pas les suivants
+    holder.release()
+    await waiter.acquire(timeout=0.5)
+    assert waiter.locked
+    waiter.release()
+
+
+@pytest.mark.asyncio
+async def test_cross_process_exclusion(tmp_path):
+    """Un autre processus qui émet bloque la TX jusqu'à sa libération."""
+    ctx = multiprocessing.get_context("fork")
+    ready, release = ctx.Event(), ctx.Event()
+    proc = ctx.Process(target=_hold_lock, args=(tmp_path, ready, release))
+    proc.start()
+    try:
+        assert await asyncio.to_thread(ready.wait, 5)
+
+        lock = TransmitLock(lock_dir=tmp_path)
+        with pytest.raises(PTTError):
+            await lock.acquire(timeout=0.1)
+
+        release.set()
+        waited = await lock.acquire(timeout=5)
+        assert waited >= 0
+        assert lock.get_stats()["acquisitions"] == 1
+        lock.release()
+    finally:
+        release.set()
+        proc.join(5)
+
+
+@pytest.mark.asyncio
+async def test_lock_released_when_process_dies(tmp_path):
+    """Le verrou d'un processus mort (crash) est libéré par le noyau."""
+    ctx = multiprocessing.get_context("fork")
+    ready, release = ctx.Event(), ctx.Event()
+    proc = ctx.Process(target=_hold_lock, args=(tmp_path, ready, release))
+    proc.start()
+    assert await asyncio.to_thread(ready.wait, 5)
+
+    proc.kill()
+    proc.join(5)
+
+    lock = TransmitLock(lock_dir=tmp_path)
+    start = time.monotonic()
+    await lock.acquire(timeout=2)
+    assert time.monotonic() - start < 1
+    lock.release()
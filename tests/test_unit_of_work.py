@@ -0,0 +1,122 @@
+"""Tests des unités de travail DB du runner (aucune session tenue pendant la TX)."""
+
+import sqlite3
+import wave
+from datetime import datetime
+
+import pytest
+
+from app.models import Channel, ChannelRuntime, SystemSettings, TxHistory
+from app.providers import Measurement
+from app.ptt.controller import MockPTTController
+from app.runner import VHFRunner
+from app.services.arbiter import RadioLine
+from app.services.db_metrics import UnitOfWorkMetrics
+from app.services.transmission import TransmissionService
+from app.services.tx_lock import TransmitLock
+
+
+@pytest.fixture
+def setup(runner_db, tmp_path, monkeypatch):
+    """Runner sur une base fichier, une TX due avec son audio prêt."""
+    db_path = tmp_path / "test.db"
+    monkeypatch.setattr(
+        "app.runner.provider_manager.get_provider", lambda provider_id: object()
+    )
+
+    audio_path = tmp_path / "a.wav"
+    with wave.open(str(audio_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(1000)
+        wav.writeframes(b"\x00\x00" * 100)
+
+    runner = VHFRunner()
+    now = datetime.utcnow()
+    with runner_db() as db:
+        channel = Channel(
+            name="Test",
+            provider_id="ffvl",
+            station_id="67",
+            template_text="x",
+            measurement_period_seconds=3600,
+        )
+        db.add(channel)
+        db.flush()
+        db.add(ChannelRuntime(channel_id=channel.id))
+        db.add(
+            TxHistory(
+                tx_id="a" * 64,
+                channel_id=channel.id,
+                mode="SCHEDULED",
+                status="PENDING",
+                station_id="67",
+                measurement_at=now,
+                offset_seconds=0,
+                planned_at=now,
+                rendered_text="Vent 12 km/h",
+                audio_path=str(audio_path),
+            )
+        )
+        db.commit()
+    runner.measurements.put(
+        "ffvl", "67", Measurement(measurement_at=now, wind_avg_kmh=12, wind_max_kmh=20)
+    )
+    return runner, db_path, runner_db
+
+
+@pytest.mark.asyncio
+async def test_no_write_lock_held_during_transmission(setup):
+    """Pendant l'émission, un autre processus peut écrire sans attendre."""
+    runner, db_path, session = setup
+    writes = []
+
+    class ProbeTransmission(TransmissionService):
+        async def transmit(self, audio_path, **kwargs):
+            # Autre écrivain (ex: application web), sans attente du verrou
+            conn = sqlite3.connect(db_path, timeout=0)
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("UPDATE channels SET name = 'Renommé'")
+                conn.commit()
+                writes.append("ok")
+            finally:
+                conn.close()
+
+    radio = RadioLine(
+        name="default",
+        transmission=ProbeTransmission(
+            MockPTTController(), tx_lock=TransmitLock(lock_dir=db_path.parent)
+        ),
+    )
+    settings = SystemSettings(
+        inter_announcement_pause_seconds=0,
+        ptt_lead_ms=0,
+        ptt_tail_ms=0,
+        tx_timeout_seconds=30,
+    )
+
+    await runner._execute_radio_queue(radio, ["a" * 64], settings)
+
+    assert writes == ["ok"]
+    with session() as db:
+        assert db.query(TxHistory).one().status == "SENT"
+        assert db.query(Channel).one().name == "Renommé"
+
+    stats = runner.db_metrics.get_stats()
+    assert stats["transition"]["count"] == 1
+    assert stats["transition"]["lock_errors"] == 0
+
+
+def test_metrics_count_slow_commits():
+    """Les commits lents (verrou attendu) sont comptés par type d'unité."""
+    metrics = UnitOfWorkMetrics()
+    metrics.record("transition", held_seconds=0.01, commit_seconds=0.002)
+    metrics.record("transition", held_seconds=0.5, commit_seconds=0.4)
+    metrics.record_lock_error("transition")
+
+    stats = metrics.get_stats()["transition"]
+    assert stats["count"] == 2
+    assert stats["slow_commits"] == 1
+    assert stats["max_commit_ms"] == 400.0
+    assert stats["lock_errors"] == 1